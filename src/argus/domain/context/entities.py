@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 
 from argus.domain.context.value_objects import DependencyGraph, Symbol
@@ -42,6 +43,10 @@ class CodebaseMap:
         """Add or replace a file entry."""
         self._entries[entry.path] = entry
 
+    def upsert_many(self, entries: Iterable[FileEntry]) -> None:
+        """Add or replace several file entries in one dict update."""
+        self._entries.update((entry.path, entry) for entry in entries)
+
     def get(self, path: FilePath) -> FileEntry:
         """Get a file entry by path.
 
@@ -65,6 +70,16 @@ class CodebaseMap:
         """All file paths in the map."""
         return set(self._entries.keys())
 
+    def iter_sorted(self) -> Iterator[FileEntry]:
+        """Entries in path order.
+
+        Entries are kept unordered so ``upsert`` stays O(1); the sort runs
+        only when a caller needs a stable order.
+        """
+        entries = self._entries
+        for path in sorted(entries):
+            yield entries[path]
+
     def __contains__(self, path: FilePath) -> bool:
         return path in self._entries
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -130,11 +131,28 @@ class EmbeddingIndex:
     chunk_ids: tuple[str, ...]  # "file:symbol_name"
     dimension: int
     model: str
+    content_hashes: tuple[str, ...] = ()
+    """``chunk_content_hash`` of each embedded text, aligned with ``chunk_ids``.
+
+    Empty for indices written before hashes were recorded.
+    """
+
+
+def chunk_content_hash(content: str) -> str:
+    """Hash of the text embedded for a chunk, used to reuse its vector."""
+    return hashlib.sha256(content.encode("utf-8", errors="replace")).hexdigest()[:16]
 
 
 def shard_id_for(path: FilePath) -> ShardId:
     """Derive the shard ID for a file from its parent directory."""
-    return ShardId(str(PurePosixPath(path).parent))
+    head, sep, _ = path.rpartition("/")
+    return _shard_id_for_dir(head or sep)
+
+
+@functools.lru_cache(maxsize=4096)
+def _shard_id_for_dir(directory: str) -> ShardId:
+    # Many files share a directory, so normalize each directory only once.
+    return ShardId(str(PurePosixPath(directory)))
 
 
 @dataclass(frozen=True)
@@ -40,6 +40,8 @@ class FileOutlineEntry:
 
     path: FilePath
     symbols: tuple[str, ...]
+    signatures: tuple[str, ...] = ()
+    """Rendered per-symbol outline lines, as the pattern analyzer saw them."""
 
 
 @dataclass(frozen=True)
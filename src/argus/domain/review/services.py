@@ -19,6 +19,12 @@ class NoiseFilter:
     confidence_threshold: float
     ignored_paths: list[FilePath] = field(default_factory=list[FilePath])
 
+    _ignored_prefixes: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # str.startswith scans a tuple of prefixes in C, once per path.
+        self._ignored_prefixes = tuple(str(p) for p in self.ignored_paths)
+
     def filter(
         self,
         comments: tuple[ReviewComment, ...] | list[ReviewComment],
@@ -39,4 +45,4 @@ class NoiseFilter:
         ]
 
     def _is_ignored(self, path: FilePath) -> bool:
-        return any(str(path).startswith(str(ignored)) for ignored in self.ignored_paths)
+        return str(path).startswith(self._ignored_prefixes)
@@ -171,6 +171,7 @@ class GitHubAPI(StrEnum):
     """GitHub REST API constants."""
 
     BASE_URL = "https://api.github.com"
+    GRAPHQL_PATH = "/graphql"
     ACCEPT_JSON = "application/vnd.github.v3+json"
     ACCEPT_DIFF = "application/vnd.github.v3.diff"
     PROVIDER_NAME = "github"
@@ -202,3 +203,37 @@ CHARS_PER_TOKEN = 4
 
 MODULE_CHUNK_NAME = "<module>"
 """Default chunk name when a file has no symbols."""
+
+GRAPHQL_BLOB_BATCH_SIZE = 100
+"""Blobs requested per GraphQL query when fetching file contents in bulk."""
+
+TREE_DIFF_MAX_FILES = 10_000
+"""Most changed files a GraphQL tree diff collects before the REST compare is used."""
+
+# =============================================================================
+# LOCAL CACHES
+# =============================================================================
+
+CACHE_DIRNAME = ".cache"
+"""Subdirectory of ``storage_dir`` for local caches (never pushed to the branch)."""
+
+CACHE_DB_SUFFIX = ".sqlite3"
+"""Suffix of each local cache's SQLite database, named after its table."""
+
+PARSE_CACHE_MAX_ENTRIES = 100_000
+"""Parsed entries kept in the local parse cache; older ones are evicted."""
+
+BLOB_CACHE_MAX_ENTRIES = 20_000
+"""File contents kept in the local blob cache; older ones are evicted."""
+
+CHUNK_CACHE_MAX_ENTRIES = 20_000
+"""Per-file chunk lists kept in the local chunk cache; older ones are evicted."""
+
+ARTIFACT_CACHE_MAX_ENTRIES = 2_000
+"""Data-branch artifact blobs kept in the local cache; older ones are evicted."""
+
+REVIEW_CACHE_MAX_ENTRIES = 1_000
+"""LLM review responses kept in the local cache; older ones are evicted."""
+
+JOURNAL_DB_FILENAME = "bootstrap-journal.sqlite3"
+"""SQLite journal of entries parsed by an in-progress bootstrap."""
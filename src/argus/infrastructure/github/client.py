@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import re
+import tarfile
+import threading
 import time
 import typing
 import urllib.parse
 
-from dataclasses import dataclass
+from collections.abc import Buffer, Callable, Collection, Iterator, Sequence
+from dataclasses import dataclass, field
+from types import TracebackType
 from typing import cast
 
 import httpx
 
-from argus.infrastructure.constants import GitHubAPI
+from argus.infrastructure.constants import (
+    GRAPHQL_BLOB_BATCH_SIZE,
+    TREE_DIFF_MAX_FILES,
+    GitHubAPI,
+)
 from argus.shared.constants import DEFAULT_TIMEOUT_SECONDS
 from argus.shared.exceptions import PublishError
 from argus.shared.types import FilePath
@@ -22,8 +31,25 @@ logger = logging.getLogger(__name__)
 
 _LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
 _RATE_LIMIT_STATUS = 429
+_NOT_FOUND_STATUS = 404
 _MAX_RATE_LIMIT_RETRIES = 3
 _DEFAULT_RETRY_AFTER = 60
+_MAX_CONNECTIONS = 32
+_BLOB_FIELDS = "... on Blob { text isBinary isTruncated }"
+_TREE_FIELDS = "... on Tree { entries { name type oid } }"
+
+
+def _tree_entries(tree: dict[str, object] | None) -> dict[str, tuple[str, str]]:
+    """Map each entry name of a GraphQL tree object to its ``(type, oid)``."""
+    entries = tree.get("entries") if tree is not None else None
+    if not isinstance(entries, list):
+        return {}
+    result: dict[str, tuple[str, str]] = {}
+    for entry in cast(list[dict[str, object]], entries):
+        name, kind, oid = entry.get("name"), entry.get("type"), entry.get("oid")
+        if isinstance(name, str) and isinstance(kind, str) and isinstance(oid, str):
+            result[name] = (kind, oid)
+    return result
 
 
 def _next_page_url(response: httpx.Response) -> str | None:
@@ -33,6 +59,29 @@ def _next_page_url(response: httpx.Response) -> str | None:
     return match.group(1) if match else None
 
 
+class _ByteStreamReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+        size = min(len(view), len(self._buffer))
+        view[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
 # =============================================================================
 # CLIENT
 # =============================================================================
@@ -42,11 +91,21 @@ _STATUS_OK_MAX = 299
 
 @dataclass
 class GitHubClient:
-    """Thin wrapper around the GitHub REST API."""
+    """Thin wrapper around the GitHub REST API.
+
+    All requests share one pooled ``httpx.Client`` (created lazily), so
+    connections and TLS sessions are reused across calls and threads, and
+    HTTP/2 multiplexes concurrent requests over one connection.
+    """
 
     token: str
     repo: str
 
+    _http: httpx.Client | None = field(default=None, init=False, repr=False)
+    _http_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
     def get_pull_request(self, pr_number: int) -> dict[str, object]:
         """Fetch PR metadata.
 
@@ -73,14 +132,28 @@ class GitHubClient:
         Raises:
             PublishError: If the API call fails.
         """
-        encoded_path = urllib.parse.quote(str(path), safe="/")
-        base = f"{GitHubAPI.BASE_URL}/repos/{self.repo}/contents"
-        url = f"{base}/{encoded_path}?ref={ref}"
-        headers = self._headers()
-        headers["accept"] = "application/vnd.github.v3.raw"
+        url, headers = self._raw_content_request(path, ref)
         response = self._request(url, headers)
         return response.text
 
+    def find_file_content(self, path: FilePath, ref: str) -> str | None:
+        """Fetch raw file content at a specific ref, if the file exists.
+
+        Returns:
+            The content, or None if the file (or *ref*) does not exist.
+
+        Raises:
+            PublishError: If the API call fails for any other reason.
+        """
+        url, headers = self._raw_content_request(path, ref)
+        response = self._do_with_retry(
+            lambda c: c.get(url, headers=headers),
+            allowed_status=_NOT_FOUND_STATUS,
+        )
+        if response.status_code == _NOT_FOUND_STATUS:
+            return None
+        return response.text
+
     def post_issue_comment(self, pr_number: int, body: str) -> None:
         """Post a comment on a PR (as issue comment).
 
@@ -162,17 +235,99 @@ class GitHubClient:
         Raises:
             PublishError: If the API call fails.
         """
+        return list(self.compare_commit_blobs(base, head))
+
+    def compare_commit_blobs(self, base: str, head: str) -> dict[str, str | None]:
+        """Map each file changed between two commits to its blob SHA at *head*.
+
+        The trees of both commits are diffed through GraphQL first (see
+        ``diff_commit_trees``).  The REST comparison is used when that diff
+        is too large or fails; it lists at most 300 files.
+
+        Returns:
+            Mapping of changed path to blob SHA, or ``None`` for files removed
+            at *head*.
+
+        Raises:
+            PublishError: If the API call fails.
+        """
+        try:
+            blobs = self.diff_commit_trees(base, head)
+        except PublishError as e:
+            logger.debug("GraphQL tree diff failed, using REST compare: %s", e)
+            blobs = None
+        if blobs is not None:
+            return blobs
+        return self._compare_commit_blobs_rest(base, head)
+
+    def diff_commit_trees(
+        self, base: str, head: str, *, max_files: int = TREE_DIFF_MAX_FILES
+    ) -> dict[str, str | None] | None:
+        """Diff the trees of two commits, descending only into changed subtrees.
+
+        Each level of the walk is one GraphQL query (per
+        ``GRAPHQL_BLOB_BATCH_SIZE`` trees), and a subtree whose SHA is the
+        same on both sides is skipped without being listed.  Only tree
+        objects are fetched, never blobs.  Submodules are ignored.
+
+        Args:
+            base: Base commit SHA or branch name.
+            head: Head commit SHA or branch name.
+            max_files: Stop and return None once more files than this differ.
+
+        Returns:
+            Mapping of changed path to blob SHA at *head*, or ``None`` for
+            files removed at *head*; None when the diff exceeds *max_files*.
+
+        Raises:
+            PublishError: If a query fails.
+        """
+        changed: dict[str, str | None] = {}
+        pending = [""]
+        per_query = GRAPHQL_BLOB_BATCH_SIZE // 2
+        while pending:
+            subtrees: list[str] = []
+            for start in range(0, len(pending), per_query):
+                dirs = pending[start : start + per_query]
+                keys = [f"{rev}:{d}" for d in dirs for rev in (base, head)]
+                found = self._query_objects("expression", "String!", keys, _TREE_FIELDS)
+                for d in dirs:
+                    old = _tree_entries(found.get(f"{base}:{d}"))
+                    new = _tree_entries(found.get(f"{head}:{d}"))
+                    for name in old.keys() | new.keys():
+                        before, after = old.get(name), new.get(name)
+                        if before == after:
+                            continue
+                        path = f"{d}/{name}" if d else name
+                        if after is not None and after[0] == "blob":
+                            changed[path] = after[1]
+                        elif before is not None and before[0] == "blob":
+                            changed[path] = None
+                        if (before is not None and before[0] == "tree") or (
+                            after is not None and after[0] == "tree"
+                        ):
+                            subtrees.append(path)
+            if len(changed) > max_files:
+                return None
+            pending = subtrees
+        return changed
+
+    def _compare_commit_blobs_rest(self, base: str, head: str) -> dict[str, str | None]:
+        """``compare_commit_blobs`` through the REST compare endpoint."""
         data = self._get(f"/repos/{self.repo}/compare/{base}...{head}")
         files = data.get("files")
         if not isinstance(files, list):
-            return []
+            return {}
         file_list = cast(list[dict[str, object]], files)
-        paths: list[str] = []
+        blobs: dict[str, str | None] = {}
         for file_entry in file_list:
             filename: object = file_entry.get("filename")
-            if isinstance(filename, str):
-                paths.append(filename)
-        return paths
+            if not isinstance(filename, str):
+                continue
+            sha: object = file_entry.get("sha")
+            removed = file_entry.get("status") == "removed"
+            blobs[filename] = sha if isinstance(sha, str) and not removed else None
+        return blobs
 
     # =================================================================
     # PR metadata helpers
@@ -312,6 +467,150 @@ class GitHubClient:
         msg = f"Cannot extract content from blob {blob_sha}"
         raise PublishError(msg)
 
+    def get_blob_texts(self, blob_shas: Sequence[str]) -> dict[str, str]:
+        """Fetch the text of several blobs in one GraphQL query.
+
+        Callers should keep batches to ``GRAPHQL_BLOB_BATCH_SIZE`` blobs.
+        Blobs that are missing, binary, or truncated by GraphQL are left
+        out of the result so the caller can fetch them another way.
+
+        Returns:
+            Mapping of blob SHA to its UTF-8 text.
+
+        Raises:
+            PublishError: If the API call fails or returns no repository.
+        """
+        return self._query_blob_texts("oid", "GitObjectID!", blob_shas)
+
+    def get_file_texts(self, ref: str, paths: Sequence[str]) -> dict[str, str]:
+        """Fetch the text of several files at *ref* in one GraphQL query.
+
+        Like ``get_blob_texts``, but for files whose blob SHA is not known.
+        Callers should keep batches to ``GRAPHQL_BLOB_BATCH_SIZE`` files.
+
+        Returns:
+            Mapping of path to its UTF-8 text.
+
+        Raises:
+            PublishError: If the API call fails or returns no repository.
+        """
+        texts = self._query_blob_texts(
+            "expression", "String!", [f"{ref}:{path}" for path in paths]
+        )
+        prefix = len(ref) + 1
+        return {expression[prefix:]: text for expression, text in texts.items()}
+
+    def _query_blob_texts(
+        self, argument: str, argument_type: str, keys: Sequence[str]
+    ) -> dict[str, str]:
+        """Look up the text of one blob per key."""
+        texts: dict[str, str] = {}
+        found = self._query_objects(argument, argument_type, keys, _BLOB_FIELDS)
+        for key, info in found.items():
+            text = info.get("text")
+            if (
+                isinstance(text, str)
+                and not info.get("isBinary")
+                and not info.get("isTruncated")
+            ):
+                texts[key] = text
+        return texts
+
+    def _query_objects(
+        self, argument: str, argument_type: str, keys: Sequence[str], fields: str
+    ) -> dict[str, dict[str, object]]:
+        """Look up one ``object(<argument>: key)`` alias per key.
+
+        Returns:
+            The requested *fields* of each object found, by key.
+        """
+        if not keys:
+            return {}
+        owner, name = self.repo.split("/", 1)
+        params = ", ".join(f"$o{i}: {argument_type}" for i in range(len(keys)))
+        aliases = " ".join(
+            f"b{i}: object({argument}: $o{i}) {{ {fields} }}" for i in range(len(keys))
+        )
+        query = (
+            f"query($owner: String!, $name: String!, {params}) "
+            f"{{ repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+        )
+        variables: dict[str, object] = {"owner": owner, "name": name}
+        variables.update({f"o{i}": key for i, key in enumerate(keys)})
+
+        data = self._post_json(
+            GitHubAPI.GRAPHQL_PATH, {"query": query, "variables": variables}
+        )
+        payload = data.get("data")
+        repository: object = None
+        if isinstance(payload, dict):
+            repository = cast(dict[str, object], payload).get("repository")
+        if not isinstance(repository, dict):
+            msg = f"GitHub GraphQL object query failed: {data.get('errors')}"
+            raise PublishError(msg)
+
+        objects = cast(dict[str, object], repository)
+        found: dict[str, dict[str, object]] = {}
+        for i, key in enumerate(keys):
+            obj = objects.get(f"b{i}")
+            if isinstance(obj, dict):
+                found[key] = cast(dict[str, object], obj)
+        return found
+
+    def download_tarball(
+        self,
+        ref: str,
+        paths: Collection[str] | None = None,
+        include: Callable[[str, int], bool] | None = None,
+    ) -> Iterator[tuple[str, bytes]]:
+        """Stream the repository tarball at *ref* and yield its files.
+
+        One request replaces a per-file fetch for every path.  The archive
+        is decompressed while it downloads, so it is never held in full.
+
+        Args:
+            ref: Commit SHA or branch name.
+            paths: Only yield these repo-relative paths (all files if None).
+            include: Also yield files outside *paths* for which
+                ``include(path, size)`` is true.  Rejected members are
+                skipped without being read.
+
+        Yields:
+            ``(path, content)`` for each regular file, with the archive's
+            top-level directory stripped from the path.
+
+        Raises:
+            PublishError: If the download or archive decoding fails.
+        """
+        url = f"{GitHubAPI.BASE_URL}/repos/{self.repo}/tarball/{ref}"
+        try:
+            with self._http_client().stream(
+                "GET", url, headers=self._headers(), follow_redirects=True
+            ) as response:
+                if response.status_code > _STATUS_OK_MAX:
+                    response.read()
+                    raise PublishError(
+                        f"GitHub API HTTP {response.status_code}: {response.text}"
+                    )
+                stream = _ByteStreamReader(response.iter_bytes())
+                with tarfile.open(fileobj=stream, mode="r|gz") as archive:
+                    for member in archive:
+                        if not member.isfile():
+                            continue
+                        _root, _, path = member.name.partition("/")
+                        if not path:
+                            continue
+                        wanted = paths is None or path in paths
+                        if not wanted and include is not None:
+                            wanted = include(path, member.size)
+                        if not wanted:
+                            continue
+                        extracted = archive.extractfile(member)
+                        if extracted is not None:
+                            yield path, extracted.read()
+        except (httpx.HTTPError, tarfile.TarError, OSError) as e:
+            raise PublishError(f"GitHub tarball download failed: {e}") from e
+
     def create_blob(self, content_b64: str) -> str:
         """Create a blob from base64-encoded content.
 
@@ -405,6 +704,28 @@ class GitHubClient:
             {"sha": sha, "force": True},
         )
 
+    # =================================================================
+    # Lifecycle
+    # =================================================================
+
+    def close(self) -> None:
+        """Close pooled connections; a later request opens a new pool."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    def __enter__(self) -> GitHubClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
     # =================================================================
     # HTTP helpers
     # =================================================================
@@ -444,18 +765,46 @@ class GitHubClient:
             lambda c: c.patch(url, json=payload, headers=self._headers())
         )
 
+    def _raw_content_request(
+        self, path: FilePath, ref: str
+    ) -> tuple[str, dict[str, str]]:
+        encoded_path = urllib.parse.quote(str(path), safe="/")
+        base = f"{GitHubAPI.BASE_URL}/repos/{self.repo}/contents"
+        headers = self._headers()
+        headers["accept"] = "application/vnd.github.v3.raw"
+        return f"{base}/{encoded_path}?ref={ref}", headers
+
     def _request(self, url: str, headers: dict[str, str]) -> httpx.Response:
         return self._do_with_retry(lambda c: c.get(url, headers=headers))
 
-    @staticmethod
+    def _http_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use."""
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=_MAX_CONNECTIONS,
+                        max_keepalive_connections=_MAX_CONNECTIONS,
+                    ),
+                    http2=True,
+                )
+            return self._http
+
     def _do_with_retry(
+        self,
         send: typing.Callable[[httpx.Client], httpx.Response],
+        *,
+        allowed_status: int | None = None,
     ) -> httpx.Response:
-        """Execute an HTTP request with retry on 429 rate limits."""
+        """Execute an HTTP request with retry on 429 rate limits.
+
+        An error response with *allowed_status* is returned, not raised.
+        """
+        client = self._http_client()
         for attempt in range(_MAX_RATE_LIMIT_RETRIES):
             try:
-                with httpx.Client(timeout=DEFAULT_TIMEOUT_SECONDS) as client:
-                    response = send(client)
+                response = send(client)
             except httpx.HTTPError as e:
                 raise PublishError(f"GitHub API error: {e}") from e
 
@@ -473,10 +822,9 @@ class GitHubClient:
                 time.sleep(retry_after)
                 continue
 
-            if response.status_code > _STATUS_OK_MAX:
-                raise PublishError(
-                    f"GitHub API HTTP {response.status_code}: {response.text}"
-                )
+            status = response.status_code
+            if status > _STATUS_OK_MAX and status != allowed_status:
+                raise PublishError(f"GitHub API HTTP {status}: {response.text}")
             return response
 
         # Unreachable — last attempt either returns or raises above.
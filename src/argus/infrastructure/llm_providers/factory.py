@@ -5,15 +5,33 @@ Creates pydantic-ai ``Agent`` instances from domain ``ModelConfig``.
 
 from __future__ import annotations
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, NativeOutput
+from pydantic_ai.output import OutputSpec
 
 from argus.domain.llm.value_objects import ModelConfig
 
+# Providers whose APIs constrain replies to a JSON schema natively
+# (OpenAI ``response_format``, Gemini ``responseSchema``).
+_NATIVE_OUTPUT_PROVIDERS = (
+    "openai:",
+    "openai-responses:",
+    "google:",
+    "google-gla:",
+    "google-vertex:",
+)
+
+
+def supports_native_output(model: str) -> bool:
+    """Whether *model*'s provider can return schema-constrained JSON directly."""
+    return model.startswith(_NATIVE_OUTPUT_PROVIDERS)
+
 
 def create_agent[T](
     config: ModelConfig,
     output_type: type[T],
     system_prompt: str,
+    *,
+    prefer_native_output: bool = False,
 ) -> Agent[None, T]:
     """Build a pydantic-ai Agent from a ModelConfig.
 
@@ -21,13 +39,19 @@ def create_agent[T](
         config: Model configuration (model string, max_tokens, temperature).
         output_type: The structured output type for the agent.
         system_prompt: System prompt for the agent.
+        prefer_native_output: Ask the provider for schema-constrained JSON
+            instead of emulating structured output with a tool call, when
+            the provider supports it.
 
     Returns:
         A configured pydantic-ai Agent ready for ``run_sync`` / ``run``.
     """
+    spec: OutputSpec[T] = output_type
+    if prefer_native_output and supports_native_output(config.model):
+        spec = NativeOutput(output_type)
     return Agent(
         model=config.model,
-        output_type=output_type,
+        output_type=spec,
         system_prompt=system_prompt,
         model_settings={
             "max_tokens": int(config.max_tokens),
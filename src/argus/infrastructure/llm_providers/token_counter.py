@@ -0,0 +1,77 @@
+"""Token counting for prompt budgets.
+
+Uses ``tiktoken``'s ``cl100k_base`` encoding.  Its data file is fetched on
+first use (the action image ships it prefetched); when it cannot be
+loaded, budgets fall back to ``CHARS_PER_TOKEN`` characters per token.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+
+from collections.abc import Iterable
+
+import tiktoken
+
+from argus.infrastructure.constants import CHARS_PER_TOKEN
+
+logger = logging.getLogger(__name__)
+
+_ENCODING_NAME = "cl100k_base"
+
+
+@functools.cache
+def _encoding() -> tiktoken.Encoding | None:
+    """Load the tokenizer once, or ``None`` when its data is unavailable."""
+    try:
+        return tiktoken.get_encoding(_ENCODING_NAME)
+    except Exception as e:  # tokenizer data is fetched on first use
+        logger.warning("tiktoken unavailable, estimating tokens from length: %s", e)
+        return None
+
+
+def count_tokens(pieces: Iterable[str]) -> int:
+    """Count the tokens in a prompt section given as *pieces*.
+
+    Pieces are encoded separately, so large texts need not be joined first.
+    Without the tokenizer the length-based estimate rounds up, so a section
+    never looks cheaper than its character length implies.
+    """
+    encoding = _encoding()
+    if encoding is None:
+        chars = sum(map(len, pieces))
+        return -(-chars // CHARS_PER_TOKEN)
+    return sum(len(encoding.encode(piece, disallowed_special=())) for piece in pieces)
+
+
+def fit_lines(text: str, budget_tokens: int) -> tuple[str, int]:
+    """Return the longest run of whole leading lines of *text* within budget.
+
+    Lines are encoded one at a time, stopping at the first that does not
+    fit, so an over-budget text is never encoded in full.  Without the
+    tokenizer, lines are fitted to ``budget_tokens * CHARS_PER_TOKEN``
+    characters instead, so the estimate is not rounded up once per line.
+
+    Returns:
+        The fitting text and its token count.
+    """
+    encoding = _encoding()
+    if encoding is None:
+        budget_chars = max(budget_tokens, 0) * CHARS_PER_TOKEN
+        if len(text) <= budget_chars:
+            return text, -(-len(text) // CHARS_PER_TOKEN)
+        end = text.rfind("\n", 0, budget_chars) + 1
+        return text[:end].rstrip("\n"), -(-end // CHARS_PER_TOKEN)
+
+    used = 0
+    end = 0
+    while end < len(text):
+        newline = text.find("\n", end)
+        stop = len(text) if newline < 0 else newline + 1
+        cost = len(encoding.encode(text[end:stop], disallowed_special=()))
+        if used + cost > budget_tokens:
+            return text[:end].rstrip("\n"), used
+        used += cost
+        end = stop
+    return text, used
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
-from argus.domain.context.entities import CodebaseMap
+from argus.domain.context.entities import CodebaseMap, FileEntry
 from argus.domain.memory.value_objects import CodebaseOutline, FileOutlineEntry
 from argus.infrastructure.constants import CHARS_PER_TOKEN
 from argus.shared.types import FilePath
@@ -60,7 +61,7 @@ class OutlineRenderer:
                     ordered.append(dep)
                     seen.add(dep)
 
-        return self._render_files(codebase_map, ordered)
+        return self._render_entries(codebase_map.get(f) for f in ordered)
 
     def render_full(self, codebase_map: CodebaseMap) -> tuple[str, CodebaseOutline]:
         """Render an outline for the entire codebase map.
@@ -68,13 +69,11 @@ class OutlineRenderer:
         Returns:
             A tuple of (rendered text, structured outline).
         """
-        ordered = sorted(codebase_map.files())
-        return self._render_files(codebase_map, ordered)
+        return self._render_entries(codebase_map.iter_sorted())
 
-    def _render_files(
+    def _render_entries(
         self,
-        codebase_map: CodebaseMap,
-        files: list[FilePath],
+        entries: Iterable[FileEntry],
     ) -> tuple[str, CodebaseOutline]:
         """Render file outlines within the token budget."""
         budget_chars = self.token_budget * CHARS_PER_TOKEN
@@ -82,16 +81,18 @@ class OutlineRenderer:
         outline_entries: list[FileOutlineEntry] = []
         used = 0
 
-        for path in files:
-            entry = codebase_map.get(path)
+        for entry in entries:
+            path = entry.path
             file_lines: list[str] = [f"# {path}"]
             symbol_names: list[str] = []
+            signatures: list[str] = []
 
             for sym in entry.symbols:
                 if sym.signature:
-                    file_lines.append(f"  {sym.signature}")
+                    signatures.append(sym.signature)
                 else:
-                    file_lines.append(f"  {sym.kind.value} {sym.name}")
+                    signatures.append(f"{sym.kind.value} {sym.name}")
+                file_lines.append(f"  {signatures[-1]}")
                 symbol_names.append(sym.name)
 
             section = "\n".join(file_lines) + "\n"
@@ -107,7 +108,11 @@ class OutlineRenderer:
             lines.append(section)
             used += len(section)
             outline_entries.append(
-                FileOutlineEntry(path=path, symbols=tuple(symbol_names))
+                FileOutlineEntry(
+                    path=path,
+                    symbols=tuple(symbol_names),
+                    signatures=tuple(signatures),
+                )
             )
 
         outline = CodebaseOutline(entries=tuple(outline_entries))
@@ -0,0 +1,137 @@
+"""Content-addressed cache for chunker output."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+from argus.domain.context.value_objects import Symbol
+from argus.infrastructure import constants
+from argus.infrastructure.constants import CHUNK_CACHE_MAX_ENTRIES
+from argus.infrastructure.parsing import chunker
+from argus.infrastructure.parsing.chunker import CodeChunk
+from argus.infrastructure.parsing.parse_cache import source_fingerprint
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
+from argus.shared.types import FilePath, TokenCount
+
+logger = logging.getLogger(__name__)
+
+CHUNK_CACHE_TABLE = "chunks"
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+@dataclass
+class ChunkCache:
+    """Memoizes ``Chunker.chunk`` across runs.
+
+    Chunks depend only on the path, file content, symbol line ranges, and
+    the chunker's code, so the cache key is a SHA-256 over those.
+    Unchanged files are served from the local SQLite cache instead of
+    being re-chunked; the store keeps only the newest
+    ``CHUNK_CACHE_MAX_ENTRIES`` entries.
+    """
+
+    store: SqliteCache
+
+    @classmethod
+    def for_storage_dir(cls, storage_dir: Path) -> ChunkCache:
+        """Open the chunk cache kept under ``storage_dir``."""
+        store = SqliteCache.for_storage_dir(
+            storage_dir, CHUNK_CACHE_TABLE, max_entries=CHUNK_CACHE_MAX_ENTRIES
+        )
+        return cls(store=store)
+
+    def get_or_compute(
+        self,
+        path: FilePath,
+        content: str,
+        symbols: Sequence[Symbol],
+        compute: Callable[[FilePath, str, Sequence[Symbol]], list[CodeChunk]],
+    ) -> list[CodeChunk]:
+        """Return cached chunks for the file, computing them on a miss.
+
+        Args:
+            path: File path.
+            content: Full file content.
+            symbols: Extracted symbols with line ranges.
+            compute: Chunking function invoked on a cache miss.
+
+        Returns:
+            The chunks for the file.
+        """
+        key = _cache_key(path, content, symbols)
+        cached = self.store.get(key)
+        if cached is not None:
+            try:
+                return _decode(path, cached)
+            except (ValueError, TypeError, KeyError) as e:
+                logger.debug("Discarding corrupt chunk cache entry for %s: %s", path, e)
+
+        chunks = compute(path, content, symbols)
+        self.store.put(key, _encode(chunks))
+        return chunks
+
+    def close(self) -> None:
+        """Persist pending entries and release the underlying store."""
+        self.store.close()
+
+    def __enter__(self) -> ChunkCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+@functools.cache
+def _chunker_version() -> str:
+    return source_fingerprint(chunker, constants)
+
+
+def _cache_key(path: FilePath, content: str, symbols: Sequence[Symbol]) -> str:
+    h = hashlib.sha256()
+    h.update(_chunker_version().encode())
+    h.update(b"\0")
+    h.update(path.encode())
+    h.update(b"\0")
+    h.update(content.encode())
+    for sym in symbols:
+        h.update(f"\0{sym.name}:{sym.line_range.start}:{sym.line_range.end}".encode())
+    return h.hexdigest()
+
+
+def _encode(chunks: list[CodeChunk]) -> bytes:
+    rows = [[c.symbol_name, c.content, int(c.token_cost)] for c in chunks]
+    return json.dumps(rows, separators=(",", ":")).encode()
+
+
+def _decode(path: FilePath, data: bytes) -> list[CodeChunk]:
+    rows = json.loads(data)
+    return [
+        CodeChunk(
+            source=path,
+            symbol_name=str(name),
+            content=str(content),
+            token_cost=TokenCount(int(cost)),
+        )
+        for name, content, cost in rows
+    ]
@@ -0,0 +1,137 @@
+"""Content-addressed cache for parsed file entries."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.metadata
+import json
+import logging
+
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType, TracebackType
+
+from argus.domain.context.entities import FileEntry
+from argus.infrastructure import constants
+from argus.infrastructure.constants import (
+    LANGUAGE_TO_PACKAGE,
+    PARSE_CACHE_MAX_ENTRIES,
+)
+from argus.infrastructure.parsing import tree_sitter_parser
+from argus.infrastructure.storage import _serial_helpers
+from argus.infrastructure.storage._serial_helpers import (
+    deserialize_entry,
+    serialize_entry,
+)
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
+from argus.shared.types import FilePath
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_TABLE = "parses"
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+@dataclass
+class ParseCache:
+    """Memoizes ``TreeSitterParser.parse`` across runs.
+
+    An entry depends only on the path (which selects the grammar), the file
+    content, the tree-sitter package versions, and the parser's own code,
+    so the key is a SHA-256 over all of them.  Editing the parser or
+    upgrading a grammar changes every key, which retires stale entries
+    without a migration; the store keeps only the newest
+    ``PARSE_CACHE_MAX_ENTRIES`` entries.
+    """
+
+    store: SqliteCache
+
+    @classmethod
+    def for_storage_dir(cls, storage_dir: Path) -> ParseCache:
+        """Open the parse cache kept under ``storage_dir``."""
+        store = SqliteCache.for_storage_dir(
+            storage_dir, PARSE_CACHE_TABLE, max_entries=PARSE_CACHE_MAX_ENTRIES
+        )
+        return cls(store=store)
+
+    def key(self, path: FilePath, content: str) -> str:
+        """Return the cache key for *content* parsed as *path*."""
+        h = hashlib.sha256()
+        h.update(_parser_version().encode())
+        h.update(b"\0")
+        h.update(path.encode())
+        h.update(b"\0")
+        h.update(content.encode("utf-8", errors="replace"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> FileEntry | None:
+        """Return the cached entry for *key*, or None on miss."""
+        data = self.store.get(key)
+        if data is None:
+            return None
+        try:
+            return deserialize_entry(json.loads(data))
+        except (ValueError, TypeError, KeyError) as e:
+            logger.debug("Discarding corrupt parse cache entry: %s", e)
+            return None
+
+    def put(self, key: str, entry: FileEntry) -> None:
+        """Cache *entry* under *key*."""
+        data = json.dumps(serialize_entry(entry), separators=(",", ":"))
+        self.store.put(key, data.encode())
+
+    def close(self) -> None:
+        """Persist pending entries and release the underlying store."""
+        self.store.close()
+
+    def __enter__(self) -> ParseCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def source_fingerprint(*modules: ModuleType) -> str:
+    """SHA-256 over the source of *modules*, for versioning cache keys.
+
+    The argus version is not bumped when its code changes, so caches of
+    computed results key on the code that computes them instead.
+    """
+    h = hashlib.sha256()
+    for module in modules:
+        h.update(module.__name__.encode())
+        h.update(b"\0")
+        if module.__file__ is not None:
+            h.update(Path(module.__file__).read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@functools.cache
+def _parser_version() -> str:
+    """Versions of every package and module whose code shapes a parsed entry."""
+    packages = ("tree-sitter", *sorted(LANGUAGE_TO_PACKAGE.values()))
+    versions = [f"{name}={_package_version(name)}" for name in packages]
+    code = source_fingerprint(tree_sitter_parser, _serial_helpers, constants)
+    return ";".join([*versions, f"code={code}"])
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
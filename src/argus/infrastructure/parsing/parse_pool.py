@@ -0,0 +1,167 @@
+"""Multi-process source parsing for large batches of files."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+
+from argus.domain.context.entities import FileEntry
+from argus.infrastructure.parsing.parse_cache import ParseCache
+from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
+from argus.shared.exceptions import ArgusError
+from argus.shared.types import FilePath
+
+_BATCH_SIZE = 32
+_PENDING_BATCHES_PER_WORKER = 4
+
+POOL_MIN_FILES = 256
+"""Fewest files for which ``parse_files`` should be asked to use the pool."""
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+
+def _parse_batch(
+    batch: list[tuple[FilePath, str]],
+) -> list[tuple[FilePath, FileEntry | ArgusError]]:
+    """Parse a batch of files inside a worker process.
+
+    Grammars are cached per process by ``tree_sitter_parser``, so each
+    worker loads a language once and reuses it for later batches.
+    """
+    parser = TreeSitterParser()
+    outcomes: list[tuple[FilePath, FileEntry | ArgusError]] = []
+    for path, content in batch:
+        try:
+            outcomes.append((path, parser.parse(path, content)))
+        except ArgusError as e:
+            # Subclasses such as IndexingError take extra constructor
+            # arguments and cannot be unpickled; send the message instead.
+            outcomes.append((path, ArgusError(str(e))))
+    return outcomes
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+
+@dataclass
+class ParsePool:
+    """Parses files with ``TreeSitterParser`` across worker processes.
+
+    Tree-sitter parsing and symbol extraction are CPU-bound and hold the
+    GIL for most of their run time, so threads cannot spread them across
+    cores.  Files are sent to workers in small batches as they arrive,
+    keeping only a bounded number of batches in flight.
+    """
+
+    max_workers: int | None = None
+    batch_size: int = _BATCH_SIZE
+
+    def parse(
+        self,
+        files: Iterable[tuple[FilePath, str]],
+    ) -> Iterator[tuple[FilePath, FileEntry | ArgusError]]:
+        """Parse ``(path, content)`` pairs, yielding outcomes as they finish.
+
+        Args:
+            files: Files to parse; consumed lazily.
+
+        Yields:
+            ``(path, entry)`` on success, or ``(path, error)`` when the file
+            could not be parsed.  Order is not preserved.
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        max_pending = workers * _PENDING_BATCHES_PER_WORKER
+        pending: set[Future[list[tuple[FilePath, FileEntry | ArgusError]]]] = set()
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as pool:
+            batch: list[tuple[FilePath, str]] = []
+            for item in files:
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+                pending.add(pool.submit(_parse_batch, batch))
+                batch = []
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            if batch:
+                pending.add(pool.submit(_parse_batch, batch))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def parse_files(
+    parser: TreeSitterParser,
+    files: Iterable[tuple[FilePath, str]],
+    *,
+    use_pool: bool,
+    cache: ParseCache | None = None,
+) -> Iterator[tuple[FilePath, FileEntry | ArgusError]]:
+    """Parse files on this thread, or across processes when *use_pool*.
+
+    A process pool pays a start-up cost per worker, so it only wins once
+    there are enough files (see ``POOL_MIN_FILES``) to keep every core busy.
+    With a *cache*, files parsed before are served from it and only the
+    rest are parsed; new entries are added to it.
+    """
+    if cache is None:
+        yield from _parse_uncached(parser, files, use_pool=use_pool)
+        return
+
+    hits: list[tuple[FilePath, FileEntry]] = []
+    keys: dict[FilePath, str] = {}
+
+    def misses() -> Iterator[tuple[FilePath, str]]:
+        for fp, content in files:
+            key = cache.key(fp, content)
+            entry = cache.get(key)
+            if entry is None:
+                keys[fp] = key
+                yield fp, content
+            else:
+                hits.append((fp, entry))
+
+    for fp, outcome in _parse_uncached(parser, misses(), use_pool=use_pool):
+        yield from hits
+        hits.clear()
+        key = keys.pop(fp)
+        if isinstance(outcome, FileEntry):
+            cache.put(key, outcome)
+        yield fp, outcome
+    yield from hits
+
+
+def _parse_uncached(
+    parser: TreeSitterParser,
+    files: Iterable[tuple[FilePath, str]],
+    *,
+    use_pool: bool,
+) -> Iterator[tuple[FilePath, FileEntry | ArgusError]]:
+    if use_pool:
+        yield from ParsePool().parse(files)
+        return
+    for fp, content in files:
+        try:
+            yield fp, parser.parse(fp, content)
+        except ArgusError as e:
+            yield fp, e
+
+
+def _mp_context() -> BaseContext:
+    # forkserver avoids forking a parent that holds threads and sockets.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
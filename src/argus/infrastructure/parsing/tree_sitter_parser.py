@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import threading
 
 from dataclasses import dataclass
 from pathlib import PurePosixPath
@@ -53,6 +54,30 @@ def _load_language(lang: SupportedLanguage) -> Language:
     return ts_lang
 
 
+_thread_state = threading.local()
+
+
+def _parser_for(lang: SupportedLanguage, ts_lang: Language) -> Parser:
+    """Return this thread's reusable ``Parser`` for *lang*.
+
+    A ``Parser`` is not safe to share between threads, so each thread
+    keeps one per language instead of allocating one per file.
+    """
+    parsers: dict[SupportedLanguage, Parser] | None = getattr(
+        _thread_state, "parsers", None
+    )
+    if parsers is None:
+        parsers = {}
+        _thread_state.parsers = parsers
+    parser = parsers.get(lang)
+    if parser is None:
+        parser = Parser(ts_lang)
+        parsers[lang] = parser
+    else:
+        parser.reset()
+    return parser
+
+
 # =============================================================================
 # PARSER
 # =============================================================================
@@ -87,7 +112,7 @@ class TreeSitterParser:
             raise IndexingError(path, f"failed to load grammar: {e}") from e
 
         try:
-            parser = Parser(ts_lang)
+            parser = _parser_for(lang, ts_lang)
             tree = parser.parse(content.encode("utf-8", errors="replace"))
         except (RuntimeError, OSError, ValueError, TypeError) as e:
             raise IndexingError(path, f"parse failed: {e}") from e
@@ -0,0 +1,75 @@
+"""Batched embedding of many texts through one provider."""
+
+from __future__ import annotations
+
+import logging
+
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from argus.domain.retrieval.embeddings import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+EMBED_BATCH_SIZE = 256
+"""Texts sent to the provider per ``embed`` call."""
+
+
+def embed_concurrency(provider: EmbeddingProvider) -> int:
+    """How many ``embed`` calls *provider* allows in flight at once.
+
+    Providers opt in to parallel calls with a ``max_concurrency`` class
+    attribute; anything else is called serially.
+    """
+    value: object = getattr(provider, "max_concurrency", 1)
+    return value if isinstance(value, int) and value > 1 else 1
+
+
+def embed_in_batches(
+    provider: EmbeddingProvider,
+    texts: Sequence[str],
+    *,
+    batch_size: int = EMBED_BATCH_SIZE,
+) -> Iterator[tuple[int, int, list[list[float]] | None]]:
+    """Embed *texts* in batches of *batch_size*.
+
+    Batches run one at a time unless the provider declares a higher
+    ``max_concurrency`` (see ``embed_concurrency``).
+
+    Yields:
+        ``(lo, hi, vectors)`` for ``texts[lo:hi]`` as each batch finishes.
+        ``vectors`` is None when the batch failed or returned the wrong
+        number of vectors; the failure is logged.
+    """
+    bounds = [
+        (lo, min(lo + batch_size, len(texts)))
+        for lo in range(0, len(texts), batch_size)
+    ]
+    workers = min(embed_concurrency(provider), len(bounds))
+    if workers <= 1:
+        for lo, hi in bounds:
+            yield lo, hi, _embed_batch(provider, texts, lo, hi)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_embed_batch, provider, texts, lo, hi): (lo, hi)
+            for lo, hi in bounds
+        }
+        for future in as_completed(futures):
+            lo, hi = futures[future]
+            yield lo, hi, future.result()
+
+
+def _embed_batch(
+    provider: EmbeddingProvider, texts: Sequence[str], lo: int, hi: int
+) -> list[list[float]] | None:
+    try:
+        vectors = provider.embed(list(texts[lo:hi]))
+    except Exception:
+        logger.warning("Failed to embed chunks %d-%d", lo, hi)
+        return None
+    if len(vectors) != hi - lo:
+        logger.warning("Embedding count mismatch for chunks %d-%d", lo, hi)
+        return None
+    return vectors
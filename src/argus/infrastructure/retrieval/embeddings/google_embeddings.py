@@ -7,6 +7,7 @@ import os
 import time
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from argus.shared.exceptions import ConfigurationError
 
@@ -105,6 +106,9 @@ class GoogleEmbeddingProvider:
     model_name: str = _DEFAULT_MODEL
     _dimension: int = field(default=_DEFAULT_DIMENSION, init=False)
 
+    max_concurrency: ClassVar[int] = 1
+    """Calls pace themselves with ``_REQUEST_DELAY``; parallel calls would not."""
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Embed texts using the Google Generative AI API."""
         api_key = os.environ.get("GOOGLE_API_KEY", "")
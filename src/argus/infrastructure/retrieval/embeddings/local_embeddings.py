@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from argus.shared.exceptions import ConfigurationError
 
@@ -35,6 +36,9 @@ class LocalEmbeddingProvider:
     model_name: str = _DEFAULT_MODEL
     _dimension: int = field(default=_DEFAULT_DIMENSION, init=False)
 
+    max_concurrency: ClassVar[int] = 1
+    """The shared model is not safe to call from several threads."""
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Embed texts using a local sentence-transformers model."""
         try:
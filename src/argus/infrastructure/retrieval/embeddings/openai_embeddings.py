@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from argus.shared.exceptions import ConfigurationError
 
@@ -31,6 +32,9 @@ class OpenAIEmbeddingProvider:
     model_name: str = _DEFAULT_MODEL
     _dimension: int = field(default=_DEFAULT_DIMENSION, init=False)
 
+    max_concurrency: ClassVar[int] = 1
+    """No retry on 429, so parallel calls could drop whole batches."""
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Embed texts using the OpenAI API."""
         api_key = os.environ.get("OPENAI_API_KEY", "")
@@ -9,6 +9,7 @@ import logging
 import os
 import tempfile
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
@@ -25,6 +26,8 @@ from argus.infrastructure.storage import serializer, shard_serializer
 logger = logging.getLogger(__name__)
 
 MANIFEST_FILENAME = "manifest.json"
+_MAX_READ_WORKERS = 16
+_MAX_SYNC_WORKERS = 16
 
 
 def _atomic_write_text(path: Path, data: str) -> None:
@@ -55,6 +58,55 @@ def _atomic_write_text(path: Path, data: str) -> None:
         raise
 
 
+def _atomic_write_texts(files: dict[Path, str]) -> None:
+    """Write many files atomically, syncing them together before any rename.
+
+    Every file goes to a temp file first, and the temp files are fsynced
+    concurrently so the filesystem can fold them into a few journal commits
+    instead of one per file.  Only once all of them are durable are they
+    renamed into place, which keeps ``_atomic_write_text``'s guarantee that
+    a crash never leaves a renamed but unsynced file behind.
+    """
+    if len(files) <= 1:
+        for path, data in files.items():
+            _atomic_write_text(path, data)
+        return
+
+    tmp_paths: dict[Path, Path] = {}
+    try:
+        for path, data in files.items():
+            fd = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                mode="w",
+                dir=path.parent,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            )
+            tmp_paths[path] = Path(fd.name)
+            with fd:
+                fd.write(data)
+
+        workers = min(_MAX_SYNC_WORKERS, len(tmp_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_fsync_path, tmp_paths.values()))
+
+        for path in list(tmp_paths):
+            tmp_paths.pop(path).replace(path)
+    except BaseException:
+        for tmp_path in tmp_paths.values():
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+        raise
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def legacy_artifact_path(storage_dir: Path, repo_id: str) -> Path:
     """Compute the file path for a legacy flat artifact."""
     safe_name = hashlib.sha256(repo_id.encode()).hexdigest()[:16]
@@ -100,6 +152,28 @@ class FileArtifactStore:
         return legacy_artifact_path(self.storage_dir, repo_id)
 
 
+def _read_texts_parallel[K](paths: dict[K, Path]) -> dict[K, str]:
+    """Read many small files concurrently, skipping ones that do not exist.
+
+    File reads release the GIL, so a thread pool keeps several reads in
+    flight instead of paying each syscall round-trip in turn.
+    """
+
+    def read(path: Path) -> str | None:
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    if len(paths) <= 1:
+        texts = {key: read(path) for key, path in paths.items()}
+    else:
+        workers = min(_MAX_READ_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            texts = dict(zip(paths, pool.map(read, paths.values()), strict=True))
+    return {key: text for key, text in texts.items() if text is not None}
+
+
 # =============================================================================
 # SHARDED ARTIFACT STORE
 # =============================================================================
@@ -166,24 +240,32 @@ class ShardedArtifactStore:
         self,
         repo_id: str,
         shard_ids: set[ShardId],
+        manifest: ShardedManifest | None = None,
     ) -> CodebaseMap:
-        """Load a partial CodebaseMap from specific shards."""
-        manifest = self.load_manifest(repo_id)
+        """Load a partial CodebaseMap from specific shards.
+
+        Args:
+            repo_id: Repository identifier.
+            shard_ids: Shards to load.
+            manifest: Already-loaded manifest to reuse instead of reading
+                and parsing ``manifest.json`` again.
+        """
+        if manifest is None:
+            manifest = self.load_manifest(repo_id)
         if manifest is None:
             from argus.shared.types import CommitSHA
 
             return CodebaseMap(indexed_at=CommitSHA(""))
 
-        shard_data: dict[ShardId, str] = {}
+        blob_paths: dict[ShardId, Path] = {}
         for sid in shard_ids:
             desc = manifest.shards.get(sid)
-            if desc is None:
-                continue
-            blob_path = self.storage_dir / desc.blob_name
-            if not blob_path.exists():
-                logger.warning("Missing shard blob %s for %s", desc.blob_name, sid)
-                continue
-            shard_data[sid] = blob_path.read_text(encoding="utf-8")
+            if desc is not None:
+                blob_paths[sid] = self.storage_dir / desc.blob_name
+
+        shard_data = _read_texts_parallel(blob_paths)
+        for sid in blob_paths.keys() - shard_data.keys():
+            logger.warning("Missing shard blob %s for %s", blob_paths[sid].name, sid)
 
         return shard_serializer.assemble_from_shards(manifest, shard_data)
 
@@ -213,20 +295,31 @@ class ShardedArtifactStore:
         # We need the manifest to get blob names — but the caller
         # already has the manifest. So we accept raw shard data
         # keyed by blob_name.
+        files: dict[Path, str] = {}
         for _sid, json_str in shard_data.items():
             # Compute blob name from content hash.
             content_hash = hashlib.sha256(json_str.encode()).hexdigest()[:16]
-            blob_name = f"shard_{content_hash}.json"
-            _atomic_write_text(self.storage_dir / blob_name, json_str)
+            files[self.storage_dir / f"shard_{content_hash}.json"] = json_str
+        _atomic_write_texts(files)
 
-    def load_full(self, repo_id: str) -> CodebaseMap | None:
-        """Load the complete CodebaseMap by loading all shards."""
-        manifest = self.load_manifest(repo_id)
+    def load_full(
+        self,
+        repo_id: str,
+        manifest: ShardedManifest | None = None,
+    ) -> CodebaseMap | None:
+        """Load the complete CodebaseMap by loading all shards.
+
+        Args:
+            repo_id: Repository identifier.
+            manifest: Already-loaded manifest to reuse, if any.
+        """
+        if manifest is None:
+            manifest = self.load_manifest(repo_id)
         if manifest is None:
             return None
 
         all_shard_ids = set(manifest.shards.keys())
-        return self.load_shards(repo_id, all_shard_ids)
+        return self.load_shards(repo_id, all_shard_ids, manifest=manifest)
 
     def load_or_migrate(self, repo_id: str) -> CodebaseMap | None:
         """Load from sharded format, falling back to legacy flat format.
@@ -237,7 +330,7 @@ class ShardedArtifactStore:
         # Try sharded format first.
         manifest = self.load_manifest(repo_id)
         if manifest is not None:
-            return self.load_full(repo_id)
+            return self.load_full(repo_id, manifest=manifest)
 
         # Fall back to legacy flat format.
         legacy_store = FileArtifactStore(storage_dir=self.storage_dir)
@@ -249,9 +342,12 @@ class ShardedArtifactStore:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         # Write shard files.
-        for sid, json_str in shard_data.items():
-            desc = manifest.shards[sid]
-            _atomic_write_text(self.storage_dir / desc.blob_name, json_str)
+        _atomic_write_texts(
+            {
+                self.storage_dir / manifest.shards[sid].blob_name: json_str
+                for sid, json_str in shard_data.items()
+            }
+        )
 
         # Write manifest.
         _atomic_write_text(self.storage_dir / MANIFEST_FILENAME, manifest.to_json())
@@ -310,9 +406,12 @@ class ShardedArtifactStore:
         )
 
         # Write only the changed shard files.
-        for sid, json_str in shard_data.items():
-            desc = new_manifest.shards[sid]
-            _atomic_write_text(self.storage_dir / desc.blob_name, json_str)
+        _atomic_write_texts(
+            {
+                self.storage_dir / new_manifest.shards[sid].blob_name: json_str
+                for sid, json_str in shard_data.items()
+            }
+        )
 
         # Write merged manifest BEFORE deleting orphans.  A crash after
         # this point leaves unreferenced old blobs (harmless, cleaned up
@@ -343,13 +442,12 @@ class ShardedArtifactStore:
             "shard_id": str(index.shard_id),
             "embeddings": index.embeddings,
             "chunk_ids": index.chunk_ids,
+            "content_hashes": index.content_hashes,
             "dimension": index.dimension,
             "model": index.model,
         }
         json_str = json.dumps(data)
-        hash_input = f"{index.shard_id}:{index.model}"
-        content_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
-        blob_name = f"{content_hash}_embeddings.json"
+        blob_name = self.embedding_blob_name(index.shard_id, index.model)
         _atomic_write_text(self.storage_dir / blob_name, json_str)
         return EmbeddingDescriptor(
             shard_id=index.shard_id,
@@ -358,6 +456,13 @@ class ShardedArtifactStore:
             blob_name=blob_name,
         )
 
+    @staticmethod
+    def embedding_blob_name(shard_id: ShardId, model: str = "") -> str:
+        """Return the filename of the embedding index for a shard and model."""
+        hash_input = f"{shard_id}:{model}" if model else str(shard_id)
+        content_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+        return f"{content_hash}_embeddings.json"
+
     def load_embedding_indices(
         self,
         shard_ids: set[ShardId],
@@ -371,10 +476,7 @@ class ShardedArtifactStore:
         """
         indices: list[EmbeddingIndex] = []
         for sid in shard_ids:
-            hash_input = f"{sid}:{model}" if model else str(sid)
-            content_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
-            blob_name = f"{content_hash}_embeddings.json"
-            path = self.storage_dir / blob_name
+            path = self.storage_dir / self.embedding_blob_name(sid, model)
             if not path.exists():
                 continue
             try:
@@ -386,6 +488,15 @@ class ShardedArtifactStore:
                     chunk_ids_raw, list
                 ):
                     continue
+                hashes_raw = raw_data.get("content_hashes")
+                hashes = (
+                    cast(list[object], hashes_raw)
+                    if isinstance(hashes_raw, list)
+                    else []
+                )
+                content_hashes: tuple[str, ...] = ()
+                if len(hashes) == len(cast(list[object], chunk_ids_raw)):
+                    content_hashes = tuple(str(h) for h in hashes)
                 indices.append(
                     EmbeddingIndex(
                         shard_id=ShardId(str(raw_data.get("shard_id", ""))),
@@ -395,6 +506,7 @@ class ShardedArtifactStore:
                         chunk_ids=tuple(cast(list[str], chunk_ids_raw)),
                         dimension=int(str(raw_data.get("dimension", 0))),
                         model=str(raw_data.get("model", "")),
+                        content_hashes=content_hashes,
                     )
                 )
             except (ValueError, KeyError):
@@ -0,0 +1,66 @@
+"""Local cache of repository file contents keyed by git blob SHA."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+from argus.infrastructure.constants import BLOB_CACHE_MAX_ENTRIES
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
+
+BLOB_CACHE_TABLE = "blobs"
+
+
+def blob_shas_from_tree(tree_entries: list[dict[str, object]]) -> dict[str, str]:
+    """Map each blob path in a recursive tree listing to its blob SHA."""
+    return {
+        str(entry.get("path")): str(entry.get("sha"))
+        for entry in tree_entries
+        if entry.get("type") == "blob" and entry.get("sha")
+    }
+
+
+@dataclass
+class BlobContentCache:
+    """Maps git blob SHAs to decoded file contents.
+
+    Blob SHAs are content-addressed, so an entry never goes stale: a file
+    whose blob SHA in the current tree matches a cached SHA can be served
+    locally instead of being fetched again.  The store keeps only the
+    newest ``BLOB_CACHE_MAX_ENTRIES`` entries.
+    """
+
+    store: SqliteCache
+
+    @classmethod
+    def for_storage_dir(cls, storage_dir: Path) -> BlobContentCache:
+        """Open the blob cache kept under ``storage_dir``."""
+        store = SqliteCache.for_storage_dir(
+            storage_dir, BLOB_CACHE_TABLE, max_entries=BLOB_CACHE_MAX_ENTRIES
+        )
+        return cls(store=store)
+
+    def get(self, blob_sha: str) -> str | None:
+        """Return the cached content for *blob_sha*, or None on miss."""
+        data = self.store.get(blob_sha)
+        return None if data is None else data.decode("utf-8", errors="replace")
+
+    def put(self, blob_sha: str, content: str) -> None:
+        """Cache *content* under *blob_sha*."""
+        self.store.put(blob_sha, content.encode("utf-8", errors="replace"))
+
+    def close(self) -> None:
+        """Persist pending entries and release the underlying store."""
+        self.store.close()
+
+    def __enter__(self) -> BlobContentCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,72 @@
+"""Disk-backed mapping for file contents held across a long-running command."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from collections.abc import Iterator, MutableMapping
+from dataclasses import dataclass, field
+from types import TracebackType
+
+from argus.shared.types import FilePath
+
+
+@dataclass
+class FileContentStore(MutableMapping[FilePath, str]):
+    """``dict``-like ``path -> content`` store that keeps contents off the heap.
+
+    Backed by a private temporary SQLite database, which SQLite deletes
+    automatically when the store is closed.  Use it in place of a plain
+    dict when contents must outlive a phase (e.g. bootstrap fetch through
+    embedding) that does not otherwise need them in memory.
+    """
+
+    _conn: sqlite3.Connection = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # An empty filename gives a private on-disk database removed on close.
+        self._conn = sqlite3.connect("")
+        self._conn.execute(
+            "CREATE TABLE contents (path TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+
+    def __getitem__(self, path: FilePath) -> str:
+        row = self._conn.execute(
+            "SELECT content FROM contents WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(path)
+        return str(row[0])
+
+    def __setitem__(self, path: FilePath, content: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO contents (path, content) VALUES (?, ?)",
+            (path, content),
+        )
+
+    def __delitem__(self, path: FilePath) -> None:
+        cursor = self._conn.execute("DELETE FROM contents WHERE path = ?", (path,))
+        if cursor.rowcount == 0:
+            raise KeyError(path)
+
+    def __iter__(self) -> Iterator[FilePath]:
+        rows = self._conn.execute("SELECT path FROM contents").fetchall()
+        return (FilePath(str(row[0])) for row in rows)
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM contents").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the store and discard its contents."""
+        self._conn.close()
+
+    def __enter__(self) -> FileContentStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -7,15 +7,34 @@ Stores and retrieves JSON artifacts on a dedicated orphan branch
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from argus.infrastructure.constants import (
+    ARTIFACT_CACHE_MAX_ENTRIES,
+    GRAPHQL_BLOB_BATCH_SIZE,
+)
 from argus.infrastructure.github.client import GitHubClient
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
+from argus.shared.exceptions import ArgusError
+from argus.shared.types import FilePath
 
 logger = logging.getLogger(__name__)
 
+_MAX_DOWNLOAD_WORKERS = 8
+
+ARTIFACT_CACHE_TABLE = "artifacts"
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """The SHA git gives a blob holding *data*."""
+    header = b"blob %d\0" % len(data)
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
 
 @dataclass
 class GitBranchSync:
@@ -146,6 +165,9 @@ class SelectiveGitBranchSync:
     )
     """Cached tree entries from the last ``_fetch_tree`` call."""
 
+    _cached_ref_sha: str | None = field(default=None, init=False, repr=False)
+    """Branch commit read by ``pull_manifest``; later pulls use its tree."""
+
     def _fetch_tree(self) -> list[dict[str, object]] | None:
         """Fetch and cache the branch tree entries.
 
@@ -155,10 +177,11 @@ class SelectiveGitBranchSync:
         if self._cached_tree is not None:
             return self._cached_tree
 
-        ref_sha = self.client.get_ref_sha(self.branch)
+        ref_sha = self._cached_ref_sha or self.client.get_ref_sha(self.branch)
         if ref_sha is None:
             logger.info("Branch %s does not exist", self.branch)
             return None
+        self._cached_ref_sha = ref_sha
 
         tree_sha = self.client.get_commit_tree_sha(ref_sha)
         self._cached_tree = self.client.get_tree_entries_flat(tree_sha)
@@ -167,31 +190,29 @@ class SelectiveGitBranchSync:
     def pull_manifest(self) -> bool:
         """Download only manifest.json from the branch.
 
-        Also caches tree entries for subsequent ``pull_blobs`` calls.
+        The manifest is read straight from the branch's head commit, so a
+        run that stops at the manifest (nothing to update) never lists the
+        tree.  Later pulls list the tree of that same commit, keeping the
+        manifest and the shards consistent.
 
         Returns:
             True if manifest was downloaded, False if branch or file missing.
         """
-        entries = self._fetch_tree()
-        if entries is None:
+        ref_sha = self.client.get_ref_sha(self.branch)
+        if ref_sha is None:
+            logger.info("Branch %s does not exist", self.branch)
             return False
+        self._cached_ref_sha = ref_sha
 
-        for entry in entries:
-            entry_path = entry.get("path")
-            entry_sha = entry.get("sha")
-            if (
-                entry_path == "manifest.json"
-                and isinstance(entry_sha, str)
-                and entry.get("type") == "blob"
-            ):
-                content = self.client.get_blob_content(entry_sha)
-                self.storage_dir.mkdir(parents=True, exist_ok=True)
-                (self.storage_dir / "manifest.json").write_bytes(content)
-                logger.debug("Downloaded manifest.json")
-                return True
+        content = self.client.find_file_content(FilePath("manifest.json"), ref_sha)
+        if content is None:
+            logger.info("No manifest.json found on branch %s", self.branch)
+            return False
 
-        logger.info("No manifest.json found on branch %s", self.branch)
-        return False
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        (self.storage_dir / "manifest.json").write_text(content, encoding="utf-8")
+        logger.debug("Downloaded manifest.json")
+        return True
 
     def pull_blobs(self, blob_names: set[str]) -> int:
         """Download specific blob files from the branch.
@@ -211,8 +232,7 @@ class SelectiveGitBranchSync:
         if entries is None:
             return 0
 
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-        count = 0
+        blobs: dict[str, str] = {}
         for entry in entries:
             entry_path = entry.get("path")
             entry_sha = entry.get("sha")
@@ -222,24 +242,23 @@ class SelectiveGitBranchSync:
                 and isinstance(entry_sha, str)
                 and entry.get("type") == "blob"
             ):
-                content = self.client.get_blob_content(entry_sha)
-                (self.storage_dir / entry_path).write_bytes(content)
-                count += 1
-                logger.debug("Downloaded %s", entry_path)
+                blobs[entry_path] = entry_sha
 
+        count = self._download_blobs(blobs)
         logger.info("Pulled %d shard blobs from %s", count, self.branch)
         return count
 
     def memory_blob_names(self) -> set[str]:
-        """Return filenames matching ``*_memory.json`` from cached tree.
+        """Return filenames matching ``*_memory.json`` on the branch.
 
-        Must be called after ``pull_manifest`` (which populates the cache).
-        Returns an empty set if no tree is cached.
+        Uses the cached tree, listing it on first use.  Returns an empty
+        set if the branch does not exist.
         """
-        if self._cached_tree is None:
+        entries = self._fetch_tree()
+        if entries is None:
             return set()
         names: set[str] = set()
-        for entry in self._cached_tree:
+        for entry in entries:
             entry_path = entry.get("path")
             if (
                 isinstance(entry_path, str)
@@ -250,15 +269,16 @@ class SelectiveGitBranchSync:
         return names
 
     def embedding_blob_names(self) -> set[str]:
-        """Return filenames matching ``*_embeddings.json`` from cached tree.
+        """Return filenames matching ``*_embeddings.json`` on the branch.
 
-        Must be called after ``pull_manifest`` (which populates the cache).
-        Returns an empty set if no tree is cached.
+        Uses the cached tree, listing it on first use.  Returns an empty
+        set if the branch does not exist.
         """
-        if self._cached_tree is None:
+        entries = self._fetch_tree()
+        if entries is None:
             return set()
         names: set[str] = set()
-        for entry in self._cached_tree:
+        for entry in entries:
             entry_path = entry.get("path")
             if (
                 isinstance(entry_path, str)
@@ -278,9 +298,7 @@ class SelectiveGitBranchSync:
         if entries is None:
             return 0
 
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
-
-        count = 0
+        blobs: dict[str, str] = {}
         for entry in entries:
             entry_type = entry.get("type")
             entry_path = entry.get("path")
@@ -292,16 +310,92 @@ class SelectiveGitBranchSync:
                 continue
             if not isinstance(entry_sha, str):
                 continue
+            blobs[entry_path] = entry_sha
 
-            content = self.client.get_blob_content(entry_sha)
-            target = self.storage_dir / entry_path
-            target.write_bytes(content)
-            count += 1
-            logger.debug("Downloaded %s", entry_path)
-
+        count = self._download_blobs(blobs)
         logger.info("Pulled %d artifacts from %s", count, self.branch)
         return count
 
+    def _download_blobs(self, blobs: dict[str, str]) -> int:
+        """Write each ``name -> blob SHA`` in *blobs* into ``storage_dir``.
+
+        Blobs seen by an earlier run are served from the local artifact
+        cache: a blob SHA names its content, so an unchanged shard is never
+        downloaded twice.  The rest are JSON text, fetched in GraphQL
+        batches of ``GRAPHQL_BLOB_BATCH_SIZE``.  Blobs a batch leaves out
+        (such as shards too large for GraphQL) are downloaded one by one on
+        a thread pool.
+
+        Returns:
+            Number of files written.
+        """
+        if not blobs:
+            return 0
+        shas = list(dict.fromkeys(blobs.values()))
+
+        contents: dict[str, bytes] = {}
+        with self._artifact_cache() as cache:
+            for sha in shas:
+                cached = cache.get(sha)
+                if cached is not None:
+                    contents[sha] = cached
+            fetched = self._fetch_blobs([s for s in shas if s not in contents])
+            for sha, data in fetched.items():
+                cache.put(sha, data)
+            contents.update(fetched)
+        logger.debug(
+            "Served %d of %d artifact blobs from cache",
+            len(shas) - len(fetched),
+            len(shas),
+        )
+
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        for name, sha in blobs.items():
+            (self.storage_dir / name).write_bytes(contents[sha])
+            logger.debug("Downloaded %s", name)
+        return len(blobs)
+
+    def _fetch_blobs(self, shas: list[str]) -> dict[str, bytes]:
+        """Download *shas* from the branch, batching text through GraphQL."""
+        contents: dict[str, bytes] = {}
+        for i in range(0, len(shas), GRAPHQL_BLOB_BATCH_SIZE):
+            batch = shas[i : i + GRAPHQL_BLOB_BATCH_SIZE]
+            try:
+                texts = self.client.get_blob_texts(batch)
+            except ArgusError as e:
+                logger.warning("GraphQL blob batch failed, fetching per blob: %s", e)
+                continue
+            contents.update((sha, text.encode()) for sha, text in texts.items())
+
+        missing = [sha for sha in shas if sha not in contents]
+        if missing:
+            workers = min(_MAX_DOWNLOAD_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fetched = pool.map(self.client.get_blob_content, missing)
+                contents.update(zip(missing, fetched, strict=True))
+        return contents
+
+    def _listed_blob_shas(self, ref_sha: str | None) -> dict[str, str]:
+        """Blob SHAs by name from the cached tree, if it is *ref_sha*'s tree."""
+        if ref_sha is None or ref_sha != self._cached_ref_sha:
+            return {}
+        if self._cached_tree is None:
+            return {}
+        return {
+            path: sha
+            for entry in self._cached_tree
+            if entry.get("type") == "blob"
+            and isinstance(path := entry.get("path"), str)
+            and isinstance(sha := entry.get("sha"), str)
+        }
+
+    def _artifact_cache(self) -> SqliteCache:
+        return SqliteCache.for_storage_dir(
+            self.storage_dir,
+            ARTIFACT_CACHE_TABLE,
+            max_entries=ARTIFACT_CACHE_MAX_ENTRIES,
+        )
+
     def push(self, delete_blobs: set[str] | None = None) -> None:
         """Upload JSON artifacts from storage_dir to the branch.
 
@@ -310,6 +404,10 @@ class SelectiveGitBranchSync:
         are preserved on the branch.  Only local files are added or
         overwritten.
 
+        Files whose content matches the branch tree listed by an earlier
+        pull of the same commit are not uploaded again, and when nothing
+        differs no commit is made at all.
+
         Args:
             delete_blobs: Optional set of blob filenames to remove from
                 the branch tree (e.g. orphaned shard blobs).
@@ -321,18 +419,26 @@ class SelectiveGitBranchSync:
             logger.info("No artifacts to push, skipping")
             return
 
+        ref_sha = self.client.get_ref_sha(self.branch)
+        on_branch = self._listed_blob_shas(ref_sha)
+
         tree_entries: list[dict[str, str | None]] = []
-        for file_path in files:
-            content_b64 = base64.b64encode(file_path.read_bytes()).decode()
-            blob_sha = self.client.create_blob(content_b64)
-            tree_entries.append(
-                {
-                    "path": file_path.name,
-                    "mode": "100644",
-                    "type": "blob",
-                    "sha": blob_sha,
-                }
-            )
+        with self._artifact_cache() as cache:
+            for file_path in files:
+                data = file_path.read_bytes()
+                if on_branch.get(file_path.name) == _git_blob_sha(data):
+                    continue
+                blob_sha = self.client.create_blob(base64.b64encode(data).decode())
+                # The next run pulls these same blobs; let it read them locally.
+                cache.put(blob_sha, data)
+                tree_entries.append(
+                    {
+                        "path": file_path.name,
+                        "mode": "100644",
+                        "type": "blob",
+                        "sha": blob_sha,
+                    }
+                )
 
         # Delete orphaned blobs by setting sha to None (JSON null).
         # GitHub's Git Data API treats a null sha as a deletion when
@@ -347,8 +453,12 @@ class SelectiveGitBranchSync:
                 }
             )
 
+        if not tree_entries:
+            logger.info("Artifacts on %s are up to date, skipping push", self.branch)
+            return
+        uploaded = len(tree_entries) - len(delete_blobs or ())
+
         # Use base_tree to merge with existing branch content.
-        ref_sha = self.client.get_ref_sha(self.branch)
         base_tree: str | None = None
         if ref_sha is not None:
             base_tree = self.client.get_commit_tree_sha(ref_sha)
@@ -358,20 +468,21 @@ class SelectiveGitBranchSync:
         parents: list[str] = [ref_sha] if ref_sha else []
 
         commit_sha = self.client.create_commit(
-            message=f"chore: update argus artifacts ({len(files)} files)",
+            message=f"chore: update argus artifacts ({uploaded} files)",
             tree_sha=tree_sha,
             parents=parents,
         )
 
         if ref_sha is None:
             self.client.create_ref(f"refs/heads/{self.branch}", commit_sha)
-            logger.info("Created branch %s with %d artifacts", self.branch, len(files))
+            logger.info("Created branch %s with %d artifacts", self.branch, uploaded)
         else:
             self.client.update_ref(f"heads/{self.branch}", commit_sha)
-            logger.info("Updated branch %s with %d artifacts", self.branch, len(files))
+            logger.info("Updated branch %s with %d artifacts", self.branch, uploaded)
 
         if delete_blobs:
             logger.info("Deleted %d orphaned blobs from branch", len(delete_blobs))
 
         # Invalidate cached tree — branch state has changed.
         self._cached_tree = None
+        self._cached_ref_sha = None
@@ -91,7 +91,8 @@ def _serialize_outline(outline: CodebaseOutline) -> dict[str, object]:
     return {
         "version": outline.version,
         "entries": [
-            {"path": str(e.path), "symbols": e.symbols} for e in outline.entries
+            {"path": str(e.path), "symbols": e.symbols, "signatures": e.signatures}
+            for e in outline.entries
         ],
     }
 
@@ -123,10 +124,15 @@ def _deserialize(data: dict[str, object]) -> CodebaseMemory:
             symbols: list[str] = []
             if isinstance(raw_symbols, list):
                 symbols = [str(s) for s in cast(list[object], raw_symbols)]
+            raw_signatures = e.get("signatures", [])
+            signatures: list[str] = []
+            if isinstance(raw_signatures, list):
+                signatures = [str(s) for s in cast(list[object], raw_signatures)]
             entries.append(
                 FileOutlineEntry(
                     path=FilePath(str(e["path"])),
                     symbols=tuple(symbols),
+                    signatures=tuple(signatures),
                 )
             )
 
@@ -0,0 +1,163 @@
+"""Crash-safe journal of file entries parsed during a bootstrap run."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+
+from argus.domain.context.entities import FileEntry
+from argus.infrastructure.constants import CACHE_DIRNAME, JOURNAL_DB_FILENAME
+from argus.infrastructure.storage._serial_helpers import (
+    deserialize_entry,
+    serialize_entry,
+)
+from argus.shared.types import FilePath
+
+logger = logging.getLogger(__name__)
+
+_COMMIT_EVERY = 256
+
+# =============================================================================
+# JOURNAL
+# =============================================================================
+
+
+@dataclass
+class ParseJournal:
+    """Append-only record of entries parsed for one commit.
+
+    Each parsed entry is appended as it completes and committed in small
+    batches (SQLite WAL), so a bootstrap that dies part-way can resume at
+    the same commit without parsing those files again.  A journal written
+    for a different commit is discarded on load.  Database errors are
+    logged and disable the journal, so it never fails a run.
+    """
+
+    path: Path
+    commit_sha: str
+
+    _conn: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _uncommitted: int = field(default=0, init=False, repr=False)
+    _disabled: bool = field(default=False, init=False, repr=False)
+
+    @classmethod
+    def for_storage_dir(cls, storage_dir: Path, commit_sha: str) -> ParseJournal:
+        """Open the journal kept under ``storage_dir``'s local cache directory."""
+        return cls(
+            path=storage_dir / CACHE_DIRNAME / JOURNAL_DB_FILENAME,
+            commit_sha=commit_sha,
+        )
+
+    def load(self) -> dict[FilePath, FileEntry]:
+        """Return entries journaled for this commit, resetting any stale journal."""
+        conn = self._connect()
+        if conn is None:
+            return {}
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'commit'").fetchone()
+            if row is None or row[0] != self.commit_sha:
+                conn.execute("DELETE FROM entries")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('commit', ?)",
+                    (self.commit_sha,),
+                )
+                conn.commit()
+                return {}
+            rows = conn.execute("SELECT data FROM entries").fetchall()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return {}
+
+        entries: dict[FilePath, FileEntry] = {}
+        for (data,) in rows:
+            try:
+                entry = deserialize_entry(json.loads(data))
+            except (ValueError, TypeError, KeyError) as e:
+                logger.debug("Discarding corrupt journal record: %s", e)
+                continue
+            entries[entry.path] = entry
+        return entries
+
+    def append(self, entry: FileEntry) -> None:
+        """Record a parsed entry (durable once its batch is committed)."""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (path, data) VALUES (?, ?)",
+                (entry.path, json.dumps(serialize_entry(entry))),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= _COMMIT_EVERY:
+                conn.commit()
+                self._uncommitted = 0
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def discard(self) -> None:
+        """Delete the journal once its entries have been saved elsewhere."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                self.path.with_name(self.path.name + suffix).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Could not delete parse journal %s: %s", self.path, e)
+
+    def close(self) -> None:
+        """Commit pending records and close the connection."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Could not commit parse journal %s: %s", self.path, e)
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> ParseJournal:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None:
+            return self._conn
+        if self._disabled:
+            return None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(path TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+            return None
+        self._conn = conn
+        return conn
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning("Disabling parse journal %s: %s", self.path, error)
+        self._disabled = True
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
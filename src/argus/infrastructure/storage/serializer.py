@@ -31,10 +31,7 @@ def serialize(codebase_map: CodebaseMap) -> str:
 
 
 def _iter_entries(codebase_map: CodebaseMap) -> list[FileEntry]:
-    entries: list[FileEntry] = []
-    for path in sorted(codebase_map.files()):
-        entries.append(codebase_map.get(path))
-    return entries
+    return list(codebase_map.iter_sorted())
 
 
 # =============================================================================
@@ -56,9 +53,7 @@ def deserialize(data: str) -> CodebaseMap:
 
     codebase_map = CodebaseMap(indexed_at=CommitSHA(raw[F.INDEXED_AT]))
 
-    for entry_data in raw.get(F.ENTRIES, []):
-        entry = deserialize_entry(entry_data)
-        codebase_map.upsert(entry)
+    codebase_map.upsert_many(map(deserialize_entry, raw.get(F.ENTRIES, [])))
 
     graph = DependencyGraph()
     for edge_data in raw.get(F.EDGES, []):
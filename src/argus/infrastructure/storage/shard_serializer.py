@@ -86,9 +86,8 @@ def split_into_shards(
     """
     # Group entries by shard ID (parent directory).
     shard_entries: dict[ShardId, list[FileEntry]] = {}
-    for path in sorted(codebase_map.files()):
-        entry = codebase_map.get(path)
-        sid = shard_id_for(path)
+    for entry in codebase_map.iter_sorted():
+        sid = shard_id_for(entry.path)
         shard_entries.setdefault(sid, []).append(entry)
 
     # Classify edges as internal or cross-shard.
@@ -154,8 +153,7 @@ def assemble_from_shards(
     loaded_shards: set[ShardId] = set()
     for sid, data in shard_data.items():
         entries, edges = deserialize_shard(data)
-        for entry in entries:
-            codebase_map.upsert(entry)
+        codebase_map.upsert_many(entries)
         for edge in edges:
             codebase_map.graph.add_edge(edge)
         loaded_shards.add(sid)
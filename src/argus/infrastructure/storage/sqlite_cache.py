@@ -0,0 +1,149 @@
+"""SQLite-backed key/value store for local run-to-run caches."""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+
+from argus.infrastructure.constants import CACHE_DB_SUFFIX, CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+_TABLE_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+"""Table names are interpolated into SQL, so only plain identifiers pass."""
+
+
+@dataclass
+class SqliteCache:
+    """Namespaced key/value store persisted in a SQLite file.
+
+    Writes are batched into one transaction that is committed on
+    ``close()``.  That transaction holds the database's write lock, so
+    each ``table`` gets its own database file and caches open at the same
+    time never wait on one another.  Database errors are logged and treated
+    as cache misses, so a corrupt or unwritable cache never fails a run.
+
+    With ``max_entries``, a close that wrote anything also drops the
+    oldest-written entries beyond that many, keeping the file bounded.
+    """
+
+    path: Path
+    table: str
+    max_entries: int | None = None
+
+    _conn: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _written: bool = field(default=False, init=False, repr=False)
+    _disabled: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not _TABLE_NAME_RE.fullmatch(self.table):
+            msg = f"invalid cache table name: {self.table!r}"
+            raise ValueError(msg)
+
+    @classmethod
+    def for_storage_dir(
+        cls,
+        storage_dir: Path,
+        table: str,
+        *,
+        max_entries: int | None = None,
+    ) -> SqliteCache:
+        """Build a cache stored under ``storage_dir``'s local cache directory."""
+        path = storage_dir / CACHE_DIRNAME / f"{table}{CACHE_DB_SUFFIX}"
+        return cls(path=path, table=table, max_entries=max_entries)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value for *key*, or None on miss."""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?",  # nosec B608
+                (key,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+        return None if row is None else bytes(row[0])
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store *value* under *key* (committed on ``close``)."""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+        except sqlite3.Error as e:
+            self._disable(e)
+            return
+        self._written = True
+
+    def close(self) -> None:
+        """Commit pending writes and close the connection."""
+        if self._conn is None:
+            return
+        try:
+            if self._written and self.max_entries is not None:
+                self._evict(self._conn, self.max_entries)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Could not commit cache %s: %s", self.path, e)
+        finally:
+            self._conn.close()
+            self._conn = None
+            self._written = False
+
+    def __enter__(self) -> SqliteCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+        if self._conn is not None:
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+            return None
+        self._conn = conn
+        return conn
+
+    def _evict(self, conn: sqlite3.Connection, keep: int) -> None:
+        # INSERT OR REPLACE gives a rewritten key a fresh rowid, so rowid
+        # order is write order.  ``table`` was checked in __post_init__.
+        cursor = conn.execute(
+            f"DELETE FROM {self.table} WHERE rowid <= "  # nosec B608
+            f"(SELECT rowid FROM {self.table} ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+            (keep,),
+        )
+        if cursor.rowcount > 0:
+            logger.debug(
+                "Evicted %d entries from cache %s", cursor.rowcount, self.table
+            )
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning("Disabling cache %s (%s): %s", self.table, self.path, error)
+        self._disabled = True
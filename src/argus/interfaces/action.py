@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 import sys
 
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 from posixpath import normpath
 from typing import cast
 
@@ -24,25 +25,32 @@ from argus.domain.retrieval.services import RetrievalOrchestrator
 from argus.domain.retrieval.strategies import RetrievalStrategy
 from argus.domain.review.services import NoiseFilter
 from argus.domain.review.value_objects import PRContext
-from argus.infrastructure.constants import DATA_BRANCH
+from argus.infrastructure.constants import DATA_BRANCH, REVIEW_CACHE_MAX_ENTRIES
 from argus.infrastructure.github.client import GitHubClient
 from argus.infrastructure.github.pr_context_collector import PRContextCollector
 from argus.infrastructure.github.publisher import GitHubReviewPublisher
 from argus.infrastructure.memory.llm_analyzer import LLMPatternAnalyzer
 from argus.infrastructure.memory.outline_renderer import OutlineRenderer
+from argus.infrastructure.parsing.chunk_cache import ChunkCache
 from argus.infrastructure.parsing.chunker import Chunker, CodeChunk
 from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
 from argus.infrastructure.retrieval.agentic import AgenticRetrievalStrategy
 from argus.infrastructure.retrieval.lexical import LexicalRetrievalStrategy
 from argus.infrastructure.retrieval.structural import StructuralRetrievalStrategy
 from argus.infrastructure.storage.artifact_store import ShardedArtifactStore
+from argus.infrastructure.storage.blob_cache import (
+    BlobContentCache,
+    blob_shas_from_tree,
+)
 from argus.infrastructure.storage.git_branch_store import (
     GitBranchSync,
     SelectiveGitBranchSync,
 )
 from argus.infrastructure.storage.memory_store import FileMemoryStore
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
 from argus.interfaces.config import ActionConfig
-from argus.interfaces.review_generator import LLMReviewGenerator
+from argus.interfaces.event_utils import load_event
+from argus.interfaces.review_generator import REVIEW_CACHE_TABLE, LLMReviewGenerator
 from argus.shared.constants import (
     AGENTIC_BUDGET_RATIO,
     DEFAULT_GENERATION_BUDGET_RATIO,
@@ -84,312 +92,355 @@ def run() -> None:
 def _execute_pipeline(config: ActionConfig) -> None:
     """Wire infrastructure, build use case, and execute."""
     # 1. Parse event
-    event = _load_event(config.github_event_path)
+    event = load_event(config.github_event_path)
     pr_number = _extract_pr_number(event)
     head_sha = CommitSHA(_extract_head_sha(event))
 
     # 2. Construct infrastructure
-    client = GitHubClient(token=config.github_token, repo=config.github_repository)
-    parser = TreeSitterParser()
-    chunker = Chunker()
-    storage_path = Path(config.storage_dir)
-    sharded_store = ShardedArtifactStore(storage_dir=storage_path)
-
-    # 2b. Pull cached artifacts — try selective sharded pull first
-    selective_sync = SelectiveGitBranchSync(
-        client=client,
-        branch=DATA_BRANCH,
-        storage_dir=storage_path,
-    )
-
-    # 3. Fetch PR data
-    diff = client.get_pull_request_diff(pr_number)
-    publisher = GitHubReviewPublisher(client=client, diff=diff)
-    changed_files = _extract_changed_files(diff)
+    with GitHubClient(
+        token=config.github_token, repo=config.github_repository
+    ) as client:
+        parser = TreeSitterParser()
+        chunker = Chunker()
+        storage_path = Path(config.storage_dir)
+        sharded_store = ShardedArtifactStore(storage_dir=storage_path)
+
+        # 2b. Pull cached artifacts — try selective sharded pull first
+        selective_sync = SelectiveGitBranchSync(
+            client=client,
+            branch=DATA_BRANCH,
+            storage_dir=storage_path,
+        )
 
-    file_contents = _fetch_files_parallel(
-        client, changed_files, ref=head_sha, log_level="warning"
-    )
+        # 3. Fetch PR data
+        diff = client.get_pull_request_diff(pr_number)
+        publisher = GitHubReviewPublisher(client=client, diff=diff)
+        changed_files = _extract_changed_files(diff)
 
-    # 3b. Collect PR context (metadata, CI, comments, git health)
-    pr_context: PRContext | None = None
-    if config.enable_pr_context:
-        try:
-            collector = PRContextCollector(client=client)
-            pr_context = collector.collect(
-                pr_number=pr_number,
-                head_sha=head_sha,
-                search_related=config.search_related_issues,
-            )
-            logger.info(
-                "Collected PR context: CI=%s, %d comments, %d days open",
-                pr_context.ci_status.conclusion,
-                len(pr_context.comments),
-                pr_context.git_health.days_open,
-            )
-        except Exception:
-            logger.warning("Could not collect PR context, continuing without it")
+        file_contents = _fetch_files_parallel(
+            client, changed_files, ref=head_sha, log_level="warning"
+        )
 
-    # 4. Build codebase map — selective shard loading
-    codebase_map: CodebaseMap | None = None
-    loaded_shard_ids: set[ShardId] = set()
-    try:
-        has_manifest = selective_sync.pull_manifest()
-        if has_manifest:
-            manifest = sharded_store.load_manifest(config.github_repository)
-            if manifest is not None:
-                # Compute which shards we need: changed files + 1-hop neighbors.
-                needed = manifest.shards_for_files(changed_files)
-                adjacent = manifest.adjacent_shards(needed, hops=1)
-                all_needed = needed | adjacent
-                blob_names = {
-                    manifest.shards[sid].blob_name
-                    for sid in all_needed
-                    if sid in manifest.shards
-                }
-                # Also pull memory files (discovered from cached tree).
-                memory_blobs = selective_sync.memory_blob_names()
-                selective_sync.pull_blobs(blob_names | memory_blobs)
-                loaded_shard_ids = all_needed
-                codebase_map = sharded_store.load_shards(
-                    config.github_repository,
-                    all_needed,
+        # 3b. Collect PR context (metadata, CI, comments, git health)
+        pr_context: PRContext | None = None
+        if config.enable_pr_context:
+            try:
+                collector = PRContextCollector(client=client)
+                pr_context = collector.collect(
+                    pr_number=pr_number,
+                    head_sha=head_sha,
+                    search_related=config.search_related_issues,
                 )
                 logger.info(
-                    "Loaded %d shards (%d needed + %d adjacent)",
-                    len(all_needed),
-                    len(needed),
-                    len(adjacent),
+                    "Collected PR context: CI=%s, %d comments, %d days open",
+                    pr_context.ci_status.conclusion,
+                    len(pr_context.comments),
+                    pr_context.git_health.days_open,
                 )
-    except PublishError:
-        logger.warning("Could not pull sharded artifacts, trying legacy")
-
-    if codebase_map is None:
-        # Fallback to legacy full pull.
-        legacy_sync = GitBranchSync(
-            client=client,
-            branch=DATA_BRANCH,
+            except Exception:
+                logger.warning("Could not collect PR context, continuing without it")
+
+        # 4. Build codebase map — selective shard loading
+        codebase_map, loaded_shard_ids = _load_codebase_map(
+            client,
+            selective_sync,
+            sharded_store,
+            repo=config.github_repository,
             storage_dir=storage_path,
+            changed_files=changed_files,
+            head_sha=head_sha,
         )
-        try:
-            legacy_sync.pull()
-        except PublishError:
-            logger.warning(
-                "Could not pull artifacts from %s, starting fresh",
-                DATA_BRANCH,
-            )
-        existing_map = sharded_store.load_or_migrate(config.github_repository)
-        if existing_map is not None:
-            codebase_map = existing_map
-        else:
-            codebase_map = CodebaseMap(indexed_at=head_sha)
-
-    for path, content in file_contents.items():
-        try:
-            entry = parser.parse(path, content)
-            codebase_map.upsert(entry)
-        except (IndexingError, ArgusError) as e:
-            logger.debug("Skipping unparseable file for retrieval: %s (%s)", path, e)
-
-    # 5. Build chunks for lexical retrieval from context files (non-changed)
-    changed_set = set(changed_files)
-    context_paths = [p for p in codebase_map.files() if p not in changed_set]
-    context_contents = _fetch_files_parallel(client, context_paths, ref=head_sha)
-
-    chunks: list[CodeChunk] = []
-    for path, content in context_contents.items():
-        if path in codebase_map:
-            entry = codebase_map.get(path)
-            chunks.extend(chunker.chunk(path, content, entry.symbols))
 
-    logger.info(
-        "Built %d chunks from %d context files for lexical retrieval",
-        len(chunks),
-        len(context_contents),
-    )
-
-    # 6. Build retrieval strategies
-    model_config = ModelConfig(
-        model=config.model,
-        max_tokens=TokenCount(config.max_tokens),
-        temperature=config.temperature,
-    )
-    token_budget = TokenBudget(
-        total=TokenCount(config.max_tokens),
-        retrieval_ratio=DEFAULT_RETRIEVAL_BUDGET_RATIO,
-        generation_ratio=DEFAULT_GENERATION_BUDGET_RATIO,
-    )
+        for path, content in file_contents.items():
+            try:
+                entry = parser.parse(path, content)
+                codebase_map.upsert(entry)
+            except (IndexingError, ArgusError) as e:
+                logger.debug(
+                    "Skipping unparseable file for retrieval: %s (%s)", path, e
+                )
 
-    strategies: list[RetrievalStrategy] = [
-        StructuralRetrievalStrategy(codebase_map=codebase_map),
-        LexicalRetrievalStrategy(chunks=chunks),
-    ]
+        # 5. Build chunks for lexical retrieval from context files (non-changed)
+        changed_set = set(changed_files)
+        context_paths = [p for p in codebase_map.files() if p not in changed_set]
+        chunks: list[CodeChunk] = []
+        context_file_count = 0
+        with (
+            BlobContentCache.for_storage_dir(storage_path) as blob_cache,
+            ChunkCache.for_storage_dir(storage_path) as chunk_cache,
+        ):
+            # Chunk each file as it arrives so only one file's content is live.
+            for path, content in _iter_context_files(
+                client, context_paths, ref=head_sha, blob_cache=blob_cache
+            ):
+                context_file_count += 1
+                entry = codebase_map.get(path)
+                chunks.extend(
+                    chunk_cache.get_or_compute(
+                        path, content, entry.symbols, chunker.chunk
+                    )
+                )
 
-    retrieval_budget = token_budget.retrieval_tokens
-    strategy_budgets: list[TokenCount] = [
-        TokenCount(int(retrieval_budget * STRUCTURAL_BUDGET_RATIO)),
-        TokenCount(int(retrieval_budget * LEXICAL_BUDGET_RATIO)),
-    ]
+        logger.info(
+            "Built %d chunks from %d context files for lexical retrieval",
+            len(chunks),
+            context_file_count,
+        )
 
-    if config.enable_agentic:
-        agentic_outline_text: str | None = None
-        if config.review_depth != ReviewDepth.QUICK:
-            agentic_renderer = OutlineRenderer(
-                token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET,
-            )
-            agentic_outline_text, _ = agentic_renderer.render_full(codebase_map)
-
-        strategies.append(
-            AgenticRetrievalStrategy(
-                config=model_config,
-                client=client,
-                ref=head_sha,
-                chunks=chunks,
-                outline_text=agentic_outline_text,
-            )
+        # 6. Build retrieval strategies
+        model_config = ModelConfig(
+            model=config.model,
+            max_tokens=TokenCount(config.max_tokens),
+            temperature=config.temperature,
         )
-        strategy_budgets.append(
-            TokenCount(int(retrieval_budget * AGENTIC_BUDGET_RATIO)),
+        token_budget = TokenBudget(
+            total=TokenCount(config.max_tokens),
+            retrieval_ratio=DEFAULT_RETRIEVAL_BUDGET_RATIO,
+            generation_ratio=DEFAULT_GENERATION_BUDGET_RATIO,
         )
 
-    if config.embedding_model:
-        try:
-            from argus.infrastructure.retrieval.embeddings import (
-                create_embedding_provider,
+        strategies: list[RetrievalStrategy] = [
+            StructuralRetrievalStrategy(codebase_map=codebase_map),
+            LexicalRetrievalStrategy(chunks=chunks),
+        ]
+
+        retrieval_budget = token_budget.retrieval_tokens
+        strategy_budgets: list[TokenCount] = [
+            TokenCount(int(retrieval_budget * STRUCTURAL_BUDGET_RATIO)),
+            TokenCount(int(retrieval_budget * LEXICAL_BUDGET_RATIO)),
+        ]
+
+        if config.enable_agentic:
+            agentic_outline_text: str | None = None
+            if config.review_depth != ReviewDepth.QUICK:
+                agentic_renderer = OutlineRenderer(
+                    token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET,
+                )
+                agentic_outline_text, _ = agentic_renderer.render_full(codebase_map)
+
+            strategies.append(
+                AgenticRetrievalStrategy(
+                    config=model_config,
+                    client=client,
+                    ref=head_sha,
+                    chunks=chunks,
+                    outline_text=agentic_outline_text,
+                )
             )
-            from argus.infrastructure.retrieval.semantic import (
-                SemanticRetrievalStrategy,
+            strategy_budgets.append(
+                TokenCount(int(retrieval_budget * AGENTIC_BUDGET_RATIO)),
             )
 
-            # Pull embedding blobs from remote.
-            embedding_blobs = selective_sync.embedding_blob_names()
-            if embedding_blobs:
-                selective_sync.pull_blobs(embedding_blobs)
-
-            # Load embedding indices for needed shards.
-            embedding_indices = sharded_store.load_embedding_indices(
-                loaded_shard_ids,
-                model=config.embedding_model,
-            )
-            if embedding_indices:
-                emb_provider = create_embedding_provider(config.embedding_model)
-                strategies.append(
-                    SemanticRetrievalStrategy(
-                        provider=emb_provider,
-                        embedding_indices=embedding_indices,
-                        chunks=chunks,
-                    )
+        if config.embedding_model:
+            try:
+                from argus.infrastructure.retrieval.embeddings import (
+                    create_embedding_provider,
                 )
-                strategy_budgets.append(
-                    TokenCount(int(retrieval_budget * SEMANTIC_BUDGET_RATIO)),
+                from argus.infrastructure.retrieval.semantic import (
+                    SemanticRetrievalStrategy,
                 )
-                logger.info(
-                    "Semantic retrieval enabled with %d embedding indices",
-                    len(embedding_indices),
+
+                # Pull embedding blobs from remote.
+                embedding_blobs = selective_sync.embedding_blob_names()
+                if embedding_blobs:
+                    selective_sync.pull_blobs(embedding_blobs)
+
+                # Load embedding indices for needed shards.
+                embedding_indices = sharded_store.load_embedding_indices(
+                    loaded_shard_ids,
+                    model=config.embedding_model,
+                )
+                if embedding_indices:
+                    emb_provider = create_embedding_provider(config.embedding_model)
+                    strategies.append(
+                        SemanticRetrievalStrategy(
+                            provider=emb_provider,
+                            embedding_indices=embedding_indices,
+                            chunks=chunks,
+                        )
+                    )
+                    strategy_budgets.append(
+                        TokenCount(int(retrieval_budget * SEMANTIC_BUDGET_RATIO)),
+                    )
+                    logger.info(
+                        "Semantic retrieval enabled with %d embedding indices",
+                        len(embedding_indices),
+                    )
+            except Exception:
+                logger.warning(
+                    "Could not initialize semantic retrieval, continuing without it"
                 )
-        except Exception:
-            logger.warning(
-                "Could not initialize semantic retrieval, continuing without it"
-            )
 
-    orchestrator = RetrievalOrchestrator(
-        strategies=strategies,
-        budget=retrieval_budget,
-        strategy_budgets=strategy_budgets,
-    )
+        orchestrator = RetrievalOrchestrator(
+            strategies=strategies,
+            budget=retrieval_budget,
+            strategy_budgets=strategy_budgets,
+        )
 
-    # 7. Wire review generator + noise filter
-    review_generator = LLMReviewGenerator(config=model_config)
-    noise_filter = NoiseFilter(
-        confidence_threshold=config.confidence_threshold,
-        ignored_paths=[FilePath(p) for p in config.ignored_paths],
-    )
+        # 7. Wire review generator + noise filter
+        review_cache = SqliteCache.for_storage_dir(
+            storage_path, REVIEW_CACHE_TABLE, max_entries=REVIEW_CACHE_MAX_ENTRIES
+        )
+        review_generator = LLMReviewGenerator(
+            config=model_config, response_cache=review_cache
+        )
+        noise_filter = NoiseFilter(
+            confidence_threshold=config.confidence_threshold,
+            ignored_paths=[FilePath(p) for p in config.ignored_paths],
+        )
+
+        # 8. Wire memory components (based on review depth)
+        outline_renderer = None
+        memory_store = None
+        profile_service = None
+
+        if config.review_depth != ReviewDepth.QUICK:
+            outline_renderer = OutlineRenderer(
+                token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET,
+            )
 
-    # 8. Wire memory components (based on review depth)
-    outline_renderer = None
-    memory_store = None
-    profile_service = None
+            if config.review_depth == ReviewDepth.DEEP:
+                memory_store = FileMemoryStore(
+                    storage_dir=Path(config.storage_dir),
+                )
+                analyzer = LLMPatternAnalyzer(config=model_config)
+                profile_service = ProfileService(analyzer=analyzer)
+
+        # 9. Wire use case
+        indexing_service = IndexingService(parser=parser, repository=sharded_store)
+        use_case = ReviewPullRequest(
+            indexing_service=indexing_service,
+            repository=sharded_store,
+            orchestrator=orchestrator,
+            review_generator=review_generator,
+            noise_filter=noise_filter,
+            publisher=publisher,
+            outline_renderer=outline_renderer,
+            memory_repository=memory_store,
+            profile_service=profile_service,
+        )
 
-    if config.review_depth != ReviewDepth.QUICK:
-        outline_renderer = OutlineRenderer(
-            token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET,
+        # 10. Execute
+        cmd = ReviewPullRequestCommand(
+            repo_id=config.github_repository,
+            pr_number=pr_number,
+            commit_sha=head_sha,
+            diff=diff,
+            changed_files=changed_files,
+            file_contents=file_contents,
+            review_depth=config.review_depth,
+            preloaded_map=codebase_map,
+            pr_context=pr_context,
         )
 
-        if config.review_depth == ReviewDepth.DEEP:
-            memory_store = FileMemoryStore(
-                storage_dir=Path(config.storage_dir),
+        with review_cache:
+            result = use_case.execute(cmd)
+
+        # Aggregate LLM usage: generation + agentic retrieval
+        generation_usage = result.llm_usage
+        agentic_usage = LLMUsage()
+        agentic_strategy: AgenticRetrievalStrategy | None = None
+        for strategy in strategies:
+            if isinstance(strategy, AgenticRetrievalStrategy):
+                agentic_strategy = strategy
+                break
+        if agentic_strategy is not None:
+            agentic_usage = agentic_strategy.last_llm_usage
+        total_usage = generation_usage + agentic_usage
+
+        logger.info(
+            "Review complete: %d comments, %d context items",
+            len(result.review),
+            result.context_items_used,
+        )
+        logger.info(
+            "  Retrieval: %d context tokens",
+            result.tokens_used,
+        )
+        logger.info(
+            "  LLM API: %d tokens (%d input + %d output) across %d requests",
+            total_usage.total_tokens,
+            total_usage.input_tokens,
+            total_usage.output_tokens,
+            total_usage.requests,
+        )
+        logger.info(
+            "    Generation: %d tokens (%d requests)",
+            generation_usage.total_tokens,
+            generation_usage.requests,
+        )
+        if agentic_usage.requests > 0:
+            logger.info(
+                "    Agentic retrieval: %d tokens (%d requests)",
+                agentic_usage.total_tokens,
+                agentic_usage.requests,
             )
-            analyzer = LLMPatternAnalyzer(config=model_config)
-            profile_service = ProfileService(analyzer=analyzer)
-
-    # 9. Wire use case
-    indexing_service = IndexingService(parser=parser, repository=sharded_store)
-    use_case = ReviewPullRequest(
-        indexing_service=indexing_service,
-        repository=sharded_store,
-        orchestrator=orchestrator,
-        review_generator=review_generator,
-        noise_filter=noise_filter,
-        publisher=publisher,
-        outline_renderer=outline_renderer,
-        memory_repository=memory_store,
-        profile_service=profile_service,
-    )
 
-    # 10. Execute
-    cmd = ReviewPullRequestCommand(
-        repo_id=config.github_repository,
-        pr_number=pr_number,
-        commit_sha=head_sha,
-        diff=diff,
-        changed_files=changed_files,
-        file_contents=file_contents,
-        review_depth=config.review_depth,
-        preloaded_map=codebase_map,
-        pr_context=pr_context,
-    )
 
-    result = use_case.execute(cmd)
+def _load_codebase_map(
+    client: GitHubClient,
+    selective_sync: SelectiveGitBranchSync,
+    sharded_store: ShardedArtifactStore,
+    *,
+    repo: str,
+    storage_dir: Path,
+    changed_files: list[FilePath],
+    head_sha: CommitSHA,
+) -> tuple[CodebaseMap, set[ShardId]]:
+    """Load the cached codebase map, parsing the manifest only once.
 
-    # Aggregate LLM usage: generation + agentic retrieval
-    generation_usage = result.llm_usage
-    agentic_usage = LLMUsage()
-    agentic_strategy: AgenticRetrievalStrategy | None = None
-    for strategy in strategies:
-        if isinstance(strategy, AgenticRetrievalStrategy):
-            agentic_strategy = strategy
-            break
-    if agentic_strategy is not None:
-        agentic_usage = agentic_strategy.last_llm_usage
-    total_usage = generation_usage + agentic_usage
+    Prefers a selective pull of the shards around *changed_files*, then
+    falls back to a legacy full pull, then to an empty map.
 
-    logger.info(
-        "Review complete: %d comments, %d context items",
-        len(result.review),
-        result.context_items_used,
-    )
-    logger.info(
-        "  Retrieval: %d context tokens",
-        result.tokens_used,
-    )
-    logger.info(
-        "  LLM API: %d tokens (%d input + %d output) across %d requests",
-        total_usage.total_tokens,
-        total_usage.input_tokens,
-        total_usage.output_tokens,
-        total_usage.requests,
-    )
-    logger.info(
-        "    Generation: %d tokens (%d requests)",
-        generation_usage.total_tokens,
-        generation_usage.requests,
+    Returns:
+        Tuple of (codebase map, IDs of the shards that were loaded).
+    """
+    try:
+        if selective_sync.pull_manifest():
+            manifest = sharded_store.load_manifest(repo)
+            if manifest is not None:
+                # Compute which shards we need: changed files + 1-hop neighbors.
+                needed = manifest.shards_for_files(changed_files)
+                adjacent = manifest.adjacent_shards(needed, hops=1)
+                all_needed = needed | adjacent
+                blob_names = {
+                    manifest.shards[sid].blob_name
+                    for sid in all_needed
+                    if sid in manifest.shards
+                }
+                # Also pull memory files (discovered from cached tree).
+                memory_blobs = selective_sync.memory_blob_names()
+                selective_sync.pull_blobs(blob_names | memory_blobs)
+                codebase_map = sharded_store.load_shards(
+                    repo, all_needed, manifest=manifest
+                )
+                logger.info(
+                    "Loaded %d shards (%d needed + %d adjacent)",
+                    len(all_needed),
+                    len(needed),
+                    len(adjacent),
+                )
+                return codebase_map, all_needed
+    except PublishError:
+        logger.warning("Could not pull sharded artifacts, trying legacy")
+
+    # Fallback to legacy full pull.
+    legacy_sync = GitBranchSync(
+        client=client,
+        branch=DATA_BRANCH,
+        storage_dir=storage_dir,
     )
-    if agentic_usage.requests > 0:
-        logger.info(
-            "    Agentic retrieval: %d tokens (%d requests)",
-            agentic_usage.total_tokens,
-            agentic_usage.requests,
+    try:
+        legacy_sync.pull()
+    except PublishError:
+        logger.warning(
+            "Could not pull artifacts from %s, starting fresh",
+            DATA_BRANCH,
         )
+    existing_map = sharded_store.load_or_migrate(repo)
+    if existing_map is not None:
+        return existing_map, set()
+    return CodebaseMap(indexed_at=head_sha), set()
 
 
 _MAX_FETCH_WORKERS = 8
@@ -413,10 +464,23 @@ def _fetch_files_parallel(
     Returns:
         Mapping of path to content for successfully fetched files.
     """
+    return dict(_iter_files_parallel(client, paths, ref=ref, log_level=log_level))
+
+
+def _iter_files_parallel(
+    client: GitHubClient,
+    paths: list[FilePath],
+    *,
+    ref: str,
+    log_level: str = "debug",
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` pairs as parallel fetches complete.
+
+    Files that fail to fetch are logged at *log_level* and skipped.
+    """
     if not paths:
-        return {}
+        return
 
-    results: dict[FilePath, str] = {}
     log_fn = logger.warning if log_level == "warning" else logger.debug
 
     with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as pool:
@@ -426,23 +490,61 @@ def _fetch_files_parallel(
         for future in as_completed(futures):
             path = futures[future]
             try:
-                results[path] = future.result()
+                content = future.result()
             except (ArgusError, httpx.HTTPError) as exc:
                 log_fn("Could not fetch %s: %s", path, exc)
+                continue
+            yield path, content
 
-    return results
 
+def _iter_context_files(
+    client: GitHubClient,
+    paths: list[FilePath],
+    *,
+    ref: str,
+    blob_cache: BlobContentCache,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield context files, serving unchanged blobs from the local cache.
+
+    One recursive tree request maps each path to its blob SHA at *ref*;
+    files whose blob is already cached skip the per-file fetch.  The rest
+    are yielded as their fetches complete and added to the cache, so the
+    caller can process each file without holding every file in memory.
+    """
+    if not paths:
+        return
 
-def _load_event(event_path: str) -> dict[str, object]:
-    """Load the GitHub event JSON file."""
     try:
-        with Path(event_path).open() as f:
-            result: dict[str, object] = json.load(f)
-            return result
-    except FileNotFoundError as e:
-        raise ConfigurationError(f"Event file not found: {event_path}") from e
-    except json.JSONDecodeError as e:
-        raise ConfigurationError(f"Invalid event JSON: {e}") from e
+        tree_entries, _truncated = client.get_tree_recursive(ref)
+    except PublishError as e:
+        logger.warning("Could not fetch tree for blob cache, fetching all: %s", e)
+        yield from _iter_files_parallel(client, paths, ref=ref)
+        return
+
+    blob_shas = blob_shas_from_tree(tree_entries)
+
+    misses: list[FilePath] = []
+    for path in paths:
+        sha = blob_shas.get(path)
+        cached = blob_cache.get(sha) if sha else None
+        if cached is None:
+            misses.append(path)
+        else:
+            yield path, cached
+
+    fetched = 0
+    for path, content in _iter_files_parallel(client, misses, ref=ref):
+        sha = blob_shas.get(path)
+        if sha:
+            blob_cache.put(sha, content)
+        fetched += 1
+        yield path, content
+
+    logger.info(
+        "Context files: %d served from blob cache, %d fetched",
+        len(paths) - len(misses),
+        fetched,
+    )
 
 
 def _extract_pr_number(event: dict[str, object]) -> int:
@@ -480,17 +582,19 @@ def _extract_head_sha(event: dict[str, object]) -> str:
     raise ConfigurationError(msg)
 
 
+_DIFF_NEW_PATH_RE = re.compile(r"^\+\+\+ b/([^\r\n]+)", re.MULTILINE)
+
+
 def _extract_changed_files(diff: str) -> list[FilePath]:
     """Parse file paths from a unified diff."""
     files: list[FilePath] = []
-    for line in diff.splitlines():
-        if line.startswith("+++ b/"):
-            path = line[6:]
-            normalized = normpath(path)
-            if normalized.startswith("..") or PurePosixPath(normalized).is_absolute():
-                logger.warning("Skipping suspicious path: %s", path)
-                continue
-            files.append(FilePath(path))
+    for match in _DIFF_NEW_PATH_RE.finditer(diff):
+        path = match.group(1)
+        normalized = normpath(path)
+        if normalized.startswith(("..", "/")):
+            logger.warning("Skipping suspicious path: %s", path)
+            continue
+        files.append(FilePath(path))
     return files
 
 
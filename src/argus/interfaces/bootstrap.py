@@ -7,28 +7,42 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
 import sys
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import httpx
 
-from argus.domain.context.entities import CodebaseMap
+from argus.domain.context.entities import CodebaseMap, FileEntry
 from argus.domain.llm.value_objects import ModelConfig
 from argus.domain.memory.services import ProfileService
 from argus.domain.memory.value_objects import CodebaseMemory
+from argus.infrastructure.constants import GRAPHQL_BLOB_BATCH_SIZE
 from argus.infrastructure.github.client import GitHubClient
-from argus.infrastructure.memory.llm_analyzer import LLMPatternAnalyzer
 from argus.infrastructure.memory.outline_renderer import OutlineRenderer
+from argus.infrastructure.parsing.parse_cache import ParseCache
+from argus.infrastructure.parsing.parse_pool import POOL_MIN_FILES, parse_files
 from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
+from argus.infrastructure.retrieval.embeddings.batching import (
+    EMBED_BATCH_SIZE,
+    embed_in_batches,
+)
 from argus.infrastructure.storage.artifact_store import ShardedArtifactStore
+from argus.infrastructure.storage.blob_cache import (
+    BlobContentCache,
+    blob_shas_from_tree,
+)
+from argus.infrastructure.storage.content_store import FileContentStore
 from argus.infrastructure.storage.memory_store import FileMemoryStore
+from argus.infrastructure.storage.parse_journal import ParseJournal
 from argus.interfaces.env_utils import require_env
 from argus.interfaces.toml_config import load_argus_config
 from argus.shared.constants import DEFAULT_OUTLINE_TOKEN_BUDGET, MAX_FILE_SIZE_BYTES
-from argus.shared.exceptions import ArgusError, IndexingError
+from argus.shared.exceptions import ArgusError, PublishError
 from argus.shared.types import CommitSHA, FilePath, TokenCount
 
 logger = logging.getLogger(__name__)
@@ -64,6 +78,13 @@ def get_parseable_extensions(
     """Build the set of parseable extensions, including user extras."""
     if not extra:
         return PARSEABLE_EXTENSIONS
+    return _parseable_extensions(tuple(extra))
+
+
+@functools.cache
+def _parseable_extensions(extra: tuple[str, ...]) -> frozenset[str]:
+    # One shared frozenset per extras list, so its hash is computed once and
+    # per-set caches keyed on it (e.g. sync_index suffixes) keep hitting.
     extras: set[str] = set()
     for ext in extra:
         ext = ext.strip()
@@ -98,175 +119,386 @@ def _execute_bootstrap() -> None:
     repo = require_env("GITHUB_REPOSITORY")
     storage_dir = Path(cfg.storage_dir)
 
-    client = GitHubClient(token=token, repo=repo)
-    parser = TreeSitterParser()
-    sharded_store = ShardedArtifactStore(storage_dir=storage_dir)
-    memory_store = FileMemoryStore(storage_dir=storage_dir)
-
-    # 1. Get the default branch SHA and full tree.
-    logger.info("Fetching repository tree for %s...", repo)
-    head_sha = client.get_repo_default_branch_sha()
-    tree_entries, was_truncated = client.get_tree_recursive(head_sha)
-    if was_truncated:
-        logger.warning("Repository tree was truncated; codebase map will be incomplete")
-
-    # 2. Filter to parseable source files.
-    parseable = get_parseable_extensions(cfg.extra_extensions)
-    source_paths: list[str] = []
+    with GitHubClient(token=token, repo=repo) as client:
+        parser = TreeSitterParser()
+        sharded_store = ShardedArtifactStore(storage_dir=storage_dir)
+        memory_store = FileMemoryStore(storage_dir=storage_dir)
+
+        # 1. Get the default branch SHA and full tree.
+        logger.info("Fetching repository tree for %s...", repo)
+        head_sha = client.get_repo_default_branch_sha()
+        tree_entries, was_truncated = client.get_tree_recursive(head_sha)
+
+        # 2. Filter to parseable source files.
+        extensions = get_parseable_extensions(cfg.extra_extensions)
+        source_paths, repo_bytes = _select_source_paths(tree_entries, extensions)
+
+        logger.info("Found %d parseable source files", len(source_paths))
+
+        # One tarball download beats a request per file, unless the archive
+        # would be too large (GitHub also caps tarballs at a few hundred MB).
+        # The tarball holds every file, so it also covers a truncated tree.
+        use_tarball = 0 < repo_bytes <= cfg.tarball_max_mb * _BYTES_PER_MB
+        if was_truncated and use_tarball:
+            logger.warning(
+                "Repository tree was truncated; selecting sources from tarball"
+            )
+        elif was_truncated:
+            logger.warning(
+                "Repository tree was truncated; codebase map will be incomplete"
+            )
+
+        # 3. Fetch file contents in parallel and build codebase map.  Files are
+        # parsed as each fetch completes (across worker processes for large
+        # repos), so parsing overlaps with the remaining network I/O.  Contents
+        # are only needed again for embeddings, so they are spilled to disk
+        # rather than kept in memory through pattern analysis.  They are also
+        # seeded into the local blob cache, so later reviews can serve
+        # unchanged context files without fetching them again.
+        codebase_map = CodebaseMap(indexed_at=CommitSHA(head_sha))
+        fps = [FilePath(p) for p in source_paths]
+        file_contents = FileContentStore() if cfg.embedding_model else None
+        blob_shas = blob_shas_from_tree(tree_entries)
+
+        # Parsed entries are journaled as they complete, so a run that dies
+        # before saving resumes at the same commit without re-parsing them.
+        # Their contents are still fetched when embeddings need them.
+        journal = ParseJournal.for_storage_dir(storage_dir, head_sha)
+        resumed = journal.load()
+        for entry in resumed.values():
+            codebase_map.upsert(entry)
+        if resumed:
+            logger.info("Resuming bootstrap: %d files already parsed", len(resumed))
+        to_parse = [fp for fp in fps if fp not in resumed]
+        if file_contents is None:
+            fps = to_parse
+
+        fetched = len(resumed)
+        with (
+            BlobContentCache.for_storage_dir(storage_dir) as blob_cache,
+            ParseCache.for_storage_dir(storage_dir) as parse_cache,
+            journal,
+        ):
+            sources = _iter_source_files(
+                client,
+                fps,
+                ref=head_sha,
+                use_tarball=use_tarball,
+                max_workers=cfg.fetch_concurrency,
+                extensions=extensions if was_truncated else None,
+                blob_shas=blob_shas,
+            )
+            recorded = _record_contents(
+                sources,
+                file_contents=file_contents,
+                blob_cache=blob_cache,
+                blob_shas=blob_shas,
+            )
+            unparsed = (item for item in recorded if item[0] not in resumed)
+            use_pool = len(to_parse) >= POOL_MIN_FILES
+            parsed = parse_files(parser, unparsed, use_pool=use_pool, cache=parse_cache)
+            for fp, outcome in parsed:
+                if isinstance(outcome, ArgusError):
+                    logger.debug("Skipping %s: %s", fp, outcome)
+                    continue
+                codebase_map.upsert(outcome)
+                journal.append(outcome)
+                fetched += 1
+
+        logger.info("Parsed %d files into codebase map", fetched)
+
+        # Start rendering the full outline now; it only reads the map, so it
+        # overlaps with the artifact I/O and compare call below.  A thread
+        # avoids pickling the whole map into a worker process.
+        outline_renderer = OutlineRenderer(token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET)
+        render_pool = ThreadPoolExecutor(max_workers=1)
+        full_render = render_pool.submit(outline_renderer.render_full, codebase_map)
+        render_pool.shutdown(wait=False)
+
+        # 4. Load existing artifacts before overwriting.
+        existing_memory = memory_store.load(repo)
+        existing_map = sharded_store.load_or_migrate(repo)
+
+        # 5. Save the new codebase map (sharded format).
+        sharded_store.save_full(repo, codebase_map)
+        journal.discard()
+        logger.info("Saved codebase map artifact (sharded)")
+
+        # 6. Render outline and build memory profile.
+        model_config = ModelConfig(
+            model=cfg.model,
+            max_tokens=TokenCount(cfg.max_tokens),
+            temperature=0.0,
+        )
+        # Deferred: pydantic-ai is slow to import, and sync_index imports this
+        # module on every push without needing an LLM.
+        from argus.infrastructure.memory.llm_analyzer import LLMPatternAnalyzer
+
+        analyzer = LLMPatternAnalyzer(config=model_config)
+        profile_service = ProfileService(analyzer=analyzer)
+
+        logger.info("Analyzing codebase patterns...")
+        if existing_memory is not None and existing_map is not None:
+            # Incremental: only analyze changed files for new patterns.
+            # Use analyzed_at (last pattern analysis SHA) if available,
+            # falling back to indexed_at for backwards compatibility.
+            prev_sha = existing_memory.analyzed_at or existing_map.indexed_at
+            changed_paths = client.compare_commits(prev_sha, head_sha)
+            changed_files = [FilePath(p) for p in changed_paths]
+            logger.info(
+                "Found existing memory (version %d, %d patterns), "
+                "analyzing %d changed files incrementally",
+                existing_memory.version,
+                len(existing_memory.patterns),
+                len(changed_files),
+            )
+            # Always render the full outline for storage.
+            _full_text, full_outline = full_render.result()
+            if changed_files:
+                # Scoped outline text for LLM analysis; full outline for storage.
+                outline_text, _scoped = outline_renderer.render(
+                    codebase_map,
+                    changed_files,
+                )
+                memory = profile_service.update_profile(
+                    existing_memory,
+                    full_outline,
+                    outline_text,
+                    analyzed_at=CommitSHA(head_sha),
+                )
+            else:
+                logger.info("No files changed, keeping existing patterns")
+                memory = CodebaseMemory(
+                    repo_id=existing_memory.repo_id,
+                    outline=full_outline,
+                    patterns=existing_memory.patterns,
+                    version=existing_memory.version,
+                    analyzed_at=CommitSHA(head_sha),
+                )
+        else:
+            # Fresh: analyze the full codebase.
+            outline_text, outline = full_render.result()
+            memory = profile_service.build_profile(
+                repo, outline, outline_text, analyzed_at=CommitSHA(head_sha)
+            )
+        memory_store.save(memory)
+
+        # 7. Optionally build embedding indices.
+        if cfg.embedding_model and file_contents is not None:
+            with file_contents:
+                _build_embeddings(
+                    embedding_model=cfg.embedding_model,
+                    codebase_map=codebase_map,
+                    file_contents=file_contents,
+                    sharded_store=sharded_store,
+                    repo=repo,
+                )
+
+        logger.info(
+            "Bootstrap complete: %d files, %d patterns (version %d)",
+            memory.outline.file_count,
+            len(memory.patterns),
+            memory.version,
+        )
+
+
+_MAX_FETCH_WORKERS = 8
+_BYTES_PER_MB = 1024 * 1024
+_EMBED_SAVE_WORKERS = 2
+
+
+def _select_source_paths(
+    tree_entries: list[dict[str, object]],
+    extensions: frozenset[str],
+) -> tuple[list[str], int]:
+    """Pick parseable, size-limited blobs from a recursive tree listing.
+
+    Paths come back largest first.  Files are fetched and handed to the
+    parse pool in this order, so the slowest parses start early instead
+    of leaving one worker busy after the rest have finished.
+
+    Returns:
+        Tuple of (source paths, total size in bytes of all blobs).
+    """
+    suffixes = tuple(extensions)  # str.endswith(tuple) matches in C
+    sized_paths: list[tuple[int, str]] = []
+    repo_bytes = 0
     for entry in tree_entries:
         if entry.get("type") != "blob":
             continue
-        path = str(entry.get("path", ""))
         size = entry.get("size", 0)
-        if isinstance(size, int) and size > MAX_FILE_SIZE_BYTES:
-            continue
-        ext = "." + path.rsplit(".", 1)[-1] if "." in path else ""
-        if ext in parseable:
-            source_paths.append(path)
-
-    logger.info("Found %d parseable source files", len(source_paths))
-
-    # 3. Fetch file contents in parallel and build codebase map.
-    codebase_map = CodebaseMap(indexed_at=CommitSHA(head_sha))
-    fps = [FilePath(p) for p in source_paths]
-    file_contents = _fetch_files_parallel(client, fps, ref=head_sha)
+        if not isinstance(size, int):
+            size = 0
+        repo_bytes += size
+        path = str(entry.get("path", ""))
+        if size <= MAX_FILE_SIZE_BYTES and path.endswith(suffixes):
+            sized_paths.append((size, path))
+    sized_paths.sort(key=lambda item: item[0], reverse=True)  # stable for ties
+    return [path for _, path in sized_paths], repo_bytes
 
-    fetched = 0
-    for fp, content in file_contents.items():
-        try:
-            entry = parser.parse(fp, content)
-            codebase_map.upsert(entry)
-            fetched += 1
-        except (IndexingError, ArgusError) as e:
-            logger.debug("Skipping %s: %s", fp, e)
 
-    logger.info("Parsed %d files into codebase map", fetched)
+def _source_file_filter(extensions: frozenset[str]) -> Callable[[str, int], bool]:
+    """Build a ``(path, size)`` predicate matching ``_select_source_paths``."""
+    suffixes = tuple(extensions)
 
-    # 4. Load existing artifacts before overwriting.
-    existing_memory = memory_store.load(repo)
-    existing_map = sharded_store.load_or_migrate(repo)
+    def include(path: str, size: int) -> bool:
+        return size <= MAX_FILE_SIZE_BYTES and path.endswith(suffixes)
 
-    # 5. Save the new codebase map (sharded format).
-    sharded_store.save_full(repo, codebase_map)
-    logger.info("Saved codebase map artifact (sharded)")
+    return include
 
-    # 6. Render outline and build memory profile.
-    outline_renderer = OutlineRenderer(token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET)
 
-    model_config = ModelConfig(
-        model=cfg.model,
-        max_tokens=TokenCount(cfg.max_tokens),
-        temperature=0.0,
-    )
-    analyzer = LLMPatternAnalyzer(config=model_config)
-    profile_service = ProfileService(analyzer=analyzer)
-
-    logger.info("Analyzing codebase patterns...")
-    if existing_memory is not None and existing_map is not None:
-        # Incremental: only analyze changed files for new patterns.
-        # Use analyzed_at (last pattern analysis SHA) if available,
-        # falling back to indexed_at for backwards compatibility.
-        prev_sha = existing_memory.analyzed_at or existing_map.indexed_at
-        changed_paths = client.compare_commits(prev_sha, head_sha)
-        changed_files = [FilePath(p) for p in changed_paths]
-        logger.info(
-            "Found existing memory (version %d, %d patterns), "
-            "analyzing %d changed files incrementally",
-            existing_memory.version,
-            len(existing_memory.patterns),
-            len(changed_files),
-        )
-        # Always render the full outline for storage.
-        _full_text, full_outline = outline_renderer.render_full(codebase_map)
-        if changed_files:
-            # Scoped outline text for LLM analysis; full outline for storage.
-            outline_text, _scoped = outline_renderer.render(
-                codebase_map,
-                changed_files,
-            )
-            memory = profile_service.update_profile(
-                existing_memory,
-                full_outline,
-                outline_text,
-                analyzed_at=CommitSHA(head_sha),
-            )
-        else:
-            logger.info("No files changed, keeping existing patterns")
-            memory = CodebaseMemory(
-                repo_id=existing_memory.repo_id,
-                outline=full_outline,
-                patterns=existing_memory.patterns,
-                version=existing_memory.version,
-                analyzed_at=CommitSHA(head_sha),
+def _iter_source_files(
+    client: GitHubClient,
+    paths: list[FilePath],
+    *,
+    ref: str,
+    use_tarball: bool,
+    max_workers: int = _MAX_FETCH_WORKERS,
+    extensions: frozenset[str] | None = None,
+    blob_shas: Mapping[str, str] | None = None,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` for *paths*, from the tarball when allowed.
+
+    Paths the tarball did not deliver (including everything after a failed
+    download) are fetched in GraphQL batches by blob SHA when *blob_shas*
+    is given, and any still missing individually through the REST API.
+    When *extensions* is given, the tarball also yields size-limited files
+    with those extensions that are missing from *paths* (e.g. because the
+    tree listing was truncated).
+    """
+    include = None if extensions is None else _source_file_filter(extensions)
+    remaining = set(paths)
+    if use_tarball and (paths or include is not None):
+        try:
+            for path, data in client.download_tarball(
+                ref, frozenset(paths), include=include
+            ):
+                fp = FilePath(path)
+                remaining.discard(fp)
+                yield fp, data.decode("utf-8", errors="replace")
+        except PublishError as e:
+            logger.warning(
+                "Tarball download failed, fetching %d files individually: %s",
+                len(remaining),
+                e,
             )
-    else:
-        # Fresh: analyze the full codebase.
-        outline_text, outline = outline_renderer.render_full(codebase_map)
-        memory = profile_service.build_profile(
-            repo, outline, outline_text, analyzed_at=CommitSHA(head_sha)
-        )
-    memory_store.save(memory)
-
-    # 7. Optionally build embedding indices.
-    if cfg.embedding_model:
-        _build_embeddings(
-            embedding_model=cfg.embedding_model,
-            codebase_map=codebase_map,
-            file_contents=file_contents,
-            sharded_store=sharded_store,
-            repo=repo,
-        )
-
-    logger.info(
-        "Bootstrap complete: %d files, %d patterns (version %d)",
-        memory.outline.file_count,
-        len(memory.patterns),
-        memory.version,
+    if blob_shas is not None:
+        by_path = {p: blob_shas[p] for p in paths if p in remaining and p in blob_shas}
+        for fp, content in _iter_blobs_batched(
+            client, by_path, max_workers=max_workers
+        ):
+            remaining.discard(fp)
+            yield fp, content
+    yield from _iter_files_parallel(
+        client,
+        [p for p in paths if p in remaining],
+        ref=ref,
+        max_workers=max_workers,
     )
 
 
-_MAX_FETCH_WORKERS = 8
+def _iter_blobs_batched(
+    client: GitHubClient,
+    blob_shas: Mapping[FilePath, str],
+    *,
+    max_workers: int = _MAX_FETCH_WORKERS,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` using one GraphQL query per batch of blobs.
+
+    Files with identical content share a blob and are fetched once.
+    Batches that fail, and blobs GraphQL leaves out, are skipped so the
+    caller can fall back to per-file requests.
+    """
+    paths_by_sha: dict[str, list[FilePath]] = {}
+    for fp, sha in blob_shas.items():
+        paths_by_sha.setdefault(sha, []).append(fp)
+    shas = list(paths_by_sha)
+    if not shas:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(client.get_blob_texts, shas[i : i + GRAPHQL_BLOB_BATCH_SIZE])
+            for i in range(0, len(shas), GRAPHQL_BLOB_BATCH_SIZE)
+        ]
+        for future in as_completed(futures):
+            try:
+                texts = future.result()
+            except (ArgusError, httpx.HTTPError) as exc:
+                logger.warning("GraphQL blob batch failed, fetching per file: %s", exc)
+                continue
+            for sha, text in texts.items():
+                for fp in paths_by_sha.get(sha, ()):
+                    yield fp, text
 
 
-def _fetch_files_parallel(
+def _iter_files_parallel(
     client: GitHubClient,
     paths: list[FilePath],
     *,
     ref: str,
-) -> dict[FilePath, str]:
-    """Fetch file contents in parallel using a thread pool."""
+    max_workers: int = _MAX_FETCH_WORKERS,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` pairs as parallel fetches complete.
+
+    At most *max_workers* requests are in flight at once.  Files that fail
+    to fetch are logged and skipped.
+    """
     if not paths:
-        return {}
+        return
 
-    results: dict[FilePath, str] = {}
-    with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as pool:
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {
             pool.submit(client.get_file_content, path, ref=ref): path for path in paths
         }
         for future in as_completed(futures):
             path = futures[future]
             try:
-                results[path] = future.result()
+                content = future.result()
             except (ArgusError, httpx.HTTPError) as exc:
                 logger.debug("Could not fetch %s: %s", path, exc)
+                continue
+            yield path, content
+
 
-    return results
+def _record_contents(
+    files: Iterable[tuple[FilePath, str]],
+    *,
+    file_contents: MutableMapping[FilePath, str] | None,
+    blob_cache: BlobContentCache,
+    blob_shas: Mapping[str, str],
+) -> Iterator[tuple[FilePath, str]]:
+    """Pass files through, keeping their contents for embeddings and reviews."""
+    for fp, content in files:
+        if file_contents is not None:
+            file_contents[fp] = content
+        sha = blob_shas.get(fp)
+        if sha:
+            blob_cache.put(sha, content)
+        yield fp, content
 
 
 def _build_embeddings(
     embedding_model: str,
     codebase_map: CodebaseMap,
-    file_contents: dict[FilePath, str],
+    file_contents: Mapping[FilePath, str],
     sharded_store: ShardedArtifactStore,
     repo: str = "",
 ) -> None:
-    """Build embedding indices for all shards."""
+    """Build embedding indices for all shards.
+
+    Chunks from every shard are embedded in large cross-shard batches, as
+    many at a time as the provider allows; each shard's index is saved (on
+    a background thread) as soon as all of its chunks have been embedded.
+    """
     from argus.domain.context.value_objects import (
         EmbeddingDescriptor,
         EmbeddingIndex,
         ShardId,
+        chunk_content_hash,
         shard_id_for,
     )
+    from argus.infrastructure.parsing.chunk_cache import ChunkCache
     from argus.infrastructure.parsing.chunker import Chunker
     from argus.infrastructure.retrieval.embeddings import create_embedding_provider
 
@@ -278,45 +510,81 @@ def _build_embeddings(
 
     chunker = Chunker()
 
-    # Group files by shard.
-    shard_files: dict[ShardId, list[FilePath]] = {}
+    # Group files with their content by shard in a single pass.
+    shard_files: dict[ShardId, list[tuple[FilePath, FileEntry, str]]] = {}
     for path in codebase_map.files():
-        sid = shard_id_for(path)
-        shard_files.setdefault(sid, []).append(path)
-
-    built = 0
-    descriptors: dict[ShardId, EmbeddingDescriptor] = {}
-    for sid, paths in shard_files.items():
-        texts: list[str] = []
-        chunk_ids: list[str] = []
-
-        for path in paths:
-            content = file_contents.get(path)
-            if content is None or path not in codebase_map:
-                continue
-            entry = codebase_map.get(path)
-            file_chunks = chunker.chunk(path, content, entry.symbols)
-            for chunk in file_chunks:
-                texts.append(chunk.content)
-                chunk_ids.append(f"{chunk.source}:{chunk.symbol_name}")
-
-        if not texts:
+        content = file_contents.get(path)
+        if content is None:
             continue
-
-        try:
-            embeddings = provider.embed(texts)
-            index = EmbeddingIndex(
-                shard_id=sid,
-                embeddings=tuple(tuple(e) for e in embeddings),
-                chunk_ids=tuple(chunk_ids),
-                dimension=provider.dimension,
-                model=embedding_model,
-            )
-            desc = sharded_store.save_embedding_index(index)
-            descriptors[sid] = desc
-            built += 1
-        except Exception:
-            logger.warning("Failed to build embeddings for shard %s", sid)
+        entry = codebase_map.get(path)
+        shard_files.setdefault(shard_id_for(path), []).append((path, entry, content))
+
+    # Flatten chunks across shards; each shard owns a contiguous span.
+    texts: list[str] = []
+    chunk_ids: list[str] = []
+    spans: list[tuple[ShardId, int, int]] = []
+    with ChunkCache.for_storage_dir(sharded_store.storage_dir) as chunk_cache:
+        for sid, files in shard_files.items():
+            start = len(texts)
+            for path, entry, content in files:
+                file_chunks = chunk_cache.get_or_compute(
+                    path, content, entry.symbols, chunker.chunk
+                )
+                for chunk in file_chunks:
+                    texts.append(chunk.content)
+                    chunk_ids.append(f"{chunk.source}:{chunk.symbol_name}")
+            if len(texts) > start:
+                spans.append((sid, start, len(texts)))
+
+    # Map each batch to the shards it covers, and count the batches each
+    # shard waits on, so a shard is saved as soon as its last batch lands.
+    batch_size = EMBED_BATCH_SIZE
+    total = len(texts)
+    batches = [(lo, min(lo + batch_size, total)) for lo in range(0, total, batch_size)]
+    batch_shards: list[list[int]] = [[] for _ in batches]
+    pending: list[int] = []
+    for si, (_sid, start, end) in enumerate(spans):
+        covering = range(start // batch_size, (end - 1) // batch_size + 1)
+        for bi in covering:
+            batch_shards[bi].append(si)
+        pending.append(len(covering))
+
+    vectors: list[list[float] | None] = [None] * total
+    descriptors: dict[ShardId, EmbeddingDescriptor] = {}
+    with ThreadPoolExecutor(max_workers=_EMBED_SAVE_WORKERS) as save_pool:
+        saves: dict[Future[EmbeddingDescriptor], ShardId] = {}
+        embedded = embed_in_batches(provider, texts, batch_size=batch_size)
+        for lo, hi, batch in embedded:
+            if batch is not None:
+                vectors[lo:hi] = batch
+
+            for si in batch_shards[lo // batch_size]:
+                pending[si] -= 1
+                if pending[si]:
+                    continue
+                sid, start, end = spans[si]
+                shard_vectors = vectors[start:end]
+                if any(v is None for v in shard_vectors):
+                    logger.warning("Failed to build embeddings for shard %s", sid)
+                    continue
+                index = EmbeddingIndex(
+                    shard_id=sid,
+                    embeddings=tuple(tuple(v) for v in shard_vectors if v is not None),
+                    chunk_ids=tuple(chunk_ids[start:end]),
+                    dimension=provider.dimension,
+                    model=embedding_model,
+                    content_hashes=tuple(
+                        chunk_content_hash(text) for text in texts[start:end]
+                    ),
+                )
+                saves[save_pool.submit(sharded_store.save_embedding_index, index)] = sid
+
+        for future in as_completed(saves):
+            sid = saves[future]
+            try:
+                descriptors[sid] = future.result()
+            except Exception:
+                logger.warning("Failed to save embeddings for shard %s", sid)
 
     # Update manifest with embedding descriptors.
     if descriptors and repo:
@@ -325,7 +593,7 @@ def _build_embeddings(
             manifest.embedding_indices.update(descriptors)
             sharded_store.save_manifest(manifest)
 
-    logger.info("Built embeddings for %d shards", built)
+    logger.info("Built embeddings for %d shards", len(descriptors))
 
 
 if __name__ == "__main__":
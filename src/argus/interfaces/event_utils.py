@@ -0,0 +1,31 @@
+"""Shared GitHub event payload helpers for interfaces."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+from typing import cast
+
+from argus.shared.exceptions import ConfigurationError
+
+
+def load_event(event_path: str) -> dict[str, object]:
+    """Load a GitHub event JSON payload.
+
+    Raises:
+        ConfigurationError: If the file is missing, is not valid JSON, or
+            does not contain a JSON object.
+    """
+    try:
+        data = Path(event_path).read_bytes()
+    except FileNotFoundError as e:
+        raise ConfigurationError(f"Event file not found: {event_path}") from e
+    try:
+        event: object = json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ConfigurationError(f"Invalid event JSON: {e}") from e
+    if not isinstance(event, dict):
+        msg = "Invalid event JSON: expected an object"
+        raise ConfigurationError(msg)
+    return cast(dict[str, object], event)
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, field_validator
+from pydantic_ai import Agent, CachePoint, UserContent
 
 from argus.domain.llm.value_objects import LLMUsage, ModelConfig
 from argus.domain.review.entities import Review, ReviewComment
 from argus.domain.review.value_objects import PRContext, ReviewRequest, ReviewSummary
-from argus.infrastructure.constants import CHARS_PER_TOKEN
 from argus.infrastructure.llm_providers.factory import create_agent
+from argus.infrastructure.llm_providers.token_counter import (
+    count_tokens,
+    fit_lines,
+)
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
 from argus.shared.types import Category, FilePath, LineRange, Severity
 
 logger = logging.getLogger(__name__)
@@ -36,8 +44,10 @@ _CATEGORY_MAP: dict[str, Category] = {
     "architecture": Category.ARCHITECTURE,
 }
 
-# Overhead reserved for system prompt + generation output (in tokens).
-_PROMPT_OVERHEAD_TOKENS = 2200
+REVIEW_CACHE_TABLE = "reviews"
+
+# Tokens kept free for the model's reply on top of the fixed prompt parts.
+_GENERATION_RESERVE_TOKENS = 1024
 
 SYSTEM_PROMPT = """\
 You are Argus, an expert code reviewer. Analyze the provided diff and codebase \
@@ -79,6 +89,12 @@ class ReviewOutput(BaseModel):
         confidence: float
         suggestion: str | None = None
 
+        @field_validator("severity", "category", mode="before")
+        @classmethod
+        def _lowercase_label(cls, value: object) -> object:
+            # Normalize once at parse time so lookups are a plain dict get.
+            return value.lower() if isinstance(value, str) else value
+
     summary_description: str
     summary_risks: list[str]
     summary_strengths: list[str]
@@ -86,6 +102,33 @@ class ReviewOutput(BaseModel):
     comments: list[CommentOutput]
 
 
+@functools.cache
+def _prompt_overhead_tokens() -> int:
+    """Tokens taken by the system prompt, output schema and reply reserve.
+
+    Measured once, on first use, so the budget follows the prompt and schema
+    as they change instead of a hand-tuned constant.
+    """
+    schema = json.dumps(ReviewOutput.model_json_schema())
+    return (
+        count_tokens([SYSTEM_PROMPT])
+        + count_tokens([schema])
+        + _GENERATION_RESERVE_TOKENS
+    )
+
+
+def _join_sections(*sections: list[str]) -> list[str]:
+    """Concatenate non-empty sections' pieces with blank lines between them."""
+    pieces: list[str] = []
+    for section in sections:
+        if not section:
+            continue
+        if pieces:
+            pieces.append("\n\n")
+        pieces += section
+    return pieces
+
+
 # =============================================================================
 # GENERATOR
 # =============================================================================
@@ -93,24 +136,79 @@ class ReviewOutput(BaseModel):
 
 @dataclass
 class LLMReviewGenerator:
-    """Bridges ReviewGeneratorPort to pydantic-ai."""
+    """Bridges ReviewGeneratorPort to pydantic-ai.
+
+    When a ``response_cache`` is given, outputs are stored under a hash of
+    the model settings and full prompt, and an identical request (e.g. a
+    re-run or a push that leaves the diff unchanged) is answered from the
+    cache without calling the model.  The cache is bypassed when sampling
+    with a non-zero temperature, where a re-run asks for a fresh review.
+    """
 
     config: ModelConfig
+    response_cache: SqliteCache | None = None
+
+    _agent: Agent[None, ReviewOutput] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def generate(self, request: ReviewRequest) -> tuple[Review, LLMUsage]:
         """Generate a review from diff and context via LLM."""
         prompt = self._build_prompt(request)
-        output, usage = self._generate_tool_mode(prompt)
+        cache = self.response_cache if self.config.temperature == 0 else None
+        cache_key = self._cache_key(prompt)
+        cached = self._cached_output(cache, cache_key)
+        if cached is not None:
+            logger.info("Serving review from response cache")
+            return self._to_review(cached), LLMUsage()
+        output, usage = self._run_agent(prompt)
+        if cache is not None:
+            cache.put(cache_key, output.model_dump_json().encode())
         return self._to_review(output), usage
 
-    def _generate_tool_mode(self, prompt: str) -> tuple[ReviewOutput, LLMUsage]:
-        """Use pydantic-ai tool calling for structured output."""
-        agent = create_agent(
-            config=self.config,
-            output_type=ReviewOutput,
-            system_prompt=SYSTEM_PROMPT,
+    def _cache_key(self, prompt: list[UserContent]) -> str:
+        h = hashlib.blake2b(digest_size=32)
+        settings = (
+            f"{self.config.model}\0{int(self.config.max_tokens)}"
+            f"\0{self.config.temperature}\0{SYSTEM_PROMPT}"
         )
-        result = agent.run_sync(prompt)
+        h.update(settings.encode())
+        for part in prompt:
+            if isinstance(part, str):
+                h.update(b"\0")
+                h.update(part.encode())
+        return h.hexdigest()
+
+    def _cached_output(
+        self, cache: SqliteCache | None, key: str
+    ) -> ReviewOutput | None:
+        if cache is None:
+            return None
+        data = cache.get(key)
+        if data is None:
+            return None
+        try:
+            return ReviewOutput.model_validate_json(data)
+        except ValidationError as e:
+            logger.debug("Discarding corrupt review cache entry: %s", e)
+            return None
+
+    def _run_agent(self, prompt: list[UserContent]) -> tuple[ReviewOutput, LLMUsage]:
+        """Run the review agent for structured output.
+
+        Providers with native JSON-schema output reply in that mode; others
+        fall back to pydantic-ai's tool-call emulation.
+        """
+        # Building an agent derives the output schema and provider client;
+        # both depend only on the config, so one agent serves every review.
+        if self._agent is None:
+            self._agent = create_agent(
+                config=self.config,
+                output_type=ReviewOutput,
+                system_prompt=SYSTEM_PROMPT,
+                prefer_native_output=True,
+            )
+        result = self._agent.run_sync(prompt)
         run_usage = result.usage()
         usage = LLMUsage(
             input_tokens=run_usage.input_tokens or 0,
@@ -119,91 +217,117 @@ class LLMReviewGenerator:
         )
         return result.output, usage
 
-    def _build_prompt(self, request: ReviewRequest) -> str:
+    def _build_prompt(self, request: ReviewRequest) -> list[UserContent]:
         """Assemble the user prompt with budget-aware section inclusion.
 
-        Priority order (highest first): diff, retrieved context, outline, patterns.
-        Lower-priority sections are dropped if they would exceed the token budget.
+        Priority order (highest first): diff, PR context, retrieved context,
+        outline, patterns.  Lower-priority sections are dropped if they would
+        exceed the token budget.
+
+        Sections are emitted in a different order, most stable first:
+        patterns and outline change only when the repo is re-indexed, so
+        they form a prefix that providers with prompt caching (marked by a
+        ``CachePoint``) can reuse across reviews; the diff comes last.
         """
-        budget_chars = (
-            int(self.config.max_tokens) - _PROMPT_OVERHEAD_TOKENS
-        ) * CHARS_PER_TOKEN
+        budget_tokens = int(self.config.max_tokens) - _prompt_overhead_tokens()
+
+        # Sections are kept as lists of pieces and measured piece by piece,
+        # so large texts (diff, outline, context files) are copied only
+        # once, into the final prompt strings.
+        def admit(pieces: list[str], label: str) -> list[str]:
+            nonlocal used
+            size = count_tokens(pieces)
+            if used + size <= budget_tokens:
+                used += size
+                return pieces
+            logger.info("Dropping %s section (%d tokens) — exceeds budget", label, size)
+            return []
 
         # Diff is always included (highest priority).
-        diff_section = f"## Diff\n```\n{request.diff_text}\n```"
-        used = len(diff_section)
+        diff_section = ["## Diff\n```\n", request.diff_text, "\n```"]
+        used = count_tokens(diff_section)
 
-        parts = [diff_section]
+        pr_section: list[str] = []
+        context_section: list[str] = []
+        outline_section: list[str] = []
+        patterns_section: list[str] = []
 
         # PR context (second priority).
         if request.pr_context is not None:
-            pr_section = self._format_pr_context(request.pr_context)
-            if used + len(pr_section) <= budget_chars:
-                parts.append(pr_section)
-                used += len(pr_section)
-            else:
-                logger.info(
-                    "Dropping PR context section (%d chars) — exceeds budget",
-                    len(pr_section),
-                )
+            pr_section = admit(
+                self._format_pr_context(request.pr_context), "PR context"
+            )
 
-        # Retrieved context (third priority).
+        # Retrieved context (third priority), in a stable order.
         if request.context.items:
-            context_parts: list[str] = []
-            for item in request.context.items:
-                context_parts.append(f"### {item.source}\n```\n{item.content}\n```")
-            context_section = "## Codebase Context\n" + "\n".join(context_parts)
-            if used + len(context_section) <= budget_chars:
-                parts.append(context_section)
-                used += len(context_section)
-            else:
-                logger.info(
-                    "Dropping retrieved context section (%d chars) — exceeds budget",
-                    len(context_section),
-                )
-
-        # Codebase outline (fourth priority).
+            pieces = ["## Codebase Context\n"]
+            for i, item in enumerate(
+                sorted(request.context.items, key=lambda i: i.source)
+            ):
+                if i:
+                    pieces.append("\n")
+                pieces += [f"### {item.source}\n```\n", item.content, "\n```"]
+            context_section = admit(pieces, "retrieved context")
+
+        # Codebase outline (fourth priority).  An outline lists one file per
+        # block in path order, so a leading part of it is still useful;
+        # trim it to the remaining budget rather than dropping it whole.
         if request.codebase_outline_text:
-            outline_section = (
-                "## Codebase Outline\n```\n" + request.codebase_outline_text + "\n```"
+            frame = ["## Codebase Outline\n```\n", "\n```"]
+            frame_tokens = count_tokens(frame)
+            outline_text, outline_tokens = fit_lines(
+                request.codebase_outline_text,
+                budget_tokens - used - frame_tokens,
             )
-            if used + len(outline_section) <= budget_chars:
-                parts.append(outline_section)
-                used += len(outline_section)
+            if not outline_text:
+                logger.info("Dropping outline section — exceeds budget")
             else:
-                logger.info(
-                    "Dropping outline section (%d chars) — exceeds budget",
-                    len(outline_section),
-                )
+                if outline_text is not request.codebase_outline_text:
+                    logger.info(
+                        "Trimming outline section to %d of %d chars to fit budget",
+                        len(outline_text),
+                        len(request.codebase_outline_text),
+                    )
+                used += frame_tokens + outline_tokens
+                outline_section = [frame[0], outline_text, frame[1]]
 
         # Codebase patterns (fifth priority).
         if request.codebase_patterns_text:
-            patterns_section = "## Codebase Patterns\n" + request.codebase_patterns_text
-            if used + len(patterns_section) <= budget_chars:
-                parts.append(patterns_section)
-                used += len(patterns_section)
-            else:
-                logger.info(
-                    "Dropping patterns section (%d chars) — exceeds budget",
-                    len(patterns_section),
-                )
+            patterns_section = admit(
+                ["## Codebase Patterns\n", request.codebase_patterns_text],
+                "patterns",
+            )
+
+        stable = _join_sections(patterns_section, outline_section)
+        volatile = "".join(_join_sections(context_section, pr_section, diff_section))
+        if not stable:
+            return [volatile]
+        stable.append("\n\n")
+        return ["".join(stable), CachePoint(), volatile]
+
+    def _format_pr_context(self, ctx: PRContext) -> list[str]:
+        """Format PR context as a prompt section, as pieces to concatenate.
+
+        Comment bodies are kept as their own pieces rather than copied into
+        a joined string; long review threads dominate this section's size.
+        """
+        pieces: list[str] = ["## PR Context"]
 
-        return "\n\n".join(parts)
+        def line(*parts: str) -> None:
+            pieces.append("\n")
+            pieces.extend(parts)
 
-    def _format_pr_context(self, ctx: PRContext) -> str:
-        """Format PR context as a prompt section."""
-        lines: list[str] = ["## PR Context"]
-        lines.append(
+        line(
             f"**Title:** {ctx.title} | **Author:** {ctx.author} "
             f"| **Open:** {ctx.git_health.days_open} days"
         )
         if ctx.labels:
-            lines.append(f"**Labels:** {', '.join(ctx.labels)}")
+            line(f"**Labels:** {', '.join(ctx.labels)}")
 
         # CI status.
         ci = ctx.ci_status
         ci_label = (ci.conclusion or "pending").upper()
-        lines.append(f"\n### CI Status: {ci_label}")
+        line(f"\n### CI Status: {ci_label}")
         for check in ci.checks:
             emoji = (
                 "✅"
@@ -216,7 +340,7 @@ class LLMReviewGenerator:
             entry = f"- {emoji} {check.name} ({conclusion_str})"
             if check.summary:
                 entry += f': "{check.summary}"'
-            lines.append(entry)
+            line(entry)
 
         # Git health.
         health = ctx.git_health
@@ -226,31 +350,31 @@ class LLMReviewGenerator:
         if health.has_merge_commits:
             warnings.append("Contains merge commits")
         if warnings:
-            lines.append("\n### Git Health")
+            line("\n### Git Health")
             for w in warnings:
-                lines.append(f"- {w}")
+                line(f"- {w}")
 
         # Prior comments.
         if ctx.comments:
-            lines.append(f"\n### Prior Comments ({len(ctx.comments)})")
+            line(f"\n### Prior Comments ({len(ctx.comments)})")
             for c in ctx.comments:
                 if c.file_path is not None:
                     loc = f"{c.file_path}:{c.line}" if c.line else c.file_path
-                    lines.append(f'- @{c.author} on {loc} ({c.created_at}): "{c.body}"')
+                    line(f'- @{c.author} on {loc} ({c.created_at}): "', c.body, '"')
                 else:
-                    lines.append(f'- @{c.author} ({c.created_at}): "{c.body}"')
+                    line(f'- @{c.author} ({c.created_at}): "', c.body, '"')
 
         # Related items.
         if ctx.related_items:
-            lines.append("\n### Related Issues")
+            line("\n### Related Issues")
             for item in ctx.related_items:
-                lines.append(f'- #{item.number} ({item.state}): "{item.title}"')
+                line(f'- #{item.number} ({item.state}): "{item.title}"')
 
         # Description quality.
         if not ctx.body or len(ctx.body.strip()) < 10:
-            lines.append("\n**Note:** PR description is missing or very short.")
+            line("\n**Note:** PR description is missing or very short.")
 
-        return "\n".join(lines)
+        return pieces
 
     def _to_review(self, output: ReviewOutput) -> Review:
         """Convert pydantic output to domain Review entity."""
@@ -264,11 +388,11 @@ class LLMReviewGenerator:
         return Review(summary=summary, comments=comments)
 
     def _to_comment(self, c: ReviewOutput.CommentOutput) -> ReviewComment:
-        severity = _SEVERITY_MAP.get(c.severity.lower())
+        severity = _SEVERITY_MAP.get(c.severity)
         if severity is None:
             logger.warning("Unknown severity %r, defaulting to SUGGESTION", c.severity)
             severity = Severity.SUGGESTION
-        category = _CATEGORY_MAP.get(c.category.lower())
+        category = _CATEGORY_MAP.get(c.category)
         if category is None:
             logger.warning("Unknown category %r, defaulting to STYLE", c.category)
             category = Category.STYLE
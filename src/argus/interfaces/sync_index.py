@@ -18,57 +18,115 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import sys
 
+from collections.abc import Iterator, Mapping
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import cast
 
 import httpx
 
 from argus.domain.context.entities import CodebaseMap
-from argus.domain.context.value_objects import ShardedManifest
+from argus.domain.context.value_objects import (
+    EmbeddingIndex,
+    ShardedManifest,
+    chunk_content_hash,
+)
 from argus.domain.llm.value_objects import ModelConfig
 from argus.domain.memory.services import ProfileService
-from argus.infrastructure.constants import DATA_BRANCH
+from argus.domain.memory.value_objects import CodebaseOutline
+from argus.infrastructure.constants import DATA_BRANCH, GRAPHQL_BLOB_BATCH_SIZE
 from argus.infrastructure.github.client import GitHubClient
-from argus.infrastructure.memory.llm_analyzer import LLMPatternAnalyzer
 from argus.infrastructure.memory.outline_renderer import OutlineRenderer
+from argus.infrastructure.parsing.parse_cache import ParseCache
+from argus.infrastructure.parsing.parse_pool import POOL_MIN_FILES, parse_files
 from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
+from argus.infrastructure.retrieval.embeddings.batching import embed_in_batches
 from argus.infrastructure.storage.artifact_store import ShardedArtifactStore
+from argus.infrastructure.storage.blob_cache import BlobContentCache
 from argus.infrastructure.storage.git_branch_store import SelectiveGitBranchSync
 from argus.infrastructure.storage.memory_store import FileMemoryStore
 from argus.interfaces.bootstrap import get_parseable_extensions
 from argus.interfaces.env_utils import require_env
+from argus.interfaces.event_utils import load_event
 from argus.interfaces.toml_config import ArgusConfig, load_argus_config
 from argus.shared.constants import DEFAULT_OUTLINE_TOKEN_BUDGET
-from argus.shared.exceptions import ArgusError, ConfigurationError, IndexingError
+from argus.shared.exceptions import ArgusError, ConfigurationError
 from argus.shared.types import CommitSHA, FilePath, TokenCount
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _suffixes(extensions: frozenset[str]) -> tuple[str, ...]:
+    # str.endswith needs a tuple; build it once per extension set.
+    return tuple(extensions)
+
+
 def _is_parseable(path: str, extensions: frozenset[str]) -> bool:
     """Check if a file path has a parseable extension."""
-    ext = "." + path.rsplit(".", 1)[-1] if "." in path else ""
-    return ext in extensions
+    return path.endswith(_suffixes(extensions))
 
 
-def _extract_after_sha(event_path: str) -> str:
-    """Extract the HEAD (after) SHA from a push event payload."""
-    try:
-        with Path(event_path).open() as f:
-            event: dict[str, object] = json.load(f)
-    except FileNotFoundError as e:
-        raise ConfigurationError(f"Event file not found: {event_path}") from e
-    except json.JSONDecodeError as e:
-        raise ConfigurationError(f"Invalid event JSON: {e}") from e
+_PUSH_COMMITS_CAP = 20
+"""Commit lists this long may have been truncated by GitHub; treat as partial."""
+
+
+@dataclass(frozen=True)
+class _PushSummary:
+    """The parts of a push event payload that sync-index relies on."""
+
+    before_sha: str
+    after_sha: str
+    changed_files: frozenset[str] | None
+    """Paths added, modified or removed by the push, or None if unknown."""
+
+
+def _extract_push_summary(event_path: str) -> _PushSummary:
+    """Summarize a push event payload.
+
+    The changed files are the union of every commit's ``added``,
+    ``modified`` and ``removed`` lists.  They are only trusted when the
+    commit list is complete: not after a force push (which can drop
+    commits from the range) and not when it may have been truncated.
+    """
+    event = load_event(event_path)
     after = event.get("after")
     if not isinstance(after, str):
         msg = "Cannot extract 'after' SHA from push event"
         raise ConfigurationError(msg)
-    return after
+    before = event.get("before")
+    commits = event.get("commits")
+
+    changed_files: frozenset[str] | None = None
+    if (
+        isinstance(before, str)
+        and isinstance(commits, list)
+        and not event.get("forced")
+        and len(cast(list[object], commits)) < _PUSH_COMMITS_CAP
+    ):
+        paths: set[str] = set()
+        for commit in cast(list[object], commits):
+            if not isinstance(commit, dict):
+                break
+            fields = cast(dict[str, object], commit)
+            lists = [fields.get(k) for k in ("added", "modified", "removed")]
+            if not all(isinstance(v, list) for v in lists):
+                break
+            for value in cast(list[list[object]], lists):
+                paths.update(p for p in value if isinstance(p, str))
+        else:
+            changed_files = frozenset(paths)
+
+    return _PushSummary(
+        before_sha=before if isinstance(before, str) else "",
+        after_sha=after,
+        changed_files=changed_files,
+    )
 
 
 def run() -> None:
@@ -95,73 +153,76 @@ def _execute() -> None:
     event_path = require_env("GITHUB_EVENT_PATH")
     storage_dir = Path(cfg.storage_dir)
 
-    client = GitHubClient(token=token, repo=repo)
-    parser = TreeSitterParser()
-    sharded_store = ShardedArtifactStore(storage_dir=storage_dir)
-    sync = SelectiveGitBranchSync(
-        client=client,
-        branch=DATA_BRANCH,
-        storage_dir=storage_dir,
-    )
-
-    # 1. Pull manifest to check for existing artifacts.
-    has_manifest = sync.pull_manifest()
-    manifest = sharded_store.load_manifest(repo) if has_manifest else None
-
-    after_sha = _extract_after_sha(event_path)
-
-    orphaned_blobs: set[str] = set()
-    if manifest is None:
-        changed_files, codebase_map, orphaned_blobs = _handle_legacy_path(
-            client,
-            parser,
-            sharded_store,
-            sync,
-            repo,
-            after_sha,
-            cfg,
-        )
-        if changed_files is None:
-            return
-    else:
-        changed_files, codebase_map, orphaned_blobs = _handle_manifest_path(
-            client,
-            parser,
-            sharded_store,
-            sync,
-            manifest,
-            repo,
-            after_sha,
-            cfg,
+    with GitHubClient(token=token, repo=repo) as client:
+        parser = TreeSitterParser()
+        sharded_store = ShardedArtifactStore(storage_dir=storage_dir)
+        sync = SelectiveGitBranchSync(
+            client=client,
+            branch=DATA_BRANCH,
+            storage_dir=storage_dir,
         )
-        if changed_files is None:
-            return
 
-    # 2. Optionally run incremental pattern analysis on changed files.
-    if changed_files:
-        _maybe_analyze_patterns(
+        push = _extract_push_summary(event_path)
+        after_sha = push.after_sha
+
+        # 1. Pull manifest to check for existing artifacts.
+        has_manifest = sync.pull_manifest()
+        manifest = sharded_store.load_manifest(repo) if has_manifest else None
+
+        orphaned_blobs: set[str] = set()
+        if manifest is None:
+            changed_files, codebase_map, orphaned_blobs = _handle_legacy_path(
+                client,
+                parser,
+                sharded_store,
+                sync,
+                repo,
+                after_sha,
+                cfg,
+            )
+            if changed_files is None:
+                return
+        else:
+            changed_files, codebase_map, orphaned_blobs = _handle_manifest_path(
+                client,
+                parser,
+                sharded_store,
+                sync,
+                manifest,
+                repo,
+                after_sha,
+                cfg,
+                push=push,
+            )
+            if changed_files is None:
+                return
+
+        # 2. Optionally run incremental pattern analysis on changed files.
+        if changed_files:
+            _maybe_analyze_patterns(
+                cfg=cfg,
+                sync=sync,
+                storage_dir=storage_dir,
+                repo=repo,
+                after_sha=after_sha,
+                codebase_map=codebase_map,
+                changed_files=changed_files,
+            )
+
+        # 2b. Optionally build embeddings for changed shards.
+        _maybe_build_embeddings(
             cfg=cfg,
-            sync=sync,
             storage_dir=storage_dir,
-            repo=repo,
-            after_sha=after_sha,
             codebase_map=codebase_map,
-            changed_files=changed_files,
+            changed_files=changed_files or [],
+            client=client,
+            after_sha=after_sha,
+            repo=repo,
+            sync=sync,
         )
 
-    # 2b. Optionally build embeddings for changed shards.
-    _maybe_build_embeddings(
-        cfg=cfg,
-        storage_dir=storage_dir,
-        codebase_map=codebase_map,
-        changed_files=changed_files or [],
-        client=client,
-        after_sha=after_sha,
-        repo=repo,
-    )
-
-    # 3. Push updated artifacts (merges with existing via base_tree).
-    sync.push(delete_blobs=orphaned_blobs or None)
+        # 3. Push updated artifacts (merges with existing via base_tree).
+        sync.push(delete_blobs=orphaned_blobs or None)
 
 
 def _handle_legacy_path(
@@ -213,9 +274,15 @@ def _handle_manifest_path(
     repo: str,
     after_sha: str,
     cfg: ArgusConfig,
+    *,
+    push: _PushSummary | None = None,
 ) -> tuple[list[FilePath] | None, CodebaseMap, set[str]]:
     """Handle incremental update using existing manifest.
 
+    When the push event lists every file changed since the indexed commit,
+    a push that touches no parseable file returns without comparing
+    commits at all.
+
     Returns:
         Tuple of (changed_files, codebase_map, orphaned_blobs).
         changed_files is None if the caller should return early
@@ -232,9 +299,18 @@ def _handle_manifest_path(
         logger.info("Already up to date at %s", after_sha[:8])
         return None, CodebaseMap(indexed_at=CommitSHA("")), set()
 
-    changed_paths = client.compare_commits(base_sha, after_sha)
     parseable = get_parseable_extensions(cfg.extra_extensions)
-    source_paths = [p for p in changed_paths if _is_parseable(p, parseable)]
+    if (
+        push is not None
+        and push.changed_files is not None
+        and push.before_sha == base_sha
+        and not any(_is_parseable(p, parseable) for p in push.changed_files)
+    ):
+        logger.info("Push changed no parseable files, skipping update")
+        return None, CodebaseMap(indexed_at=CommitSHA("")), set()
+
+    changed_blobs = client.compare_commit_blobs(base_sha, after_sha)
+    source_paths = [p for p in changed_blobs if _is_parseable(p, parseable)]
 
     if not source_paths:
         logger.info("No parseable files changed, skipping update")
@@ -250,7 +326,7 @@ def _handle_manifest_path(
     }
     sync.pull_blobs(blob_names)
 
-    partial_map = sharded_store.load_shards(repo, dirty_shard_ids)
+    partial_map = sharded_store.load_shards(repo, dirty_shard_ids, manifest=manifest)
 
     changed_files, orphaned_blobs = _incremental_update_sharded(
         client,
@@ -262,6 +338,7 @@ def _handle_manifest_path(
         after_sha,
         existing_manifest=manifest,
         cfg=cfg,
+        changed_blobs=changed_blobs,
     )
     return changed_files, partial_map, orphaned_blobs
 
@@ -297,24 +374,33 @@ def _maybe_analyze_patterns(
     )
 
     outline_renderer = OutlineRenderer(token_budget=DEFAULT_OUTLINE_TOKEN_BUDGET)
-    outline_text, _scoped_outline = outline_renderer.render(
+    outline_text, scoped_outline = outline_renderer.render(
         codebase_map,
         changed_files,
     )
 
+    # Edits inside function bodies leave the outline as it was, and the
+    # analyzer only sees the outline, so there is nothing new to learn.
+    if _outline_unchanged(existing_memory.outline, scoped_outline, changed_files):
+        logger.info("Outline of changed files unchanged, skipping pattern analysis")
+        return
+
     model_config = ModelConfig(
         model=cfg.model,
         max_tokens=TokenCount(cfg.max_tokens),
         temperature=0.0,
     )
+    # Deferred: pydantic-ai is slow to import and most index runs skip this.
+    from argus.infrastructure.memory.llm_analyzer import LLMPatternAnalyzer
+
     analyzer = LLMPatternAnalyzer(config=model_config)
     profile_service = ProfileService(analyzer=analyzer)
 
-    # Pass existing outline to preserve all entries — the scoped outline
-    # is only used for LLM analysis text, not as the new stored outline.
+    # Keep the existing outline's entries — the scoped outline is only used
+    # for LLM analysis text — but refresh the symbols of files it covers.
     memory = profile_service.update_profile(
         existing_memory,
-        existing_memory.outline,
+        _refresh_outline(existing_memory.outline, scoped_outline),
         outline_text,
         analyzed_at=CommitSHA(after_sha),
     )
@@ -327,6 +413,36 @@ def _maybe_analyze_patterns(
     )
 
 
+def _outline_unchanged(
+    stored: CodebaseOutline,
+    scoped: CodebaseOutline,
+    changed_files: list[FilePath],
+) -> bool:
+    """Whether every changed file renders the outline recorded in *stored*.
+
+    Compares the rendered signatures, not just symbol names, so a changed
+    parameter list or return type still counts as an outline change.
+    Entries stored before signatures were recorded never match.
+    """
+    before = {e.path: (e.symbols, e.signatures) for e in stored.entries}
+    after = {e.path: (e.symbols, e.signatures) for e in scoped.entries}
+    return all(
+        path in before and path in after and before[path] == after[path]
+        for path in changed_files
+    )
+
+
+def _refresh_outline(
+    stored: CodebaseOutline, scoped: CodebaseOutline
+) -> CodebaseOutline:
+    """Return *stored* with entries for files in *scoped* replaced."""
+    fresh = {entry.path: entry for entry in scoped.entries}
+    return replace(
+        stored,
+        entries=tuple(fresh.get(entry.path, entry) for entry in stored.entries),
+    )
+
+
 def _maybe_build_embeddings(
     cfg: ArgusConfig,
     storage_dir: Path,
@@ -335,18 +451,23 @@ def _maybe_build_embeddings(
     client: GitHubClient,
     after_sha: str,
     repo: str = "",
+    sync: SelectiveGitBranchSync | None = None,
 ) -> None:
-    """Build embedding indices for changed shards if embedding_model is configured."""
+    """Build embedding indices for changed shards if embedding_model is configured.
+
+    Only chunks of changed files, and chunks missing from a shard's previous
+    index (pulled through *sync* when given), are sent to the provider.
+    """
     if not cfg.embedding_model:
         return
 
     from argus.domain.context.value_objects import (
         EmbeddingDescriptor,
-        EmbeddingIndex,
         ShardId,
         shard_id_for,
     )
-    from argus.infrastructure.parsing.chunker import Chunker
+    from argus.infrastructure.parsing.chunk_cache import ChunkCache
+    from argus.infrastructure.parsing.chunker import Chunker, CodeChunk
     from argus.infrastructure.retrieval.embeddings import create_embedding_provider
     from argus.infrastructure.storage.artifact_store import ShardedArtifactStore
 
@@ -362,42 +483,102 @@ def _maybe_build_embeddings(
     # Determine changed shard IDs.
     changed_shard_ids: set[ShardId] = {shard_id_for(f) for f in changed_files}
 
-    descriptors: dict[ShardId, EmbeddingDescriptor] = {}
-    for sid in changed_shard_ids:
-        texts: list[str] = []
-        chunk_ids: list[str] = []
-        for path in codebase_map.files():
-            if shard_id_for(path) != sid:
-                continue
-            if path not in codebase_map:
-                continue
+    shard_paths: dict[ShardId, list[FilePath]] = {}
+    for entry in codebase_map.iter_sorted():
+        sid = shard_id_for(entry.path)
+        if sid in changed_shard_ids:
+            shard_paths.setdefault(sid, []).append(entry.path)
+
+    # Fetch every file of the changed shards in GraphQL batches, then embed
+    # shard by shard in path order.
+    all_paths = [path for paths in shard_paths.values() for path in paths]
+    chunks_by_path: dict[FilePath, list[CodeChunk]] = {}
+    with ChunkCache.for_storage_dir(storage_dir) as chunk_cache:
+        for path, content in _iter_files_at_ref(
+            client, all_paths, ref=after_sha, max_workers=cfg.fetch_concurrency
+        ):
             entry = codebase_map.get(path)
-            try:
-                content = client.get_file_content(path, ref=after_sha)
-                file_chunks = chunker.chunk(path, content, entry.symbols)
-                for chunk in file_chunks:
-                    texts.append(chunk.content)
-                    chunk_ids.append(f"{chunk.source}:{chunk.symbol_name}")
-            except Exception:
-                logger.debug("Could not fetch/chunk %s for embeddings", path)
-
-        if not texts:
-            continue
+            chunks_by_path[path] = chunk_cache.get_or_compute(
+                path, content, entry.symbols, chunker.chunk
+            )
+
+    # A chunk whose text is unchanged keeps its vector from the shard's
+    # previous index, matched by content hash.
+    if sync is not None:
+        sync.pull_blobs(
+            {store.embedding_blob_name(sid, cfg.embedding_model) for sid in shard_paths}
+        )
+    previous = {
+        index.shard_id: index
+        for index in store.load_embedding_indices(
+            set(shard_paths), model=cfg.embedding_model
+        )
+    }
 
+    # Flatten chunks across shards so the provider sees a few large batches
+    # rather than one request per shard; each shard owns a contiguous span.
+    texts: list[str] = []
+    chunk_ids: list[str] = []
+    content_hashes: list[str] = []
+    vectors: list[list[float] | None] = []
+    spans: list[tuple[ShardId, int, int]] = []
+    for sid, paths in shard_paths.items():
+        reusable = _reusable_vectors(previous.get(sid))
+        start = len(texts)
+        for path in paths:
+            for chunk in chunks_by_path.get(path, ()):
+                content_hash = chunk_content_hash(chunk.content)
+                texts.append(chunk.content)
+                chunk_ids.append(f"{chunk.source}:{chunk.symbol_name}")
+                content_hashes.append(content_hash)
+                vectors.append(reusable.get(content_hash))
+        if len(texts) > start:
+            spans.append((sid, start, len(texts)))
+
+    missing = [i for i, v in enumerate(vectors) if v is None]
+    missing_texts = [texts[i] for i in missing]
+    for lo, hi, embedded in embed_in_batches(provider, missing_texts):
+        if embedded is not None:
+            for i, vector in zip(missing[lo:hi], embedded, strict=True):
+                vectors[i] = vector
+    logger.info(
+        "Embedded %d chunks, reused %d unchanged",
+        len(missing),
+        len(texts) - len(missing),
+    )
+
+    embedded_at = set(missing)
+    descriptors: dict[ShardId, EmbeddingDescriptor] = {}
+    for sid, start, end in spans:
+        shard_vectors = vectors[start:end]
+        if any(v is None for v in shard_vectors):
+            logger.warning("Failed to build embeddings for shard %s", sid)
+            continue
+        old = previous.get(sid)
+        shard_ids = tuple(chunk_ids[start:end])
+        shard_hashes = tuple(content_hashes[start:end])
+        fresh = not embedded_at.isdisjoint(range(start, end))
+        if (
+            old is not None
+            and not fresh
+            and old.chunk_ids == shard_ids
+            and old.content_hashes == shard_hashes
+        ):
+            logger.info("Embeddings for shard %s are unchanged", sid)
+            continue
+        index = EmbeddingIndex(
+            shard_id=sid,
+            embeddings=tuple(tuple(v) for v in shard_vectors if v is not None),
+            chunk_ids=shard_ids,
+            dimension=provider.dimension if fresh or old is None else old.dimension,
+            model=cfg.embedding_model,
+            content_hashes=shard_hashes,
+        )
         try:
-            embeddings = provider.embed(texts)
-            index = EmbeddingIndex(
-                shard_id=sid,
-                embeddings=tuple(tuple(e) for e in embeddings),
-                chunk_ids=tuple(chunk_ids),
-                dimension=provider.dimension,
-                model=cfg.embedding_model,
-            )
-            desc = store.save_embedding_index(index)
-            descriptors[sid] = desc
-            logger.info("Built embeddings for shard %s: %d chunks", sid, len(texts))
+            descriptors[sid] = store.save_embedding_index(index)
+            logger.info("Built embeddings for shard %s: %d chunks", sid, end - start)
         except Exception:
-            logger.warning("Failed to build embeddings for shard %s", sid)
+            logger.warning("Failed to save embeddings for shard %s", sid)
 
     # Update manifest with embedding descriptors.
     if descriptors and repo:
@@ -407,32 +588,175 @@ def _maybe_build_embeddings(
             store.save_manifest(manifest)
 
 
+def _reusable_vectors(index: EmbeddingIndex | None) -> dict[str, list[float]]:
+    """Map the content hash of each chunk in *index* to its vector.
+
+    Indices written before content hashes were recorded offer nothing to
+    reuse, so their shards are embedded afresh once.
+    """
+    if index is None or len(index.content_hashes) != len(index.embeddings):
+        return {}
+    return {
+        content_hash: list(vector)
+        for content_hash, vector in zip(
+            index.content_hashes, index.embeddings, strict=True
+        )
+    }
+
+
 _MAX_FETCH_WORKERS = 8
+_FAILED_PATHS_SHOWN = 10
 
 
-def _fetch_files_parallel(
+def _iter_files_parallel(
     client: GitHubClient,
     paths: list[FilePath],
     *,
     ref: str,
-) -> dict[FilePath, str]:
-    """Fetch file contents in parallel using a thread pool."""
+    max_workers: int = _MAX_FETCH_WORKERS,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` pairs as parallel fetches complete.
+
+    Files that fail to fetch are skipped and reported in one warning once
+    every fetch has finished.
+    """
     if not paths:
-        return {}
+        return
 
-    results: dict[FilePath, str] = {}
-    with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as pool:
+    failed: list[FilePath] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {
             pool.submit(client.get_file_content, path, ref=ref): path for path in paths
         }
         for future in as_completed(futures):
             path = futures[future]
             try:
-                results[path] = future.result()
-            except (ArgusError, httpx.HTTPError) as exc:
-                logger.debug("Could not fetch %s: %s", path, exc)
+                content = future.result()
+            except (ArgusError, httpx.HTTPError):
+                failed.append(path)
+                continue
+            yield path, content
+
+    if failed:
+        logger.warning(
+            "Could not fetch %d of %d files, e.g. %s",
+            len(failed),
+            len(paths),
+            ", ".join(sorted(failed)[:_FAILED_PATHS_SHOWN]),
+        )
+
+
+def _iter_files_at_ref(
+    client: GitHubClient,
+    paths: list[FilePath],
+    *,
+    ref: str,
+    max_workers: int = _MAX_FETCH_WORKERS,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` for files whose blob SHA is not known.
+
+    Files are fetched in GraphQL batches by ``ref:path``, several at once,
+    and yielded as each batch completes so the caller can work on one
+    batch while the next downloads.  Only files a batch left out fall back
+    to per-file REST requests.
+    """
+    unresolved: list[FilePath] = []
+    batches = [
+        paths[i : i + GRAPHQL_BLOB_BATCH_SIZE]
+        for i in range(0, len(paths), GRAPHQL_BLOB_BATCH_SIZE)
+    ]
+    if batches:
+        workers = min(max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(client.get_file_texts, ref, batch): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                try:
+                    texts = future.result()
+                except (ArgusError, httpx.HTTPError) as exc:
+                    logger.warning(
+                        "GraphQL file batch failed, fetching per file: %s", exc
+                    )
+                    texts = {}
+                for path in futures[future]:
+                    text = texts.get(path)
+                    if text is None:
+                        unresolved.append(path)
+                    else:
+                        yield path, text
+
+    yield from _iter_files_parallel(
+        client, unresolved, ref=ref, max_workers=max_workers
+    )
+
 
-    return results
+def _iter_changed_files(
+    client: GitHubClient,
+    paths: list[FilePath],
+    *,
+    ref: str,
+    blob_shas: Mapping[str, str],
+    blob_cache: BlobContentCache,
+    max_workers: int = _MAX_FETCH_WORKERS,
+) -> Iterator[tuple[FilePath, str]]:
+    """Yield ``(path, content)`` for changed files, fetching by blob SHA.
+
+    Blobs already in the local cache are served from it.  The rest are
+    fetched in GraphQL batches by SHA, several at once, and yielded as each
+    batch completes so parsing overlaps the downloads still in flight.
+    Only files without a known blob (or that a batch left out) fall back
+    to per-file REST requests.  Fetched contents are added to the cache.
+    """
+    misses: dict[str, list[FilePath]] = {}
+    unresolved: list[FilePath] = []
+    for path in paths:
+        sha = blob_shas.get(path)
+        cached = blob_cache.get(sha) if sha else None
+        if cached is not None:
+            yield path, cached
+        elif sha:
+            misses.setdefault(sha, []).append(path)
+        else:
+            unresolved.append(path)
+
+    shas = list(misses)
+    batches = [
+        shas[i : i + GRAPHQL_BLOB_BATCH_SIZE]
+        for i in range(0, len(shas), GRAPHQL_BLOB_BATCH_SIZE)
+    ]
+    if batches:
+        workers = min(max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(client.get_blob_texts, batch): batch for batch in batches
+            }
+            for future in as_completed(futures):
+                try:
+                    texts = future.result()
+                except (ArgusError, httpx.HTTPError) as exc:
+                    logger.warning(
+                        "GraphQL blob batch failed, fetching per file: %s", exc
+                    )
+                    texts = {}
+                for sha in futures[future]:
+                    text = texts.get(sha)
+                    if text is None:
+                        unresolved.extend(misses[sha])
+                        continue
+                    # Cache writes stay on this thread; workers only fetch.
+                    blob_cache.put(sha, text)
+                    for path in misses[sha]:
+                        yield path, text
+
+    for path, content in _iter_files_parallel(
+        client, unresolved, ref=ref, max_workers=max_workers
+    ):
+        sha = blob_shas.get(path)
+        if sha:
+            blob_cache.put(sha, content)
+        yield path, content
 
 
 def _incremental_update_sharded(
@@ -445,13 +769,20 @@ def _incremental_update_sharded(
     after_sha: str,
     existing_manifest: ShardedManifest | None = None,
     cfg: ArgusConfig | None = None,
+    changed_blobs: Mapping[str, str | None] | None = None,
 ) -> tuple[list[FilePath], set[str]]:
     """Update the codebase map and re-shard only dirty directories.
 
+    Args:
+        changed_blobs: The comparison of *before_sha* and *after_sha*, when
+            the caller already has it (see ``compare_commit_blobs``).
+
     Returns:
         Tuple of (changed source file paths, orphaned blob names).
     """
-    changed_paths = client.compare_commits(before_sha, after_sha)
+    if changed_blobs is None:
+        changed_blobs = client.compare_commit_blobs(before_sha, after_sha)
+    changed_paths = list(changed_blobs)
     extra = cfg.extra_extensions if cfg is not None else None
     parseable = get_parseable_extensions(extra)
     source_paths = [p for p in changed_paths if _is_parseable(p, parseable)]
@@ -466,20 +797,43 @@ def _incremental_update_sharded(
         len(changed_paths),
     )
 
-    fps = [FilePath(p) for p in source_paths]
-    fetched = _fetch_files_parallel(client, fps, ref=after_sha)
+    # Removed files have no blob at after_sha: drop their entries instead
+    # of fetching them, so only real fetch failures are reported.
+    removed = 0
+    for p in source_paths:
+        if changed_blobs[p] is None and FilePath(p) in codebase_map:
+            codebase_map.remove(FilePath(p))
+            removed += 1
+
+    # Parse each file as its fetch completes, overlapping with the rest.
+    fps = [FilePath(p) for p in source_paths if changed_blobs[p] is not None]
+    max_workers = cfg.fetch_concurrency if cfg is not None else _MAX_FETCH_WORKERS
+    blob_shas = {p: sha for p, sha in changed_blobs.items() if sha}
 
     updated = 0
-    for fp, content in fetched.items():
-        try:
-            entry = parser.parse(fp, content)
-            codebase_map.upsert(entry)
+    use_pool = len(fps) >= POOL_MIN_FILES
+    with (
+        BlobContentCache.for_storage_dir(store.storage_dir) as blob_cache,
+        ParseCache.for_storage_dir(store.storage_dir) as parse_cache,
+    ):
+        fetched = _iter_changed_files(
+            client,
+            fps,
+            ref=after_sha,
+            blob_shas=blob_shas,
+            blob_cache=blob_cache,
+            max_workers=max_workers,
+        )
+        parsed = parse_files(parser, fetched, use_pool=use_pool, cache=parse_cache)
+        for fp, outcome in parsed:
+            if isinstance(outcome, ArgusError):
+                logger.debug("Skipping %s: %s", fp, outcome)
+                continue
+            codebase_map.upsert(outcome)
             updated += 1
-        except (IndexingError, ArgusError) as e:
-            logger.debug("Skipping %s: %s", fp, e)
 
     codebase_map.indexed_at = CommitSHA(after_sha)
-    logger.info("Updated %d files in codebase map", updated)
+    logger.info("Updated %d and removed %d files in codebase map", updated, removed)
 
     orphaned_blobs: set[str] = set()
     if existing_manifest is not None:
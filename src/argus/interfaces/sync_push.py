@@ -35,13 +35,13 @@ def run() -> None:
         repo = require_env("GITHUB_REPOSITORY")
         storage_dir = Path(cfg.storage_dir)
 
-        client = GitHubClient(token=token, repo=repo)
-        sync = SelectiveGitBranchSync(
-            client=client,
-            branch=DATA_BRANCH,
-            storage_dir=storage_dir,
-        )
-        sync.push()
+        with GitHubClient(token=token, repo=repo) as client:
+            sync = SelectiveGitBranchSync(
+                client=client,
+                branch=DATA_BRANCH,
+                storage_dir=storage_dir,
+            )
+            sync.push()
     except ArgusError as e:
         logger.error("Sync push failed: %s", e)
         sys.exit(1)
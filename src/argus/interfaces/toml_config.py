@@ -7,10 +7,11 @@ apply (supports non-Python repos).
 
 from __future__ import annotations
 
+import functools
 import logging
 import tomllib
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, cast
 
@@ -42,6 +43,8 @@ _COMMON_DEFAULTS: dict[str, Any] = {
     "search_related_issues": False,
     "embedding_model": "",
     "analyze_patterns": False,
+    "tarball_max_mb": 500,
+    "fetch_concurrency": 8,
 }
 
 _ALL_KNOWN_KEYS = {
@@ -58,6 +61,8 @@ _ALL_KNOWN_KEYS = {
     "search_related_issues",
     "embedding_model",
     "analyze_patterns",
+    "tarball_max_mb",
+    "fetch_concurrency",
     "index",
 }
 
@@ -79,6 +84,8 @@ class ArgusConfig:
     search_related_issues: bool = False
     embedding_model: str = ""
     analyze_patterns: bool = False
+    tarball_max_mb: int = 500
+    fetch_concurrency: int = 8
 
 
 def load_argus_config(
@@ -105,15 +112,45 @@ def load_argus_config(
     if project_root is None:
         project_root = Path.cwd()
 
-    toml_path = project_root / "pyproject.toml"
+    toml_path = (project_root / "pyproject.toml").absolute()
+    cfg = _load_cached(mode, toml_path, _file_stamp(toml_path))
+    # The cached instance is shared; hand out private copies of its lists.
+    return replace(
+        cfg,
+        ignored_paths=list(cfg.ignored_paths),
+        extra_extensions=list(cfg.extra_extensions),
+    )
+
+
+# ── internal helpers ────────────────────────────────────────────────────
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or ``None`` if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
+@functools.lru_cache(maxsize=4)
+def _load_cached(
+    mode: str,
+    toml_path: Path,
+    stamp: tuple[int, int] | None,
+) -> ArgusConfig:
+    """Build the config for *mode*; cached until ``pyproject.toml`` changes.
+
+    *stamp* is only part of the cache key, so an edited file is re-read.
+    """
     # 1. Start with common + mode defaults.
     is_index_mode = mode in ("index", "bootstrap")
     mode_defaults = _INDEX_DEFAULTS if is_index_mode else _REVIEW_DEFAULTS
     merged: dict[str, Any] = {**_COMMON_DEFAULTS, **mode_defaults}
 
     # 2. Read TOML and overlay.
-    tool_section = _read_tool_section(toml_path)
+    tool_section = _read_tool_section(toml_path, stamp)
     if tool_section is not None:
         _warn_unknown_keys(tool_section)
 
@@ -155,22 +192,19 @@ def load_argus_config(
         search_related_issues=bool(merged["search_related_issues"]),
         embedding_model=str(merged["embedding_model"]),
         analyze_patterns=bool(merged["analyze_patterns"]),
+        tarball_max_mb=int(merged["tarball_max_mb"]),
+        fetch_concurrency=int(merged["fetch_concurrency"]),
     )
 
 
-# ── internal helpers ────────────────────────────────────────────────────
-
-
-def _read_tool_section(toml_path: Path) -> dict[str, Any] | None:
+def _read_tool_section(
+    toml_path: Path,
+    stamp: tuple[int, int] | None,
+) -> dict[str, Any] | None:
     """Read ``[tool.argus]`` from *toml_path*, or ``None`` if absent."""
-    if not toml_path.is_file():
+    if stamp is None or not toml_path.is_file():
         return None
-    try:
-        with toml_path.open("rb") as f:
-            data = tomllib.load(f)
-    except tomllib.TOMLDecodeError as exc:
-        msg = f"Failed to parse {toml_path}: {exc}"
-        raise ConfigurationError(msg) from exc
+    data = _parse_toml(toml_path, stamp)
     tool: dict[str, Any] | None = data.get("tool")
     if not isinstance(tool, dict):
         return None
@@ -180,6 +214,16 @@ def _read_tool_section(toml_path: Path) -> dict[str, Any] | None:
     return argus
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_toml(toml_path: Path, stamp: tuple[int, int]) -> dict[str, Any]:
+    """Parse *toml_path* once per *stamp*, shared by every mode's config."""
+    try:
+        return tomllib.loads(toml_path.read_bytes().decode())
+    except (tomllib.TOMLDecodeError, UnicodeDecodeError) as exc:
+        msg = f"Failed to parse {toml_path}: {exc}"
+        raise ConfigurationError(msg) from exc
+
+
 def _warn_unknown_keys(section: dict[str, Any]) -> None:
     """Log a warning for any keys not in the known set."""
     for top_key in section:
@@ -235,3 +279,13 @@ def _validate_ranges(merged: dict[str, Any]) -> None:
     if max_tokens <= 0:
         msg = f"max_tokens must be positive, got {max_tokens}"
         raise ConfigurationError(msg)
+
+    tarball_max_mb = int(merged.get("tarball_max_mb", 0))
+    if tarball_max_mb < 0:
+        msg = f"tarball_max_mb must be non-negative, got {tarball_max_mb}"
+        raise ConfigurationError(msg)
+
+    fetch_concurrency = int(merged.get("fetch_concurrency", 1))
+    if fetch_concurrency <= 0:
+        msg = f"fetch_concurrency must be positive, got {fetch_concurrency}"
+        raise ConfigurationError(msg)
@@ -26,8 +26,8 @@ from argus.interfaces.action import (
     _extract_changed_files,
     _extract_head_sha,
     _extract_pr_number,
-    _load_event,
 )
+from argus.interfaces.event_utils import load_event
 from argus.interfaces.review_generator import LLMReviewGenerator, ReviewOutput
 from argus.shared.exceptions import ConfigurationError
 from argus.shared.types import CommitSHA, FilePath, TokenCount
@@ -71,18 +71,18 @@ class TestEventParsing:
     """Test GitHub event JSON parsing helpers."""
 
     def test_load_event(self, github_event: Path) -> None:
-        event = _load_event(str(github_event))
+        event = load_event(str(github_event))
         assert "pull_request" in event
 
     def test_load_event_missing_file_raises(self) -> None:
         with pytest.raises(ConfigurationError, match="Event file not found"):
-            _load_event("/nonexistent/path/event.json")
+            load_event("/nonexistent/path/event.json")
 
     def test_load_event_invalid_json_raises(self, tmp_path: Path) -> None:
         bad_file = tmp_path / "bad.json"
         bad_file.write_text("not valid json{{{")
         with pytest.raises(ConfigurationError, match="Invalid event JSON"):
-            _load_event(str(bad_file))
+            load_event(str(bad_file))
 
     def test_extract_pr_number(self) -> None:
         event = {"pull_request": {"number": 42, "head": {"sha": "abc"}}}
@@ -119,6 +119,11 @@ class TestEventParsing:
         files = _extract_changed_files(diff)
         assert files == [FilePath("safe.py")]
 
+    def test_extract_changed_files_ignores_mid_line_and_crlf(self) -> None:
+        diff = "+++ b/a.py\r\n context +++ b/not_a_header.py\r\n+++ b/b.py"
+        files = _extract_changed_files(diff)
+        assert files == [FilePath("a.py"), FilePath("b.py")]
+
 
 # =============================================================================
 # FULL PIPELINE TESTS
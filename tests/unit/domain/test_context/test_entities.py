@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from argus.domain.context.entities import CodebaseMap, FileEntry
@@ -108,6 +110,19 @@ def test_codebase_map_upsert_replaces_entry(
     assert populated_map.get(FilePath("src/auth/login.py")).summary == "Updated."
 
 
+def test_codebase_map_upsert_many_adds_and_replaces_entries(
+    populated_map: CodebaseMap,
+    file_entry: FileEntry,
+) -> None:
+    other = replace(file_entry, path=FilePath("src/auth/logout.py"))
+    updated = replace(file_entry, summary="Updated.")
+
+    populated_map.upsert_many([other, updated])
+
+    assert populated_map.files() == {file_entry.path, other.path}
+    assert populated_map.get(file_entry.path).summary == "Updated."
+
+
 def test_codebase_map_get_missing_raises(codebase_map: CodebaseMap) -> None:
     with pytest.raises(KeyError):
         codebase_map.get(FilePath("nonexistent.py"))
@@ -134,6 +149,18 @@ def test_codebase_map_files_returns_all_paths(
     assert FilePath("src/auth/login.py") in paths
 
 
+def test_codebase_map_iter_sorted_orders_by_path(
+    codebase_map: CodebaseMap,
+    file_entry: FileEntry,
+) -> None:
+    for path in ("src/b.py", "src/a.py", "lib/c.py"):
+        codebase_map.upsert(replace(file_entry, path=FilePath(path)))
+
+    paths = [entry.path for entry in codebase_map.iter_sorted()]
+
+    assert paths == ["lib/c.py", "src/a.py", "src/b.py"]
+
+
 def test_codebase_map_contains(populated_map: CodebaseMap) -> None:
     assert FilePath("src/auth/login.py") in populated_map
     assert FilePath("nonexistent.py") not in populated_map
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import PurePosixPath
+
 import pytest
 
 from argus.domain.context.value_objects import (
@@ -33,6 +35,11 @@ def test_shard_id_for_root_file() -> None:
     assert shard_id_for(FilePath("setup.py")) == ShardId(".")
 
 
+def test_shard_id_for_matches_posix_parent() -> None:
+    for path in ("src/main.py", "setup.py", "/abs.py", "a//b/c.py", "./x.py"):
+        assert shard_id_for(FilePath(path)) == str(PurePosixPath(path).parent)
+
+
 # =============================================================================
 # ShardDescriptor
 # =============================================================================
@@ -51,6 +51,19 @@ def test_noise_filter_drops_ignored_paths(
     assert filtered[0].file == FilePath("src/auth/login.py")
 
 
+def test_noise_filter_matches_any_of_several_prefixes(
+    critical_comment: ReviewComment,
+) -> None:
+    noise_filter = NoiseFilter(
+        confidence_threshold=0.5,
+        ignored_paths=[FilePath("vendor/"), FilePath("src/auth/"), FilePath("dist/")],
+    )
+
+    filtered = noise_filter.filter([critical_comment])
+
+    assert filtered == []
+
+
 def test_noise_filter_keeps_all_above_threshold(
     critical_comment: ReviewComment,
     suggestion_comment: ReviewComment,
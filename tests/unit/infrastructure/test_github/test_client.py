@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import io
+import tarfile
+
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from argus.infrastructure.github.client import GitHubClient
 from argus.shared.exceptions import PublishError
+from argus.shared.types import FilePath
 
 # =============================================================================
 # Fixtures
@@ -69,6 +73,91 @@ def test_get_pull_request_diff_returns_text(client: GitHubClient) -> None:
     assert "diff --git" in result
 
 
+def test_compare_commit_blobs_maps_paths_to_head_blobs(client: GitHubClient) -> None:
+    files = [
+        {"filename": "src/a.py", "status": "modified", "sha": "sha-a"},
+        {"filename": "src/old.py", "status": "removed", "sha": "sha-old"},
+    ]
+    response = _mock_response(json_data={"files": files})
+
+    with _patch_httpx(response):
+        blobs = client.compare_commit_blobs("aaa111", "bbb222")
+        paths = client.compare_commits("aaa111", "bbb222")
+
+    assert blobs == {"src/a.py": "sha-a", "src/old.py": None}
+    assert paths == ["src/a.py", "src/old.py"]
+
+
+def _tree_responder(trees: dict[str, list[dict[str, str]]]) -> MagicMock:
+    """Answer GraphQL object queries from ``expression -> entries``."""
+
+    def post(url: str, json: dict[str, object], **kwargs: object) -> MagicMock:
+        variables = json["variables"]
+        assert isinstance(variables, dict)
+        repository: dict[str, object] = {}
+        for key, expr in variables.items():
+            if key.startswith("o") and key != "owner":
+                entries = trees.get(expr)
+                repository[f"b{key[1:]}"] = {"entries": entries} if entries else None
+        return _mock_response(json_data={"data": {"repository": repository}})
+
+    return MagicMock(side_effect=post)
+
+
+def test_diff_commit_trees_descends_only_into_changed_subtrees(
+    client: GitHubClient,
+) -> None:
+    same_lib = {"name": "lib", "type": "tree", "oid": "t-lib"}
+    trees = {
+        "aaa111:": [
+            same_lib,
+            {"name": "src", "type": "tree", "oid": "t-src-1"},
+            {"name": "old.py", "type": "blob", "oid": "b-old"},
+        ],
+        "bbb222:": [
+            same_lib,
+            {"name": "src", "type": "tree", "oid": "t-src-2"},
+            {"name": "new.py", "type": "blob", "oid": "b-new"},
+        ],
+        "aaa111:src": [{"name": "a.py", "type": "blob", "oid": "b-a1"}],
+        "bbb222:src": [{"name": "a.py", "type": "blob", "oid": "b-a2"}],
+    }
+
+    with _patch_httpx(_mock_response()) as mock_cls:
+        mock_cls.return_value.post = _tree_responder(trees)
+        blobs = client.compare_commit_blobs("aaa111", "bbb222")
+
+    assert blobs == {"old.py": None, "new.py": "b-new", "src/a.py": "b-a2"}
+    queried = [
+        value
+        for call in mock_cls.return_value.post.call_args_list
+        for key, value in call.kwargs["json"]["variables"].items()
+        if key.startswith("o") and key != "owner"
+    ]
+    assert not any(expr.endswith(":lib") for expr in queried)
+    mock_cls.return_value.get.assert_not_called()
+
+
+def test_diff_commit_trees_over_limit_falls_back_to_rest(client: GitHubClient) -> None:
+    trees = {
+        "aaa111:": [],
+        "bbb222:": [
+            {"name": "a.py", "type": "blob", "oid": "b-a"},
+            {"name": "b.py", "type": "blob", "oid": "b-b"},
+        ],
+    }
+    files = [{"filename": "a.py", "status": "added", "sha": "b-a"}]
+
+    with _patch_httpx(_mock_response(json_data={"files": files})) as mock_cls:
+        mock_cls.return_value.post = _tree_responder(trees)
+        over_limit = client.diff_commit_trees("aaa111", "bbb222", max_files=1)
+        with patch.object(client, "diff_commit_trees", return_value=None):
+            blobs = client.compare_commit_blobs("aaa111", "bbb222")
+
+    assert over_limit is None
+    assert blobs == {"a.py": "b-a"}
+
+
 def test_get_raises_publish_error_on_failure(client: GitHubClient) -> None:
     response = _mock_response(status_code=404, text="Not Found")
 
@@ -125,6 +214,19 @@ def test_get_file_content_url_encodes_special_chars(client: GitHubClient) -> Non
     assert "path with spaces" not in url
 
 
+def test_find_file_content_missing_file_returns_none(client: GitHubClient) -> None:
+    with _patch_httpx(_mock_response(status_code=404, text="Not Found")):
+        assert client.find_file_content(FilePath("manifest.json"), "abc") is None
+
+
+def test_find_file_content_server_error_raises(client: GitHubClient) -> None:
+    with (
+        _patch_httpx(_mock_response(status_code=502)),
+        pytest.raises(PublishError, match="502"),
+    ):
+        client.find_file_content(FilePath("manifest.json"), "abc")
+
+
 def test_get_tree_recursive_warns_on_truncation(
     client: GitHubClient, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -285,3 +387,151 @@ def test_request_raises_after_exhausting_retries(client: GitHubClient) -> None:
         pytest.raises(PublishError, match="429"),
     ):
         client.get_pull_request(1)
+
+
+# =============================================================================
+# Connection reuse
+# =============================================================================
+
+
+def test_requests_share_one_http_client(client: GitHubClient) -> None:
+    response = _mock_response(json_data={"number": 1, "title": "PR"})
+
+    with _patch_httpx(response) as client_cls:
+        client.get_pull_request(1)
+        client.get_pull_request(2)
+        client.post_issue_comment(1, "comment")
+
+    assert client_cls.call_count == 1
+
+
+def test_context_exit_closes_pooled_client(client: GitHubClient) -> None:
+    response = _mock_response(json_data={"number": 1, "title": "PR"})
+
+    with _patch_httpx(response) as client_cls:
+        with client:
+            client.get_pull_request(1)
+        client_cls.return_value.close.assert_called_once()
+        client.get_pull_request(2)
+
+    assert client_cls.call_count == 2
+
+
+# =============================================================================
+# Tarball download
+# =============================================================================
+
+
+def _make_tarball(files: dict[str, bytes], root: str = "org-repo-abc123") -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(f"{root}/{name}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _patch_stream(status_code: int = 200, body: bytes = b""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = "error"
+    # Small chunks exercise reads that span chunk boundaries.
+    response.iter_bytes.return_value = iter(
+        [body[i : i + 7] for i in range(0, len(body), 7)]
+    )
+    mock_client = MagicMock()
+    mock_client.stream.return_value.__enter__.return_value = response
+    return patch(
+        "argus.infrastructure.github.client.httpx.Client",
+        return_value=mock_client,
+    )
+
+
+def test_get_blob_texts_skips_binary_and_missing_blobs(client: GitHubClient) -> None:
+    response = _mock_response(
+        json_data={
+            "data": {
+                "repository": {
+                    "b0": {"text": "a = 1\n", "isBinary": False, "isTruncated": False},
+                    "b1": {"text": None, "isBinary": True, "isTruncated": False},
+                    "b2": None,
+                }
+            }
+        }
+    )
+
+    with _patch_httpx(response) as mock_cls:
+        result = client.get_blob_texts(["sha-a", "sha-bin", "sha-gone"])
+
+    assert result == {"sha-a": "a = 1\n"}
+    payload = mock_cls.return_value.post.call_args.kwargs["json"]
+    assert payload["variables"]["o2"] == "sha-gone"
+    assert payload["variables"]["owner"] == "org"
+
+
+def test_get_file_texts_queries_by_ref_and_path(client: GitHubClient) -> None:
+    response = _mock_response(
+        json_data={
+            "data": {
+                "repository": {
+                    "b0": {"text": "a = 1\n", "isBinary": False, "isTruncated": False},
+                    "b1": None,
+                }
+            }
+        }
+    )
+
+    with _patch_httpx(response) as mock_cls:
+        result = client.get_file_texts("abc123", ["src/a.py", "src/gone.py"])
+
+    assert result == {"src/a.py": "a = 1\n"}
+    payload = mock_cls.return_value.post.call_args.kwargs["json"]
+    assert payload["variables"]["o1"] == "abc123:src/gone.py"
+    assert "object(expression: $o0)" in payload["query"]
+
+
+def test_get_blob_texts_graphql_error_raises(client: GitHubClient) -> None:
+    response = _mock_response(json_data={"errors": [{"message": "bad"}]})
+
+    with _patch_httpx(response), pytest.raises(PublishError, match="GraphQL"):
+        client.get_blob_texts(["sha-a"])
+
+
+def test_download_tarball_yields_requested_files(client: GitHubClient) -> None:
+    body = _make_tarball({"src/a.py": b"a = 1\n", "src/b.py": b"b = 2\n"})
+
+    with _patch_stream(body=body):
+        result = dict(client.download_tarball("abc123", paths={"src/a.py"}))
+
+    assert result == {"src/a.py": b"a = 1\n"}
+
+
+def test_download_tarball_include_selects_unlisted_files(client: GitHubClient) -> None:
+    body = _make_tarball(
+        {"src/a.py": b"a = 1\n", "src/b.py": b"b = 2\n", "README.md": b"# r\n"}
+    )
+
+    with _patch_stream(body=body):
+        result = dict(
+            client.download_tarball(
+                "abc123",
+                paths={"src/a.py"},
+                include=lambda path, size: path.endswith(".py"),
+            )
+        )
+
+    assert result == {"src/a.py": b"a = 1\n", "src/b.py": b"b = 2\n"}
+
+
+def test_download_tarball_http_error_raises(client: GitHubClient) -> None:
+    with _patch_stream(status_code=404), pytest.raises(PublishError, match="404"):
+        list(client.download_tarball("abc123"))
+
+
+def test_download_tarball_corrupt_archive_raises(client: GitHubClient) -> None:
+    with (
+        _patch_stream(body=b"not a tarball"),
+        pytest.raises(PublishError, match="tarball"),
+    ):
+        list(client.download_tarball("abc123"))
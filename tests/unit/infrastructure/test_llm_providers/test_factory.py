@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from pydantic import BaseModel
-from pydantic_ai import Agent
+from pydantic_ai import Agent, NativeOutput
 
 from argus.domain.llm.value_objects import ModelConfig
-from argus.infrastructure.llm_providers.factory import create_agent
+from argus.infrastructure.llm_providers.factory import (
+    create_agent,
+    supports_native_output,
+)
 from argus.shared.types import TokenCount
 
 
@@ -62,3 +67,32 @@ def test_create_agent_accepts_custom_temperature() -> None:
         system_prompt="Be creative.",
     )
     assert isinstance(agent, Agent)
+
+
+def test_create_agent_native_output_for_supporting_provider() -> None:
+    with patch("argus.infrastructure.llm_providers.factory.Agent") as agent_cls:
+        create_agent(
+            config=_make_config(model="openai:gpt-4o"),
+            output_type=_DummyOutput,
+            system_prompt="You are helpful.",
+            prefer_native_output=True,
+        )
+
+    assert isinstance(agent_cls.call_args.kwargs["output_type"], NativeOutput)
+
+
+def test_create_agent_native_output_falls_back_to_tool_output() -> None:
+    with patch("argus.infrastructure.llm_providers.factory.Agent") as agent_cls:
+        create_agent(
+            config=_make_config(model="anthropic:claude-sonnet-4-5-20250929"),
+            output_type=_DummyOutput,
+            system_prompt="You are helpful.",
+            prefer_native_output=True,
+        )
+
+    assert agent_cls.call_args.kwargs["output_type"] is _DummyOutput
+
+
+def test_supports_native_output_matches_provider_prefix() -> None:
+    assert supports_native_output("google-gla:gemini-2.5-flash")
+    assert not supports_native_output("anthropic:claude-sonnet-4-5-20250929")
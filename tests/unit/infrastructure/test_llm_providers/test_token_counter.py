@@ -0,0 +1,50 @@
+"""Tests for prompt token counting."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from argus.infrastructure.llm_providers.token_counter import count_tokens, fit_lines
+
+
+def test_count_tokens_without_tokenizer_rounds_length_estimate_up() -> None:
+    with patch(
+        "argus.infrastructure.llm_providers.token_counter._encoding",
+        return_value=None,
+    ):
+        assert count_tokens(["abcd", "e"]) == 2
+        assert count_tokens([]) == 0
+
+
+def test_count_tokens_with_tokenizer_sums_piece_encodings() -> None:
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text, **_: text.split()
+
+    with patch(
+        "argus.infrastructure.llm_providers.token_counter._encoding",
+        return_value=encoding,
+    ):
+        assert count_tokens(["## Diff\n", "+ a = 1"]) == 6
+
+
+def test_fit_lines_without_tokenizer_budgets_characters_not_lines() -> None:
+    text = "a\nb\nc\nd\ne\nf\n"
+    with patch(
+        "argus.infrastructure.llm_providers.token_counter._encoding",
+        return_value=None,
+    ):
+        assert fit_lines(text, 3) == (text, 3)
+        assert fit_lines(text, 2) == ("a\nb\nc\nd", 2)
+        assert fit_lines(text, 0) == ("", 0)
+
+
+def test_fit_lines_with_tokenizer_stops_at_first_line_over_budget() -> None:
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text, **_: text.split()
+
+    with patch(
+        "argus.infrastructure.llm_providers.token_counter._encoding",
+        return_value=encoding,
+    ):
+        assert fit_lines("a b\nc d e\nf\n", 4) == ("a b", 2)
+        assert fit_lines("a b\nc\n", 4) == ("a b\nc\n", 3)
@@ -98,9 +98,10 @@ class TestOutlineRenderer:
         cbm = _make_map(entry)
         renderer = OutlineRenderer(token_budget=1000)
 
-        text, _ = renderer.render(cbm, [FilePath("main.py")])
+        text, outline = renderer.render(cbm, [FilePath("main.py")])
 
         assert "def greet(name: str) -> str" in text
+        assert outline.entries[0].signatures == ("def greet(name: str) -> str",)
 
     def test_render_uses_kind_name_when_no_signature(self) -> None:
         entry = _make_entry(
@@ -110,9 +111,10 @@ class TestOutlineRenderer:
         cbm = _make_map(entry)
         renderer = OutlineRenderer(token_budget=1000)
 
-        text, _ = renderer.render(cbm, [FilePath("main.py")])
+        text, outline = renderer.render(cbm, [FilePath("main.py")])
 
         assert "class MyClass" in text
+        assert outline.entries[0].signatures == ("class MyClass",)
 
     def test_render_full_includes_all_files(self) -> None:
         entries = [
@@ -0,0 +1,127 @@
+"""Tests for the content-addressed chunk cache."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from unittest.mock import patch
+
+from argus.domain.context.value_objects import Symbol, SymbolKind
+from argus.infrastructure.parsing import chunk_cache
+from argus.infrastructure.parsing.chunk_cache import ChunkCache
+from argus.infrastructure.parsing.chunker import Chunker, CodeChunk
+from argus.shared.types import FilePath, LineRange
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+_CODE = "def first():\n    pass\n\ndef second():\n    pass\n"
+
+
+def _make_symbol(name: str, start: int, end: int) -> Symbol:
+    return Symbol(
+        name=name,
+        kind=SymbolKind.FUNCTION,
+        line_range=LineRange(start=start, end=end),
+    )
+
+
+class _CountingChunker:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._chunker = Chunker()
+
+    def chunk(
+        self, path: FilePath, content: str, symbols: Sequence[Symbol]
+    ) -> list[CodeChunk]:
+        self.calls += 1
+        return self._chunker.chunk(path, content, symbols)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+def test_get_or_compute_hit_skips_chunker(tmp_path: Path) -> None:
+    symbols = [_make_symbol("first", 1, 2), _make_symbol("second", 4, 5)]
+    chunker = _CountingChunker()
+
+    with ChunkCache.for_storage_dir(tmp_path) as cache:
+        first = cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+    with ChunkCache.for_storage_dir(tmp_path) as cache:
+        second = cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+
+    assert chunker.calls == 1
+    assert second == first
+
+
+def test_get_or_compute_changed_content_recomputes(tmp_path: Path) -> None:
+    symbols = [_make_symbol("first", 1, 2)]
+    chunker = _CountingChunker()
+
+    with ChunkCache.for_storage_dir(tmp_path) as cache:
+        cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+        result = cache.get_or_compute(
+            FilePath("a.py"), _CODE + "x = 1\n", symbols, chunker.chunk
+        )
+
+    assert chunker.calls == 2
+    assert result[0].symbol_name == "first"
+
+
+def test_get_or_compute_changed_symbols_recomputes(tmp_path: Path) -> None:
+    chunker = _CountingChunker()
+
+    with ChunkCache.for_storage_dir(tmp_path) as cache:
+        cache.get_or_compute(
+            FilePath("a.py"), _CODE, [_make_symbol("first", 1, 2)], chunker.chunk
+        )
+        result = cache.get_or_compute(
+            FilePath("a.py"), _CODE, [_make_symbol("second", 4, 5)], chunker.chunk
+        )
+
+    assert chunker.calls == 2
+    assert result[0].symbol_name == "second"
+
+
+def test_get_or_compute_changed_chunker_code_recomputes(tmp_path: Path) -> None:
+    symbols = [_make_symbol("first", 1, 2)]
+    chunker = _CountingChunker()
+
+    with ChunkCache.for_storage_dir(tmp_path) as cache:
+        cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+        with patch.object(chunk_cache, "_chunker_version", return_value="edited"):
+            cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+
+    assert chunker.calls == 2
+
+
+def test_chunk_cache_keeps_only_newest_entries(tmp_path: Path) -> None:
+    symbols = [_make_symbol("first", 1, 2)]
+    chunker = _CountingChunker()
+
+    with (
+        patch.object(chunk_cache, "CHUNK_CACHE_MAX_ENTRIES", 1),
+        ChunkCache.for_storage_dir(tmp_path) as cache,
+    ):
+        cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+        cache.get_or_compute(FilePath("b.py"), _CODE, symbols, chunker.chunk)
+    with ChunkCache.for_storage_dir(tmp_path) as cache:
+        cache.get_or_compute(FilePath("b.py"), _CODE, symbols, chunker.chunk)
+        cache.get_or_compute(FilePath("a.py"), _CODE, symbols, chunker.chunk)
+
+    assert chunker.calls == 3
+
+
+def test_get_or_compute_unwritable_dir_falls_back(tmp_path: Path) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    chunker = _CountingChunker()
+
+    with ChunkCache.for_storage_dir(blocker) as cache:
+        result = cache.get_or_compute(FilePath("a.py"), _CODE, [], chunker.chunk)
+
+    assert chunker.calls == 1
+    assert result[0].content == _CODE
@@ -0,0 +1,98 @@
+"""Tests for the content-addressed parse cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+from argus.domain.context.entities import FileEntry
+from argus.infrastructure.parsing import parse_cache
+from argus.infrastructure.parsing.parse_cache import ParseCache, source_fingerprint
+from argus.infrastructure.parsing.parse_pool import parse_files
+from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
+from argus.infrastructure.storage.blob_cache import BlobContentCache
+from argus.shared.exceptions import ArgusError
+from argus.shared.types import FilePath
+
+_CODE = "def first():\n    pass\n"
+
+
+def _counting_parser() -> MagicMock:
+    parser = MagicMock()
+    parser.parse.side_effect = TreeSitterParser().parse
+    return parser
+
+
+def test_parse_cache_serves_unchanged_files_across_runs(tmp_path: Path) -> None:
+    files = [(FilePath("src/a.py"), _CODE), (FilePath("src/b.py"), "x = 1\n")]
+    first = _counting_parser()
+    with ParseCache.for_storage_dir(tmp_path) as cache:
+        parsed = dict(parse_files(first, files, use_pool=False, cache=cache))
+
+    second = _counting_parser()
+    changed = [files[0], (FilePath("src/b.py"), "y = 2\n")]
+    with ParseCache.for_storage_dir(tmp_path) as cache:
+        reparsed = dict(parse_files(second, changed, use_pool=False, cache=cache))
+
+    assert first.parse.call_count == 2
+    second.parse.assert_called_once_with(FilePath("src/b.py"), "y = 2\n")
+    assert reparsed[FilePath("src/a.py")] == parsed[FilePath("src/a.py")]
+
+
+def test_parse_cache_key_depends_on_path(tmp_path: Path) -> None:
+    with ParseCache.for_storage_dir(tmp_path) as cache:
+        assert cache.key(FilePath("a.py"), _CODE) != cache.key(FilePath("a.js"), _CODE)
+
+
+def test_parse_cache_key_depends_on_parser_code(tmp_path: Path) -> None:
+    with ParseCache.for_storage_dir(tmp_path) as cache:
+        before = cache.key(FilePath("a.py"), _CODE)
+        with patch.object(parse_cache, "_parser_version", return_value="edited"):
+            after = cache.key(FilePath("a.py"), _CODE)
+
+    assert before != after
+
+
+def test_source_fingerprint_changes_with_module_source(tmp_path: Path) -> None:
+    source = tmp_path / "mod.py"
+    module = ModuleType("mod")
+    module.__file__ = str(source)
+
+    source.write_text("X = 1\n")
+    before = source_fingerprint(module)
+    source.write_text("X = 2\n")
+
+    assert source_fingerprint(module) != before
+
+
+def test_parse_files_with_cache_reports_errors_uncached(tmp_path: Path) -> None:
+    files = [(FilePath("notes.unknown"), "plain text\n")]
+    parser = _counting_parser()
+
+    with ParseCache.for_storage_dir(tmp_path) as cache:
+        for _ in range(2):
+            [(_, outcome)] = parse_files(parser, files, use_pool=False, cache=cache)
+            assert isinstance(outcome, ArgusError)
+
+    assert parser.parse.call_count == 2
+
+
+def test_parse_cache_open_alongside_blob_cache_persists(tmp_path: Path) -> None:
+    entry = TreeSitterParser().parse(FilePath("src/a.py"), _CODE)
+    with (
+        BlobContentCache.for_storage_dir(tmp_path) as blobs,
+        ParseCache.for_storage_dir(tmp_path) as parses,
+    ):
+        blobs.put("sha-a", _CODE)
+        parses.put("key-a", entry)
+
+    with (
+        BlobContentCache.for_storage_dir(tmp_path) as blobs,
+        ParseCache.for_storage_dir(tmp_path) as parses,
+    ):
+        assert blobs.get("sha-a") == _CODE
+        cached = parses.get("key-a")
+
+    assert isinstance(cached, FileEntry)
+    assert cached == entry
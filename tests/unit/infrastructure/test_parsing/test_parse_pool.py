@@ -0,0 +1,49 @@
+"""Tests for the multi-process parse pool."""
+
+from __future__ import annotations
+
+from argus.domain.context.entities import FileEntry
+from argus.infrastructure.parsing.parse_pool import ParsePool, parse_files
+from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
+from argus.shared.exceptions import ArgusError
+from argus.shared.types import FilePath
+
+
+def test_parse_pool_matches_inline_parser() -> None:
+    files = [
+        (FilePath(f"pkg/mod_{i}.py"), f"def func_{i}():\n    return {i}\n")
+        for i in range(5)
+    ]
+
+    results = dict(ParsePool(max_workers=2, batch_size=2).parse(iter(files)))
+
+    parser = TreeSitterParser()
+    assert results == {path: parser.parse(path, content) for path, content in files}
+
+
+def test_parse_pool_reports_unparseable_files() -> None:
+    files = [
+        (FilePath("ok.py"), "x = 1\n"),
+        (FilePath("notes.unknown"), "plain text\n"),
+    ]
+
+    results = dict(ParsePool(max_workers=1).parse(files))
+
+    assert isinstance(results[FilePath("ok.py")], FileEntry)
+    assert isinstance(results[FilePath("notes.unknown")], ArgusError)
+
+
+def test_parse_files_inline_yields_errors_in_place() -> None:
+    files = [
+        (FilePath("ok.py"), "x = 1\n"),
+        (FilePath("notes.unknown"), "plain text\n"),
+    ]
+
+    results = list(parse_files(TreeSitterParser(), files, use_pool=False))
+
+    assert [path for path, _ in results] == [
+        FilePath("ok.py"),
+        FilePath("notes.unknown"),
+    ]
+    assert isinstance(results[0][1], FileEntry)
+    assert isinstance(results[1][1], ArgusError)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from argus.domain.context.entities import FileEntry
 from argus.domain.context.value_objects import SymbolKind
 from argus.infrastructure.constants import SupportedLanguage
-from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
+from argus.infrastructure.parsing.tree_sitter_parser import (
+    TreeSitterParser,
+    _load_language,
+    _parser_for,
+)
 from argus.shared.exceptions import IndexingError
 from argus.shared.types import FilePath
 
@@ -192,3 +198,28 @@ def test_parse_handles_replacement_characters(parser: TreeSitterParser) -> None:
 
     assert entry.path == FilePath("replaced.py")
     assert len(entry.symbols) >= 1
+
+
+# =============================================================================
+# Parser reuse
+# =============================================================================
+
+
+def test_parser_for_reuses_parser_within_thread() -> None:
+    lang = _load_language(SupportedLanguage.PYTHON)
+
+    first = _parser_for(SupportedLanguage.PYTHON, lang)
+    second = _parser_for(SupportedLanguage.PYTHON, lang)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other_thread = pool.submit(_parser_for, SupportedLanguage.PYTHON, lang).result()
+
+    assert first is second
+    assert other_thread is not first
+
+
+def test_parse_with_reused_parser_is_independent(parser: TreeSitterParser) -> None:
+    first = parser.parse(FilePath("a.py"), "def alpha():\n    pass\n")
+    second = parser.parse(FilePath("b.py"), "class Beta:\n    pass\n")
+
+    assert [s.name for s in first.symbols] == ["alpha"]
+    assert [s.name for s in second.symbols] == ["Beta"]
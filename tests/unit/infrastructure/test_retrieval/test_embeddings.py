@@ -271,3 +271,53 @@ def test_local_dimension_not_mutated_on_second_call(
     provider.embed(["second"])
     assert provider.dimension == 3
     _model_cache.clear()
+
+
+# =============================================================================
+# Batching
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "model", ["google-emb:text-embedding-004", "openai-emb:m", "local:m"]
+)
+def test_embed_concurrency_builtin_providers_are_serial(model: str) -> None:
+    from argus.infrastructure.retrieval.embeddings.batching import embed_concurrency
+
+    assert embed_concurrency(create_embedding_provider(model)) == 1
+
+
+def test_embed_in_batches_failed_batch_yields_none() -> None:
+    from argus.infrastructure.retrieval.embeddings.batching import embed_in_batches
+
+    class _Provider:
+        dimension = 1
+
+        def embed(self, texts: list[str]) -> list[list[float]]:
+            if texts == ["c"]:
+                raise RuntimeError("quota")
+            return [[float(len(t))] for t in texts]
+
+    results = list(embed_in_batches(_Provider(), ["a", "bb", "c"], batch_size=2))
+
+    assert results == [(0, 2, [[1.0], [2.0]]), (2, 3, None)]
+
+
+def test_embed_in_batches_runs_declared_concurrency_in_parallel() -> None:
+    import threading
+
+    from argus.infrastructure.retrieval.embeddings.batching import embed_in_batches
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _Provider:
+        dimension = 1
+        max_concurrency = 2
+
+        def embed(self, texts: list[str]) -> list[list[float]]:
+            barrier.wait()
+            return [[0.0] for _ in texts]
+
+    results = list(embed_in_batches(_Provider(), ["a", "b"], batch_size=1))
+
+    assert sorted(lo for lo, _, _ in results) == [0, 1]
@@ -0,0 +1,44 @@
+"""Tests for BlobContentCache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from argus.infrastructure.storage import blob_cache
+from argus.infrastructure.storage.blob_cache import (
+    BlobContentCache,
+    blob_shas_from_tree,
+)
+
+
+def test_blob_cache_persists_across_instances(tmp_path: Path) -> None:
+    with BlobContentCache.for_storage_dir(tmp_path) as cache:
+        cache.put("sha-a", "print('a')\n")
+
+    with BlobContentCache.for_storage_dir(tmp_path) as cache:
+        assert cache.get("sha-a") == "print('a')\n"
+        assert cache.get("sha-missing") is None
+
+
+def test_blob_cache_keeps_only_newest_entries(tmp_path: Path) -> None:
+    with (
+        patch.object(blob_cache, "BLOB_CACHE_MAX_ENTRIES", 1),
+        BlobContentCache.for_storage_dir(tmp_path) as cache,
+    ):
+        cache.put("sha-a", "a\n")
+        cache.put("sha-b", "b\n")
+
+    with BlobContentCache.for_storage_dir(tmp_path) as cache:
+        assert cache.get("sha-a") is None
+        assert cache.get("sha-b") == "b\n"
+
+
+def test_blob_shas_from_tree_keeps_only_blobs() -> None:
+    entries: list[dict[str, object]] = [
+        {"path": "src", "type": "tree", "sha": "sha-dir"},
+        {"path": "src/a.py", "type": "blob", "sha": "sha-a"},
+        {"path": "src/b.py", "type": "blob"},
+    ]
+
+    assert blob_shas_from_tree(entries) == {"src/a.py": "sha-a"}
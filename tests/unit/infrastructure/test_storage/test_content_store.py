@@ -0,0 +1,33 @@
+"""Tests for FileContentStore."""
+
+from __future__ import annotations
+
+import pytest
+
+from argus.infrastructure.storage.content_store import FileContentStore
+from argus.shared.types import FilePath
+
+
+def test_content_store_roundtrip() -> None:
+    with FileContentStore() as store:
+        store[FilePath("a.py")] = "print('a')\n"
+        store[FilePath("b.py")] = "print('b')\n"
+
+        assert store[FilePath("a.py")] == "print('a')\n"
+        assert store.get(FilePath("missing.py")) is None
+        assert sorted(store) == [FilePath("a.py"), FilePath("b.py")]
+        assert len(store) == 2
+
+
+def test_content_store_overwrite_replaces_content() -> None:
+    with FileContentStore() as store:
+        store[FilePath("a.py")] = "old"
+        store[FilePath("a.py")] = "new"
+
+        assert store[FilePath("a.py")] == "new"
+        assert len(store) == 1
+
+
+def test_content_store_delete_missing_raises_key_error() -> None:
+    with FileContentStore() as store, pytest.raises(KeyError):
+        del store[FilePath("missing.py")]
@@ -36,6 +36,23 @@ def test_save_and_load_embedding_index(tmp_path: Path) -> None:
     assert loaded[0].model == "test-model"
 
 
+def test_embedding_index_content_hashes_round_trip(tmp_path: Path) -> None:
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    index = EmbeddingIndex(
+        shard_id=ShardId("src"),
+        embeddings=((1.0,), (2.0,)),
+        chunk_ids=("src/a.py:f", "src/b.py:g"),
+        dimension=1,
+        model="m",
+        content_hashes=("h1", "h2"),
+    )
+    store.save_embedding_index(index)
+
+    [loaded] = store.load_embedding_indices({ShardId("src")}, model="m")
+
+    assert loaded == index
+
+
 def test_load_embedding_indices_missing_shard(tmp_path: Path) -> None:
     store = ShardedArtifactStore(storage_dir=tmp_path)
     loaded = store.load_embedding_indices({ShardId("nonexistent")})
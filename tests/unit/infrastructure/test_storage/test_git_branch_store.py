@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -192,3 +193,130 @@ def test_selective_push_delete_blobs_uses_null_sha(
     assert len(delete_entries) == 1
     assert delete_entries[0]["path"] == "shard_old.json"
     assert delete_entries[0]["sha"] is None
+
+
+def _git_blob_sha(data: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def test_selective_push_uploads_only_files_changed_since_pull(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock, tmp_path: Path
+) -> None:
+    client.get_ref_sha.return_value = "head_sha"
+    client.get_tree_entries_flat.return_value = [
+        {"path": "shard_a.json", "type": "blob", "sha": _git_blob_sha(b'{"a": 1}')},
+        {"path": "shard_b.json", "type": "blob", "sha": _git_blob_sha(b'{"b": 1}')},
+    ]
+    client.get_blob_texts.return_value = {}
+    client.get_blob_content.side_effect = [b'{"a": 1}', b'{"b": 1}']
+    selective_sync.pull_blobs({"shard_a.json", "shard_b.json"})
+    (tmp_path / "shard_b.json").write_bytes(b'{"b": 2}')
+    client.create_blob.return_value = "blob_b2"
+
+    selective_sync.push()
+
+    client.create_blob.assert_called_once_with(base64.b64encode(b'{"b": 2}').decode())
+    [entry] = client.create_tree.call_args[0][0]
+    assert entry["path"] == "shard_b.json"
+
+
+def test_selective_push_unchanged_artifacts_skips_commit(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock, tmp_path: Path
+) -> None:
+    client.get_ref_sha.return_value = "head_sha"
+    client.get_tree_entries_flat.return_value = [
+        {"path": "shard_a.json", "type": "blob", "sha": _git_blob_sha(b'{"a": 1}')},
+    ]
+    client.get_blob_texts.return_value = {}
+    client.get_blob_content.return_value = b'{"a": 1}'
+    selective_sync.pull_all()
+
+    selective_sync.push()
+
+    client.create_blob.assert_not_called()
+    client.create_commit.assert_not_called()
+    client.update_ref.assert_not_called()
+
+
+def test_selective_pull_manifest_reads_head_without_listing_tree(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock, tmp_path: Path
+) -> None:
+    client.get_ref_sha.return_value = "head_sha"
+    client.find_file_content.return_value = '{"indexed_at": "abc"}'
+
+    assert selective_sync.pull_manifest() is True
+
+    client.find_file_content.assert_called_once_with("manifest.json", "head_sha")
+    client.get_tree_entries_flat.assert_not_called()
+    assert (tmp_path / "manifest.json").read_text() == '{"indexed_at": "abc"}'
+
+
+def test_selective_pull_manifest_missing_file_returns_false(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock
+) -> None:
+    client.get_ref_sha.return_value = "head_sha"
+    client.find_file_content.return_value = None
+
+    assert selective_sync.pull_manifest() is False
+
+
+def test_selective_pull_blobs_lists_tree_of_manifest_commit(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock, tmp_path: Path
+) -> None:
+    client.get_ref_sha.return_value = "head_sha"
+    client.find_file_content.return_value = "{}"
+    client.get_commit_tree_sha.return_value = "tree_sha"
+    client.get_tree_entries_flat.return_value = [
+        {"path": "shard_a.json", "type": "blob", "sha": "blob_a"},
+    ]
+    client.get_blob_texts.return_value = {"blob_a": "{}"}
+
+    selective_sync.pull_manifest()
+    selective_sync.pull_blobs({"shard_a.json"})
+
+    client.get_ref_sha.assert_called_once()
+    client.get_commit_tree_sha.assert_called_once_with("head_sha")
+    assert (tmp_path / "shard_a.json").exists()
+
+
+def test_selective_pull_blobs_batches_text_and_falls_back_per_blob(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock, tmp_path: Path
+) -> None:
+    client.get_tree_entries_flat.return_value = [
+        {"path": "shard_a.json", "type": "blob", "sha": "blob_a"},
+        {"path": "shard_big.json", "type": "blob", "sha": "blob_big"},
+        {"path": "shard_other.json", "type": "blob", "sha": "blob_other"},
+    ]
+    client.get_blob_texts.return_value = {"blob_a": '{"a": 1}'}
+    client.get_blob_content.return_value = b'{"big": 1}'
+
+    count = selective_sync.pull_blobs({"shard_a.json", "shard_big.json"})
+
+    assert count == 2
+    client.get_blob_texts.assert_called_once_with(["blob_a", "blob_big"])
+    client.get_blob_content.assert_called_once_with("blob_big")
+    assert (tmp_path / "shard_a.json").read_text() == '{"a": 1}'
+    assert (tmp_path / "shard_big.json").read_bytes() == b'{"big": 1}'
+
+
+def test_selective_pull_blobs_serves_pushed_blobs_from_cache(
+    selective_sync: SelectiveGitBranchSync, client: MagicMock, tmp_path: Path
+) -> None:
+    (tmp_path / "shard_a.json").write_text('{"a": 1}')
+    client.create_blob.return_value = "blob_a"
+    client.get_ref_sha.return_value = None
+    client.create_tree.return_value = "tree_sha"
+    client.create_commit.return_value = "commit_sha"
+    selective_sync.push()
+    (tmp_path / "shard_a.json").unlink()
+
+    client.get_ref_sha.return_value = "commit_sha"
+    client.get_tree_entries_flat.return_value = [
+        {"path": "shard_a.json", "type": "blob", "sha": "blob_a"},
+    ]
+    count = selective_sync.pull_blobs({"shard_a.json"})
+
+    assert count == 1
+    client.get_blob_texts.assert_not_called()
+    client.get_blob_content.assert_not_called()
+    assert (tmp_path / "shard_a.json").read_text() == '{"a": 1}'
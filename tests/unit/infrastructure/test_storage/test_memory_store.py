@@ -30,7 +30,11 @@ def store(storage_dir: Path) -> FileMemoryStore:
 def _make_memory(repo_id: str = "org/repo") -> CodebaseMemory:
     outline = CodebaseOutline(
         entries=(
-            FileOutlineEntry(path=FilePath("main.py"), symbols=("main", "helper")),
+            FileOutlineEntry(
+                path=FilePath("main.py"),
+                symbols=("main", "helper"),
+                signatures=("def main() -> None", "def helper(x: int) -> int"),
+            ),
         ),
         version=1,
     )
@@ -68,6 +72,10 @@ class TestFileMemoryStore:
         assert len(loaded.outline.entries) == 1
         assert loaded.outline.entries[0].path == FilePath("main.py")
         assert loaded.outline.entries[0].symbols == ("main", "helper")
+        assert loaded.outline.entries[0].signatures == (
+            "def main() -> None",
+            "def helper(x: int) -> int",
+        )
         assert len(loaded.patterns) == 1
         assert loaded.patterns[0].category == PatternCategory.STYLE
         assert loaded.patterns[0].confidence == 0.9
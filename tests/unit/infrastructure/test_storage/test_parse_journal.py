@@ -0,0 +1,58 @@
+"""Tests for ParseJournal."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from argus.domain.context.entities import FileEntry
+from argus.domain.context.value_objects import Symbol, SymbolKind
+from argus.infrastructure.storage.parse_journal import ParseJournal
+from argus.shared.types import CommitSHA, FilePath, LineRange
+
+
+def _entry(path: str) -> FileEntry:
+    return FileEntry(
+        path=FilePath(path),
+        symbols=(
+            Symbol(
+                name="main",
+                kind=SymbolKind.FUNCTION,
+                line_range=LineRange(start=1, end=3),
+            ),
+        ),
+        imports=(FilePath("lib/util.py"),),
+        exports=("main",),
+        last_indexed=CommitSHA("abc123"),
+    )
+
+
+def test_parse_journal_resumes_same_commit(tmp_path: Path) -> None:
+    with ParseJournal.for_storage_dir(tmp_path, "abc123") as journal:
+        assert journal.load() == {}
+        journal.append(_entry("src/a.py"))
+
+    with ParseJournal.for_storage_dir(tmp_path, "abc123") as journal:
+        resumed = journal.load()
+
+    assert resumed == {FilePath("src/a.py"): _entry("src/a.py")}
+
+
+def test_parse_journal_other_commit_starts_empty(tmp_path: Path) -> None:
+    with ParseJournal.for_storage_dir(tmp_path, "abc123") as journal:
+        journal.load()
+        journal.append(_entry("src/a.py"))
+
+    with ParseJournal.for_storage_dir(tmp_path, "def456") as journal:
+        assert journal.load() == {}
+
+
+def test_parse_journal_discard_removes_files(tmp_path: Path) -> None:
+    journal = ParseJournal.for_storage_dir(tmp_path, "abc123")
+    journal.load()
+    journal.append(_entry("src/a.py"))
+
+    journal.discard()
+
+    assert not journal.path.exists()
+    with ParseJournal.for_storage_dir(tmp_path, "abc123") as reopened:
+        assert reopened.load() == {}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 
 from pathlib import Path
 from unittest.mock import patch
@@ -19,6 +20,7 @@ from argus.infrastructure.storage.artifact_store import (
     FileArtifactStore,
     ShardedArtifactStore,
     _atomic_write_text,
+    _atomic_write_texts,
 )
 from argus.shared.types import CommitSHA, FilePath, LineRange
 
@@ -143,6 +145,31 @@ def test_load_shards_missing_shard_skipped(tmp_path: Path) -> None:
     assert len(partial) == 0
 
 
+def test_load_shards_missing_blob_file_skipped(tmp_path: Path) -> None:
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    store.save_full("org/repo", _build_map())
+    manifest = store.load_manifest("org/repo")
+    assert manifest is not None
+    (tmp_path / manifest.shards[ShardId("lib")].blob_name).unlink()
+
+    partial = store.load_shards("org/repo", {ShardId("src"), ShardId("lib")})
+
+    assert FilePath("src/main.py") in partial
+    assert FilePath("lib/utils.py") not in partial
+
+
+def test_load_shards_reuses_given_manifest(tmp_path: Path) -> None:
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    store.save_full("org/repo", _build_map())
+    manifest = store.load_manifest("org/repo")
+
+    with patch.object(store, "load_manifest") as load_manifest:
+        partial = store.load_shards("org/repo", {ShardId("src")}, manifest=manifest)
+
+    load_manifest.assert_not_called()
+    assert FilePath("src/main.py") in partial
+
+
 # =============================================================================
 # load_or_migrate
 # =============================================================================
@@ -180,6 +207,19 @@ def test_load_or_migrate_legacy(tmp_path: Path) -> None:
     assert result.indexed_at == CommitSHA("legacy")
 
 
+def test_load_or_migrate_reads_manifest_once(tmp_path: Path) -> None:
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    store.save_full("org/repo", _build_map())
+
+    with patch.object(
+        store, "load_manifest", wraps=store.load_manifest
+    ) as load_manifest:
+        result = store.load_or_migrate("org/repo")
+
+    assert result is not None
+    assert load_manifest.call_count == 1
+
+
 def test_load_or_migrate_nothing(tmp_path: Path) -> None:
     store = ShardedArtifactStore(storage_dir=tmp_path)
     assert store.load_or_migrate("org/repo") is None
@@ -308,6 +348,33 @@ def test_atomic_write_no_temp_files_left(tmp_path: Path) -> None:
     assert tmp_files == []
 
 
+def test_atomic_write_texts_syncs_every_file_before_any_rename(
+    tmp_path: Path,
+) -> None:
+    files = {tmp_path / f"shard_{i}.json": f'{{"i": {i}}}' for i in range(3)}
+    events: list[str] = []
+    original_fsync = os.fsync
+    original_replace = Path.replace
+
+    def tracking_fsync(fd: int) -> None:
+        events.append("fsync")
+        original_fsync(fd)
+
+    def tracking_replace(self_path: Path, target: object) -> Path:
+        events.append("rename")
+        return original_replace(self_path, target)
+
+    with (
+        patch("os.fsync", tracking_fsync),
+        patch.object(Path, "replace", tracking_replace),
+    ):
+        _atomic_write_texts(files)
+
+    assert events == ["fsync"] * 3 + ["rename"] * 3
+    assert {p: p.read_text(encoding="utf-8") for p in files} == files
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
 def test_save_full_uses_atomic_write(tmp_path: Path) -> None:
     """save_full leaves no .tmp files behind."""
     store = ShardedArtifactStore(storage_dir=tmp_path)
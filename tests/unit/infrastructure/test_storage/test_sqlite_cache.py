@@ -0,0 +1,34 @@
+"""Tests for the SQLite-backed local cache store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
+
+
+def test_sqlite_cache_max_entries_evicts_oldest_writes(tmp_path: Path) -> None:
+    with SqliteCache.for_storage_dir(tmp_path, "things", max_entries=2) as cache:
+        for key in ("a", "b", "c"):
+            cache.put(key, key.encode())
+        cache.put("a", b"again")
+
+    with SqliteCache.for_storage_dir(tmp_path, "things") as cache:
+        assert [cache.get(key) for key in ("a", "b", "c")] == [b"again", None, b"c"]
+
+
+def test_sqlite_cache_read_only_session_does_not_evict(tmp_path: Path) -> None:
+    with SqliteCache.for_storage_dir(tmp_path, "things") as cache:
+        for key in ("a", "b", "c"):
+            cache.put(key, key.encode())
+
+    with SqliteCache.for_storage_dir(tmp_path, "things", max_entries=1) as cache:
+        assert cache.get("a") == b"a"
+
+
+@pytest.mark.parametrize("table", ["bad-name", "x; DROP TABLE y", "naïve", "1st"])
+def test_sqlite_cache_non_identifier_table_raises(tmp_path: Path, table: str) -> None:
+    with pytest.raises(ValueError, match="invalid cache table name"):
+        SqliteCache.for_storage_dir(tmp_path, table)
@@ -0,0 +1,47 @@
+"""Tests for bootstrap helpers."""
+
+from __future__ import annotations
+
+from argus.interfaces.bootstrap import (
+    PARSEABLE_EXTENSIONS,
+    _select_source_paths,
+    get_parseable_extensions,
+)
+from argus.shared.constants import MAX_FILE_SIZE_BYTES
+
+
+def test_select_source_paths_filters_by_type_extension_and_size() -> None:
+    entries: list[dict[str, object]] = [
+        {"path": "src/a.py", "type": "blob", "size": 10},
+        {"path": "src/big.py", "type": "blob", "size": MAX_FILE_SIZE_BYTES + 1},
+        {"path": "README.md", "type": "blob", "size": 5},
+        {"path": "pkg.py", "type": "tree"},
+        {"path": "dir.py/Makefile", "type": "blob", "size": 1},
+        {"path": "lib/x.cc", "type": "blob"},
+    ]
+
+    paths, repo_bytes = _select_source_paths(entries, frozenset({".py", ".cc"}))
+
+    assert paths == ["src/a.py", "lib/x.cc"]
+    assert repo_bytes == 10 + MAX_FILE_SIZE_BYTES + 1 + 5 + 1
+
+
+def test_select_source_paths_orders_largest_first() -> None:
+    entries: list[dict[str, object]] = [
+        {"path": "a.py", "type": "blob", "size": 10},
+        {"path": "b.py", "type": "blob", "size": 300},
+        {"path": "c.py", "type": "blob", "size": 10},
+        {"path": "d.py", "type": "blob", "size": 20},
+    ]
+
+    paths, _ = _select_source_paths(entries, frozenset({".py"}))
+
+    assert paths == ["b.py", "d.py", "a.py", "c.py"]
+
+
+def test_get_parseable_extensions_reuses_set_for_equal_extras() -> None:
+    first = get_parseable_extensions(["vue", " .svelte "])
+    second = get_parseable_extensions(["vue", " .svelte "])
+
+    assert first is second
+    assert first == PARSEABLE_EXTENSIONS | {".vue", ".svelte"}
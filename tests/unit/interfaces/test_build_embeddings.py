@@ -0,0 +1,118 @@
+"""Tests for bootstrap's embedding index builder."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from argus.domain.context.entities import CodebaseMap, FileEntry
+from argus.domain.context.value_objects import ShardId
+from argus.infrastructure.storage.artifact_store import ShardedArtifactStore
+from argus.interfaces import bootstrap
+from argus.interfaces.bootstrap import _build_embeddings
+from argus.shared.types import CommitSHA, FilePath
+
+_MODEL = "local:fake"
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class _FakeProvider:
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self._fail_on = fail_on
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        if self._fail_on is not None and self._fail_on in texts:
+            raise RuntimeError("provider error")
+        return [[float(len(t)), 1.0] for t in texts]
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+
+def _make_map(paths: list[str]) -> CodebaseMap:
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("abc"))
+    for p in paths:
+        codebase_map.upsert(
+            FileEntry(
+                path=FilePath(p),
+                symbols=(),
+                imports=(),
+                exports=(),
+                last_indexed=CommitSHA("abc"),
+            )
+        )
+    return codebase_map
+
+
+def _run(
+    tmp_path: Path, provider: _FakeProvider, contents: dict[str, str]
+) -> ShardedArtifactStore:
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    with patch(
+        "argus.infrastructure.retrieval.embeddings.create_embedding_provider",
+        return_value=provider,
+    ):
+        _build_embeddings(
+            embedding_model=_MODEL,
+            codebase_map=_make_map(list(contents)),
+            file_contents={FilePath(p): c for p, c in contents.items()},
+            sharded_store=store,
+        )
+    return store
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+def test_build_embeddings_batches_across_shards(tmp_path: Path) -> None:
+    provider = _FakeProvider()
+    contents = {"a/x.py": "x = 1\n", "b/y.py": "y = 22\n", "c/z.py": "z = 333\n"}
+
+    store = _run(tmp_path, provider, contents)
+
+    assert len(provider.batches) == 1
+    indices = store.load_embedding_indices(
+        {ShardId("a"), ShardId("b"), ShardId("c")}, model=_MODEL
+    )
+    assert {i.shard_id: i.chunk_ids for i in indices} == {
+        ShardId("a"): ("a/x.py:<module>",),
+        ShardId("b"): ("b/y.py:<module>",),
+        ShardId("c"): ("c/z.py:<module>",),
+    }
+
+
+def test_build_embeddings_failed_batch_skips_only_its_shards(tmp_path: Path) -> None:
+    provider = _FakeProvider(fail_on="y = 22\n")
+    contents = {"a/x.py": "x = 1\n", "b/y.py": "y = 22\n"}
+
+    with patch.object(bootstrap, "EMBED_BATCH_SIZE", 1):
+        store = _run(tmp_path, provider, contents)
+
+    indices = store.load_embedding_indices({ShardId("a"), ShardId("b")}, model=_MODEL)
+    assert [i.shard_id for i in indices] == [ShardId("a")]
+
+
+def test_build_embeddings_shard_spanning_batches_keeps_order(tmp_path: Path) -> None:
+    provider = _FakeProvider()
+    contents = {"a/x.py": "x\n", "a/y.py": "yy\n", "a/z.py": "zzz\n", "b/w.py": "w\n"}
+
+    with patch.object(bootstrap, "EMBED_BATCH_SIZE", 2):
+        store = _run(tmp_path, provider, contents)
+
+    assert len(provider.batches) == 2
+    (index,) = store.load_embedding_indices({ShardId("a")}, model=_MODEL)
+    pairs = zip(index.chunk_ids, index.embeddings, strict=True)
+    lengths = {cid: vec[0] for cid, vec in pairs}
+    assert lengths == {
+        "a/x.py:<module>": 2.0,
+        "a/y.py:<module>": 3.0,
+        "a/z.py:<module>": 4.0,
+    }
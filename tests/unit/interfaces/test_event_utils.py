@@ -0,0 +1,48 @@
+"""Tests for event_utils shared helpers."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from argus.interfaces.event_utils import load_event
+from argus.shared.exceptions import ConfigurationError
+
+
+def test_load_event_returns_payload(tmp_path: Path) -> None:
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps({"after": "abc", "number": 3}))
+
+    assert load_event(str(event_path)) == {"after": "abc", "number": 3}
+
+
+def test_load_event_raises_on_invalid_json(tmp_path: Path) -> None:
+    event_path = tmp_path / "event.json"
+    event_path.write_text("{not json")
+
+    with pytest.raises(ConfigurationError, match="Invalid event JSON"):
+        load_event(str(event_path))
+
+
+def test_load_event_raises_on_undecodable_bytes(tmp_path: Path) -> None:
+    event_path = tmp_path / "event.json"
+    event_path.write_bytes(b'{"title": "\xff"}')
+
+    with pytest.raises(ConfigurationError, match="Invalid event JSON"):
+        load_event(str(event_path))
+
+
+def test_load_event_raises_on_non_object(tmp_path: Path) -> None:
+    event_path = tmp_path / "event.json"
+    event_path.write_text("[1, 2, 3]")
+
+    with pytest.raises(ConfigurationError, match="expected an object"):
+        load_event(str(event_path))
+
+
+def test_load_event_raises_on_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(ConfigurationError, match="Event file not found"):
+        load_event(str(tmp_path / "missing.json"))
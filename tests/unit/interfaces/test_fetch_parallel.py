@@ -1,10 +1,16 @@
-"""Tests for _fetch_files_parallel in action.py."""
+"""Tests for the parallel file fetch helpers in action.py and bootstrap.py."""
 
 from __future__ import annotations
 
+import threading
+import time
+
+from pathlib import Path
 from unittest.mock import MagicMock
 
-from argus.interfaces.action import _fetch_files_parallel
+from argus.infrastructure.storage.blob_cache import BlobContentCache
+from argus.interfaces.action import _fetch_files_parallel, _iter_context_files
+from argus.interfaces.bootstrap import _iter_files_parallel, _iter_source_files
 from argus.shared.exceptions import PublishError
 from argus.shared.types import FilePath
 
@@ -55,3 +61,185 @@ def test_fetch_files_parallel_empty_paths_returns_empty_dict() -> None:
 
     assert result == {}
     client.get_file_content.assert_not_called()
+
+
+def test_iter_files_parallel_yields_fetched_pairs() -> None:
+    client = _make_client(
+        {"a.py": "code_a", "b.py": "code_b", "c.py": "code_c"},
+        error_paths={"c.py"},
+    )
+    paths = [FilePath("a.py"), FilePath("b.py"), FilePath("c.py")]
+
+    result = list(_iter_files_parallel(client, paths, ref="abc123"))
+
+    assert sorted(result) == [
+        (FilePath("a.py"), "code_a"),
+        (FilePath("b.py"), "code_b"),
+    ]
+
+
+def test_iter_files_parallel_empty_paths_yields_nothing() -> None:
+    client = MagicMock()
+
+    result = list(_iter_files_parallel(client, [], ref="abc123"))
+
+    assert result == []
+    client.get_file_content.assert_not_called()
+
+
+def test_iter_files_parallel_max_workers_bounds_in_flight_requests() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def get_file_content(path: FilePath, *, ref: str) -> str:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return str(path)
+
+    client = MagicMock()
+    client.get_file_content = MagicMock(side_effect=get_file_content)
+    paths = [FilePath(f"{i}.py") for i in range(6)]
+
+    result = list(_iter_files_parallel(client, paths, ref="abc123", max_workers=2))
+
+    assert len(result) == 6
+    assert peak <= 2
+
+
+def test_iter_source_files_fetches_tarball_misses_individually() -> None:
+    client = _make_client({"b.py": "code_b"})
+    client.download_tarball = MagicMock(return_value=iter([("a.py", b"code_a")]))
+    paths = [FilePath("a.py"), FilePath("b.py")]
+
+    result = dict(_iter_source_files(client, paths, ref="abc123", use_tarball=True))
+
+    assert result == {FilePath("a.py"): "code_a", FilePath("b.py"): "code_b"}
+    client.get_file_content.assert_called_once_with(FilePath("b.py"), ref="abc123")
+
+
+def test_iter_source_files_extensions_picks_up_unlisted_sources() -> None:
+    client = _make_client({})
+    client.download_tarball = MagicMock(
+        return_value=iter([("a.py", b"code_a"), ("extra.py", b"code_extra")])
+    )
+
+    result = dict(
+        _iter_source_files(
+            client,
+            [FilePath("a.py")],
+            ref="abc123",
+            use_tarball=True,
+            extensions=frozenset({".py"}),
+        )
+    )
+
+    assert result == {FilePath("a.py"): "code_a", FilePath("extra.py"): "code_extra"}
+    include = client.download_tarball.call_args.kwargs["include"]
+    assert include("pkg/mod.py", 10)
+    assert not include("pkg/notes.md", 10)
+    client.get_file_content.assert_not_called()
+
+
+def test_iter_source_files_tarball_failure_falls_back() -> None:
+    client = _make_client({"a.py": "code_a"})
+    client.download_tarball = MagicMock(side_effect=PublishError("too big"))
+
+    result = dict(
+        _iter_source_files(client, [FilePath("a.py")], ref="abc123", use_tarball=True)
+    )
+
+    assert result == {FilePath("a.py"): "code_a"}
+
+
+def test_iter_source_files_without_tarball_uses_rest() -> None:
+    client = _make_client({"a.py": "code_a"})
+
+    result = dict(
+        _iter_source_files(client, [FilePath("a.py")], ref="abc123", use_tarball=False)
+    )
+
+    assert result == {FilePath("a.py"): "code_a"}
+    client.download_tarball.assert_not_called()
+
+
+def test_iter_source_files_blob_shas_fetches_in_graphql_batches() -> None:
+    client = _make_client({"c.py": "code_c"})
+    client.get_blob_texts = MagicMock(return_value={"sha-ab": "shared"})
+    paths = [FilePath("a.py"), FilePath("b.py"), FilePath("c.py")]
+    blob_shas = {"a.py": "sha-ab", "b.py": "sha-ab", "c.py": "sha-c"}
+
+    result = dict(
+        _iter_source_files(
+            client, paths, ref="abc123", use_tarball=False, blob_shas=blob_shas
+        )
+    )
+
+    assert result == {
+        FilePath("a.py"): "shared",
+        FilePath("b.py"): "shared",
+        FilePath("c.py"): "code_c",
+    }
+    client.get_blob_texts.assert_called_once_with(["sha-ab", "sha-c"])
+    client.get_file_content.assert_called_once_with(FilePath("c.py"), ref="abc123")
+
+
+def test_iter_source_files_graphql_failure_falls_back_to_rest() -> None:
+    client = _make_client({"a.py": "code_a"})
+    client.get_blob_texts = MagicMock(side_effect=PublishError("HTTP 502"))
+
+    result = dict(
+        _iter_source_files(
+            client,
+            [FilePath("a.py")],
+            ref="abc123",
+            use_tarball=False,
+            blob_shas={"a.py": "sha-a"},
+        )
+    )
+
+    assert result == {FilePath("a.py"): "code_a"}
+
+
+def test_iter_context_files_serves_cached_blobs(tmp_path: Path) -> None:
+    client = _make_client({"a.py": "code_a", "b.py": "code_b"})
+    client.get_tree_recursive = MagicMock(
+        return_value=(
+            [
+                {"path": "a.py", "type": "blob", "sha": "sha-a"},
+                {"path": "b.py", "type": "blob", "sha": "sha-b"},
+            ],
+            False,
+        )
+    )
+    paths = [FilePath("a.py"), FilePath("b.py")]
+
+    with BlobContentCache.for_storage_dir(tmp_path) as cache:
+        cache.put("sha-a", "cached_a")
+        result = dict(
+            _iter_context_files(client, paths, ref="abc123", blob_cache=cache)
+        )
+    with BlobContentCache.for_storage_dir(tmp_path) as cache:
+        assert cache.get("sha-b") == "code_b"
+
+    assert result == {FilePath("a.py"): "cached_a", FilePath("b.py"): "code_b"}
+    client.get_file_content.assert_called_once_with(FilePath("b.py"), ref="abc123")
+
+
+def test_iter_context_files_tree_failure_fetches_all(tmp_path: Path) -> None:
+    client = _make_client({"a.py": "code_a"})
+    client.get_tree_recursive = MagicMock(side_effect=PublishError("boom"))
+
+    with BlobContentCache.for_storage_dir(tmp_path) as cache:
+        result = dict(
+            _iter_context_files(
+                client, [FilePath("a.py")], ref="abc123", blob_cache=cache
+            )
+        )
+
+    assert result == {FilePath("a.py"): "code_a"}
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pydantic_ai import CachePoint, UserContent
+
 from argus.domain.llm.value_objects import LLMUsage, ModelConfig
 from argus.domain.retrieval.value_objects import ContextItem, RetrievalResult
 from argus.domain.review.value_objects import (
@@ -16,9 +20,13 @@ from argus.domain.review.value_objects import (
     PRContext,
     ReviewRequest,
 )
+from argus.infrastructure.llm_providers.token_counter import count_tokens
+from argus.infrastructure.storage.sqlite_cache import SqliteCache
 from argus.interfaces.review_generator import (
+    REVIEW_CACHE_TABLE,
     LLMReviewGenerator,
     ReviewOutput,
+    _prompt_overhead_tokens,
 )
 from argus.shared.types import (
     Category,
@@ -29,6 +37,10 @@ from argus.shared.types import (
 )
 
 
+def _prompt_text(prompt: list[UserContent]) -> str:
+    return "".join(part for part in prompt if isinstance(part, str))
+
+
 @pytest.fixture
 def model_config() -> ModelConfig:
     return ModelConfig(
@@ -209,7 +221,7 @@ class TestLLMReviewGenerator:
         generator = LLMReviewGenerator(config=model_config)
         generator.generate(review_request)
 
-        call_args = mock_agent.run_sync.call_args[0][0]
+        call_args = _prompt_text(mock_agent.run_sync.call_args[0][0])
         assert "foo.py" in call_args
         assert "import os" in call_args
         assert "bar.py" in call_args
@@ -262,7 +274,7 @@ class TestLLMReviewGenerator:
         generator = LLMReviewGenerator(config=model_config)
         generator.generate(request)
 
-        prompt = mock_agent.run_sync.call_args[0][0]
+        prompt = _prompt_text(mock_agent.run_sync.call_args[0][0])
         assert "## PR Context" in prompt
         assert "CI Status: FAILURE" in prompt
         assert "Behind base by 5 commits" in prompt
@@ -270,6 +282,105 @@ class TestLLMReviewGenerator:
         assert "@reviewer" in prompt
         assert "Fix auth timeout" in prompt
 
+    def test_prompt_puts_stable_sections_before_cache_point(
+        self,
+        model_config: ModelConfig,
+    ) -> None:
+        request = ReviewRequest(
+            diff_text="+x = 1",
+            context=RetrievalResult(
+                items=(
+                    ContextItem(
+                        source=FilePath("z.py"),
+                        content="z",
+                        relevance_score=0.9,
+                        token_cost=TokenCount(1),
+                    ),
+                    ContextItem(
+                        source=FilePath("a.py"),
+                        content="a",
+                        relevance_score=0.5,
+                        token_cost=TokenCount(1),
+                    ),
+                )
+            ),
+            codebase_outline_text="src/\n  main.py",
+            codebase_patterns_text="- Use dataclasses",
+        )
+
+        prompt = LLMReviewGenerator(config=model_config)._build_prompt(request)
+
+        stable, cache_point, volatile = prompt
+        assert isinstance(cache_point, CachePoint)
+        assert isinstance(stable, str)
+        assert isinstance(volatile, str)
+        assert "## Codebase Patterns" in stable
+        assert "## Codebase Outline" in stable
+        assert volatile.index("### a.py") < volatile.index("### z.py")
+        assert volatile.endswith("+x = 1\n```")
+
+    def test_prompt_without_stable_sections_has_no_cache_point(
+        self,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+    ) -> None:
+        prompt = LLMReviewGenerator(config=model_config)._build_prompt(review_request)
+
+        assert len(prompt) == 1
+        assert not any(isinstance(part, CachePoint) for part in prompt)
+
+    def test_prompt_over_budget_outline_is_trimmed_to_leading_lines(
+        self,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+    ) -> None:
+        outline = "".join(f"# src/mod_{i:03d}.py\n  def f_{i}()\n" for i in range(500))
+        request = replace(review_request, codebase_outline_text=outline)
+
+        prompt = LLMReviewGenerator(config=model_config)._build_prompt(request)
+
+        stable = _prompt_text(prompt[:1])
+        assert "# src/mod_000.py\n  def f_0()" in stable
+        assert "# src/mod_499.py" not in stable
+        assert stable.endswith("()\n```\n\n")
+
+    def test_prompt_over_budget_outline_is_measured_only_up_to_budget(
+        self,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+    ) -> None:
+        outline = "".join(f"# src/mod_{i:05d}.py\n" for i in range(20_000))
+        request = replace(review_request, codebase_outline_text=outline)
+
+        with patch(
+            "argus.interfaces.review_generator.count_tokens", wraps=count_tokens
+        ) as counter:
+            LLMReviewGenerator(config=model_config)._build_prompt(request)
+
+        measured = sum(
+            len(piece) for call in counter.call_args_list for piece in call.args[0]
+        )
+        assert measured < len(outline) // 10
+
+    def test_prompt_budget_left_after_overhead_drops_outline(
+        self,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+    ) -> None:
+        diff_tokens = count_tokens(
+            ["## Diff\n```\n", review_request.diff_text, "\n```"]
+        )
+        config = replace(
+            model_config,
+            max_tokens=TokenCount(_prompt_overhead_tokens() + diff_tokens),
+        )
+        request = replace(review_request, codebase_outline_text="# src/a.py\n")
+
+        prompt = LLMReviewGenerator(config=config)._build_prompt(request)
+
+        assert "# src/a.py" not in _prompt_text(prompt)
+        assert review_request.diff_text in _prompt_text(prompt)
+
     @patch("argus.interfaces.review_generator.create_agent")
     def test_generate_logs_warning_on_unknown_severity_category(
         self,
@@ -312,6 +423,114 @@ class TestLLMReviewGenerator:
         assert "Unknown severity 'alien'" in caplog.text
         assert "Unknown category 'quantum'" in caplog.text
 
+    @patch("argus.interfaces.review_generator.create_agent")
+    def test_generate_reuses_agent_across_calls(
+        self,
+        mock_create_agent: MagicMock,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+        sample_review_output: ReviewOutput,
+    ) -> None:
+        mock_agent = MagicMock()
+        mock_agent.run_sync.return_value.output = sample_review_output
+        mock_create_agent.return_value = mock_agent
+
+        generator = LLMReviewGenerator(config=model_config)
+        generator.generate(review_request)
+        generator.generate(review_request)
+
+        mock_create_agent.assert_called_once()
+        assert mock_agent.run_sync.call_count == 2
+
+    @patch("argus.interfaces.review_generator.create_agent")
+    def test_generate_identical_request_served_from_cache(
+        self,
+        mock_create_agent: MagicMock,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+        sample_review_output: ReviewOutput,
+        tmp_path: Path,
+    ) -> None:
+        mock_agent = MagicMock()
+        mock_result = MagicMock()
+        mock_result.output = sample_review_output
+        mock_agent.run_sync.return_value = mock_result
+        mock_create_agent.return_value = mock_agent
+
+        with SqliteCache.for_storage_dir(tmp_path, REVIEW_CACHE_TABLE) as cache:
+            generator = LLMReviewGenerator(config=model_config, response_cache=cache)
+            first, _ = generator.generate(review_request)
+        with SqliteCache.for_storage_dir(tmp_path, REVIEW_CACHE_TABLE) as cache:
+            generator = LLMReviewGenerator(config=model_config, response_cache=cache)
+            second, usage = generator.generate(review_request)
+
+        assert mock_agent.run_sync.call_count == 1
+        assert second == first
+        assert usage == LLMUsage()
+
+    @patch("argus.interfaces.review_generator.create_agent")
+    def test_generate_nonzero_temperature_bypasses_cache(
+        self,
+        mock_create_agent: MagicMock,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+        sample_review_output: ReviewOutput,
+        tmp_path: Path,
+    ) -> None:
+        mock_agent = MagicMock()
+        mock_agent.run_sync.return_value.output = sample_review_output
+        mock_create_agent.return_value = mock_agent
+        config = replace(model_config, temperature=0.7)
+
+        with SqliteCache.for_storage_dir(tmp_path, REVIEW_CACHE_TABLE) as cache:
+            generator = LLMReviewGenerator(config=config, response_cache=cache)
+            generator.generate(review_request)
+            generator.generate(review_request)
+
+        assert mock_agent.run_sync.call_count == 2
+
+    @patch("argus.interfaces.review_generator.create_agent")
+    def test_generate_changed_diff_misses_cache(
+        self,
+        mock_create_agent: MagicMock,
+        model_config: ModelConfig,
+        review_request: ReviewRequest,
+        sample_review_output: ReviewOutput,
+        tmp_path: Path,
+    ) -> None:
+        mock_agent = MagicMock()
+        mock_result = MagicMock()
+        mock_result.output = sample_review_output
+        mock_agent.run_sync.return_value = mock_result
+        mock_create_agent.return_value = mock_agent
+
+        with SqliteCache.for_storage_dir(tmp_path, REVIEW_CACHE_TABLE) as cache:
+            generator = LLMReviewGenerator(config=model_config, response_cache=cache)
+            generator.generate(review_request)
+            generator.generate(
+                replace(review_request, diff_text=review_request.diff_text + "\n+y")
+            )
+
+        assert mock_agent.run_sync.call_count == 2
+
+
+class TestReviewOutput:
+    """Test the structured output schema."""
+
+    def test_comment_output_lowercases_severity_and_category(self) -> None:
+        comment = ReviewOutput.CommentOutput(
+            file="a.py",
+            line_start=1,
+            line_end=1,
+            severity="Critical",
+            category="SECURITY",
+            body="Injection risk",
+            confidence=0.9,
+        )
+
+        assert comment.severity == "critical"
+        assert comment.category == "security"
+
 
 class TestFormatPrContext:
     """Test _format_pr_context helper."""
@@ -339,7 +558,7 @@ class TestFormatPrContext:
             related_items=[],
         )
         generator = LLMReviewGenerator(config=model_config)
-        result = generator._format_pr_context(pr_ctx)
+        result = "".join(generator._format_pr_context(pr_ctx))
 
         assert "## PR Context" in result
         assert "Add feature" in result
@@ -362,7 +581,7 @@ class TestFormatPrContext:
             related_items=[],
         )
         generator = LLMReviewGenerator(config=model_config)
-        result = generator._format_pr_context(pr_ctx)
+        result = "".join(generator._format_pr_context(pr_ctx))
 
         assert "missing or very short" in result
 
@@ -401,7 +620,7 @@ class TestFormatPrContext:
             related_items=[],
         )
         generator = LLMReviewGenerator(config=model_config)
-        result = generator._format_pr_context(pr_ctx)
+        result = "".join(generator._format_pr_context(pr_ctx))
 
         # Issue comment — no file info.
         assert "@reviewer (2026-02-17T10:00:00Z)" in result
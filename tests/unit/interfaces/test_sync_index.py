@@ -3,20 +3,42 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
+import subprocess
+import sys
+import threading
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from argus.domain.context.entities import CodebaseMap, FileEntry
+from argus.domain.context.value_objects import (
+    EmbeddingIndex,
+    ShardedManifest,
+    ShardId,
+    chunk_content_hash,
+)
+from argus.domain.memory.value_objects import CodebaseOutline, FileOutlineEntry
+from argus.infrastructure.parsing.chunker import Chunker
+from argus.infrastructure.parsing.tree_sitter_parser import TreeSitterParser
 from argus.infrastructure.storage.artifact_store import ShardedArtifactStore
+from argus.infrastructure.storage.blob_cache import BlobContentCache
 from argus.interfaces.sync_index import (
-    _extract_after_sha,
+    _extract_push_summary,
+    _handle_manifest_path,
     _incremental_update_sharded,
     _is_parseable,
+    _iter_changed_files,
+    _iter_files_parallel,
+    _maybe_build_embeddings,
+    _outline_unchanged,
+    _refresh_outline,
 )
-from argus.shared.exceptions import ConfigurationError
+from argus.interfaces.toml_config import ArgusConfig
+from argus.shared.exceptions import ArgusError, ConfigurationError
 from argus.shared.types import CommitSHA, FilePath
 
 # =============================================================================
@@ -36,39 +58,101 @@ def test_is_parseable_no_extension() -> None:
     assert _is_parseable("Makefile", frozenset({".py"})) is False
 
 
+def test_is_parseable_dotted_directory_no_extension() -> None:
+    assert _is_parseable("pkg.py/Makefile", frozenset({".py"})) is False
+
+
 # =============================================================================
-# _extract_after_sha tests
+# _extract_push_summary tests
 # =============================================================================
 
 
-def test_extract_after_sha_valid(tmp_path: Path) -> None:
+def test_extract_push_summary_after_sha_valid(tmp_path: Path) -> None:
     event = {"before": "aaa111", "after": "bbb222"}
     event_path = tmp_path / "event.json"
     event_path.write_text(json.dumps(event))
 
-    after = _extract_after_sha(str(event_path))
+    after = _extract_push_summary(str(event_path)).after_sha
     assert after == "bbb222"
 
 
-def test_extract_after_sha_missing_field(tmp_path: Path) -> None:
+def test_extract_push_summary_missing_field(tmp_path: Path) -> None:
     event = {"ref": "refs/heads/main"}
     event_path = tmp_path / "event.json"
     event_path.write_text(json.dumps(event))
 
     with pytest.raises(ConfigurationError, match="after"):
-        _extract_after_sha(str(event_path))
+        _extract_push_summary(str(event_path))
 
 
-def test_extract_after_sha_missing_file() -> None:
+def test_extract_push_summary_missing_file() -> None:
     with pytest.raises(ConfigurationError, match="Event file not found"):
-        _extract_after_sha("/nonexistent/path/event.json")
+        _extract_push_summary("/nonexistent/path/event.json")
 
 
-def test_extract_after_sha_invalid_json(tmp_path: Path) -> None:
+def test_extract_push_summary_invalid_json(tmp_path: Path) -> None:
     bad_file = tmp_path / "bad.json"
     bad_file.write_text("not valid json{{{")
     with pytest.raises(ConfigurationError, match="Invalid event JSON"):
-        _extract_after_sha(str(bad_file))
+        _extract_push_summary(str(bad_file))
+
+
+def _write_push_event(tmp_path: Path, **fields: object) -> str:
+    event: dict[str, object] = {"before": "aaa111", "after": "bbb222", **fields}
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps(event))
+    return str(event_path)
+
+
+def test_extract_push_summary_unions_commit_file_lists(tmp_path: Path) -> None:
+    commits = [
+        {"added": ["src/new.py"], "modified": ["README.md"], "removed": []},
+        {"added": [], "modified": [], "removed": ["src/old.py"]},
+    ]
+
+    push = _extract_push_summary(_write_push_event(tmp_path, commits=commits))
+
+    assert push.before_sha == "aaa111"
+    assert push.changed_files == {"src/new.py", "README.md", "src/old.py"}
+
+
+def test_extract_push_summary_forced_push_files_unknown(tmp_path: Path) -> None:
+    commits = [{"added": [], "modified": ["README.md"], "removed": []}]
+    event_path = _write_push_event(tmp_path, commits=commits, forced=True)
+
+    assert _extract_push_summary(event_path).changed_files is None
+
+
+def test_extract_push_summary_capped_commit_list_files_unknown(
+    tmp_path: Path,
+) -> None:
+    commits = [{"added": [], "modified": ["README.md"], "removed": []}] * 20
+
+    push = _extract_push_summary(_write_push_event(tmp_path, commits=commits))
+
+    assert push.changed_files is None
+
+
+def test_handle_manifest_path_non_source_push_skips_compare(tmp_path: Path) -> None:
+    commits = [{"added": [], "modified": ["README.md"], "removed": []}]
+    push = _extract_push_summary(_write_push_event(tmp_path, commits=commits))
+    client = MagicMock()
+    cfg = ArgusConfig(model="m", max_tokens=100)
+
+    changed_files, _, _ = _handle_manifest_path(
+        client,
+        TreeSitterParser(),
+        ShardedArtifactStore(storage_dir=tmp_path),
+        MagicMock(),
+        ShardedManifest(indexed_at=CommitSHA("aaa111")),
+        "owner/repo",
+        "bbb222",
+        cfg,
+        push=push,
+    )
+
+    assert changed_files is None
+    client.compare_commit_blobs.assert_not_called()
 
 
 # =============================================================================
@@ -81,11 +165,12 @@ def test_incremental_update_sharded_processes_changed_files(
 ) -> None:
     """Changed parseable files are fetched, parsed, and upserted."""
     client = MagicMock()
-    client.compare_commits.return_value = [
-        "src/auth.py",
-        "README.md",  # not parseable
-        "src/utils.py",
-    ]
+    client.compare_commit_blobs.return_value = {
+        "src/auth.py": "sha-auth",
+        "README.md": "sha-readme",  # not parseable
+        "src/utils.py": "sha-utils",
+    }
+    client.get_blob_texts.return_value = {"sha-auth": "def hello(): pass\n"}
     client.get_file_content.return_value = "def hello(): pass\n"
 
     parser = MagicMock()
@@ -111,11 +196,13 @@ def test_incremental_update_sharded_processes_changed_files(
         "bbb222",
     )
 
-    # compare_commits called with before/after
-    client.compare_commits.assert_called_once_with("aaa111", "bbb222")
+    # compare_commit_blobs called with before/after
+    client.compare_commit_blobs.assert_called_once_with("aaa111", "bbb222")
 
-    # Only parseable files fetched (auth.py, utils.py — not README.md)
-    assert client.get_file_content.call_count == 2
+    # Only parseable files fetched (utils.py by path, as its blob came back empty)
+    client.get_blob_texts.assert_called_once_with(["sha-auth", "sha-utils"])
+    assert client.get_file_content.call_count == 1
+    assert parser.parse.call_count == 2
 
     # indexed_at updated
     assert codebase_map.indexed_at == CommitSHA("bbb222")
@@ -133,7 +220,7 @@ def test_incremental_update_sharded_no_parseable_changes_skips(
 ) -> None:
     """When no parseable files changed, nothing happens."""
     client = MagicMock()
-    client.compare_commits.return_value = ["README.md", "docs/guide.txt"]
+    client.compare_commit_blobs.return_value = {"README.md": "a", "docs/guide.txt": "b"}
 
     parser = MagicMock()
     store = ShardedArtifactStore(storage_dir=tmp_path)
@@ -155,3 +242,398 @@ def test_incremental_update_sharded_no_parseable_changes_skips(
     assert codebase_map.indexed_at == CommitSHA("aaa111")
     assert _changed_files == []
     assert orphaned == set()
+
+
+def test_incremental_update_sharded_skips_failed_fetches(tmp_path: Path) -> None:
+    """A file that cannot be fetched is skipped; the rest are still parsed."""
+    client = MagicMock()
+    client.compare_commit_blobs.return_value = {
+        "src/a.py": "sha-a",
+        "src/gone.py": "sha-g",
+    }
+    client.get_blob_texts.return_value = {}
+
+    def get_file_content(path: FilePath, *, ref: str) -> str:
+        if path == "src/gone.py":
+            raise ArgusError("Not found")
+        return "x = 1\n"
+
+    client.get_file_content.side_effect = get_file_content
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("aaa111"))
+
+    _incremental_update_sharded(
+        client,
+        TreeSitterParser(),
+        ShardedArtifactStore(storage_dir=tmp_path),
+        codebase_map,
+        "owner/repo",
+        "aaa111",
+        "bbb222",
+    )
+
+    assert codebase_map.files() == {FilePath("src/a.py")}
+
+
+def test_incremental_update_sharded_drops_removed_files_without_fetching(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    client = MagicMock()
+    client.compare_commit_blobs.return_value = {"src/a.py": None, "src/b.py": "sha-b"}
+    client.get_blob_texts.return_value = {"sha-b": "y = 2\n"}
+    parser = TreeSitterParser()
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("aaa111"))
+    codebase_map.upsert(parser.parse(FilePath("src/a.py"), "x = 1\n"))
+
+    with caplog.at_level(logging.WARNING, logger="argus.interfaces.sync_index"):
+        changed, _ = _incremental_update_sharded(
+            client,
+            parser,
+            ShardedArtifactStore(storage_dir=tmp_path),
+            codebase_map,
+            "owner/repo",
+            "aaa111",
+            "bbb222",
+        )
+
+    client.get_file_content.assert_not_called()
+    assert caplog.records == []
+    assert codebase_map.files() == {FilePath("src/b.py")}
+    assert changed == [FilePath("src/a.py"), FilePath("src/b.py")]
+
+
+def _file_texts(ref: str, paths: list[str]) -> dict[str, str]:
+    return {path: f"# {path}\n" for path in paths}
+
+
+def test_maybe_build_embeddings_embeds_fetched_files_in_path_order(
+    tmp_path: Path,
+) -> None:
+    client = MagicMock()
+    client.get_file_texts.return_value = {}
+    client.get_file_content.side_effect = lambda path, *, ref: f"# {path}\n"
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("bbb222"))
+    parser = TreeSitterParser()
+    for name in ("b", "a"):
+        path = FilePath(f"src/{name}.py")
+        codebase_map.upsert(parser.parse(path, "x = 1\n"))
+    provider = MagicMock(dimension=2)
+    provider.embed.side_effect = lambda texts: [[0.0, 1.0] for _ in texts]
+    cfg = ArgusConfig(model="m", max_tokens=100, embedding_model="openai-emb:x")
+
+    with patch(
+        "argus.infrastructure.retrieval.embeddings.create_embedding_provider",
+        return_value=provider,
+    ):
+        _maybe_build_embeddings(
+            cfg,
+            tmp_path,
+            codebase_map,
+            [FilePath("src/a.py")],
+            client,
+            "bbb222",
+        )
+
+    assert provider.embed.call_args.args[0] == ["# src/a.py\n", "# src/b.py\n"]
+    client.get_file_texts.assert_called_once()
+    assert client.get_file_content.call_count == 2
+
+
+def test_maybe_build_embeddings_batches_chunks_across_shards(tmp_path: Path) -> None:
+    client = MagicMock()
+    client.get_file_texts.side_effect = _file_texts
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("bbb222"))
+    parser = TreeSitterParser()
+    changed = [FilePath("src/a.py"), FilePath("lib/b.py")]
+    for path in changed:
+        codebase_map.upsert(parser.parse(path, "x = 1\n"))
+    provider = MagicMock(dimension=2)
+    provider.embed.side_effect = lambda texts: [[float(len(t)), 1.0] for t in texts]
+    cfg = ArgusConfig(model="m", max_tokens=100, embedding_model="openai-emb:x")
+
+    with patch(
+        "argus.infrastructure.retrieval.embeddings.create_embedding_provider",
+        return_value=provider,
+    ):
+        _maybe_build_embeddings(cfg, tmp_path, codebase_map, changed, client, "bbb222")
+
+    provider.embed.assert_called_once()
+    client.get_file_content.assert_not_called()
+    indices = ShardedArtifactStore(storage_dir=tmp_path).load_embedding_indices(
+        {ShardId("src"), ShardId("lib")}, model="openai-emb:x"
+    )
+    assert {i.shard_id: i.chunk_ids for i in indices} == {
+        ShardId("lib"): ("lib/b.py:<module>",),
+        ShardId("src"): ("src/a.py:<module>",),
+    }
+
+
+def test_maybe_build_embeddings_reuses_cached_chunks(tmp_path: Path) -> None:
+    client = MagicMock()
+    client.get_file_texts.side_effect = _file_texts
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("bbb222"))
+    changed = [FilePath("src/a.py")]
+    codebase_map.upsert(TreeSitterParser().parse(changed[0], "x = 1\n"))
+    provider = MagicMock(dimension=2)
+    provider.embed.side_effect = lambda texts: [[0.0, 1.0] for _ in texts]
+    cfg = ArgusConfig(model="m", max_tokens=100, embedding_model="openai-emb:x")
+
+    with (
+        patch(
+            "argus.infrastructure.retrieval.embeddings.create_embedding_provider",
+            return_value=provider,
+        ),
+        patch(
+            "argus.infrastructure.parsing.chunker.Chunker.chunk",
+            autospec=True,
+            side_effect=Chunker.chunk,
+        ) as chunk,
+    ):
+        for _ in range(2):
+            _maybe_build_embeddings(
+                cfg, tmp_path, codebase_map, changed, client, "bbb222"
+            )
+
+    assert chunk.call_count == 1
+    provider.embed.assert_called_once()
+
+
+def test_maybe_build_embeddings_reuses_vectors_of_unchanged_chunks(
+    tmp_path: Path,
+) -> None:
+    client = MagicMock()
+    client.get_file_texts.side_effect = _file_texts
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("bbb222"))
+    paths = [FilePath("src/a.py"), FilePath("src/b.py")]
+    for path in paths:
+        codebase_map.upsert(TreeSitterParser().parse(path, "x = 1\n"))
+    provider = MagicMock(dimension=2)
+    provider.embed.side_effect = lambda texts: [[float(len(t)), 1.0] for t in texts]
+    cfg = ArgusConfig(model="m", max_tokens=100, embedding_model="openai-emb:x")
+    sync = MagicMock()
+
+    with patch(
+        "argus.infrastructure.retrieval.embeddings.create_embedding_provider",
+        return_value=provider,
+    ):
+        _maybe_build_embeddings(cfg, tmp_path, codebase_map, paths, client, "bbb222")
+        client.get_file_texts.side_effect = lambda ref, ps: {
+            **_file_texts(ref, ps),
+            "src/a.py": "# a, edited\n",
+        }
+        _maybe_build_embeddings(
+            cfg, tmp_path, codebase_map, paths[:1], client, "ccc333", sync=sync
+        )
+
+    assert provider.embed.call_args.args[0] == ["# a, edited\n"]
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    blob_name = store.embedding_blob_name(ShardId("src"), "openai-emb:x")
+    sync.pull_blobs.assert_called_once_with({blob_name})
+    [index] = store.load_embedding_indices({ShardId("src")}, model="openai-emb:x")
+    assert index.embeddings == ((12.0, 1.0), (11.0, 1.0))
+
+
+def test_maybe_build_embeddings_reembeds_stale_vectors_outside_changed_files(
+    tmp_path: Path,
+) -> None:
+    """A file whose old vector no longer matches its text is re-embedded."""
+    client = MagicMock()
+    client.get_file_texts.side_effect = _file_texts
+    codebase_map = CodebaseMap(indexed_at=CommitSHA("bbb222"))
+    paths = [FilePath("src/a.py"), FilePath("src/b.py")]
+    for path in paths:
+        codebase_map.upsert(TreeSitterParser().parse(path, "x = 1\n"))
+    provider = MagicMock(dimension=2)
+    provider.embed.side_effect = lambda texts: [[float(len(t)), 1.0] for t in texts]
+    cfg = ArgusConfig(model="m", max_tokens=100, embedding_model="openai-emb:x")
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+    store.save_embedding_index(
+        EmbeddingIndex(
+            shard_id=ShardId("src"),
+            embeddings=((0.0, 0.0), (0.0, 0.0)),
+            chunk_ids=("src/a.py:<module>", "src/b.py:<module>"),
+            dimension=2,
+            model="openai-emb:x",
+            content_hashes=(
+                chunk_content_hash("# src/a.py\n"),
+                chunk_content_hash("# b from a failed run\n"),
+            ),
+        )
+    )
+
+    with patch(
+        "argus.infrastructure.retrieval.embeddings.create_embedding_provider",
+        return_value=provider,
+    ):
+        _maybe_build_embeddings(
+            cfg, tmp_path, codebase_map, paths[:1], client, "ccc333"
+        )
+
+    provider.embed.assert_called_once_with(["# src/b.py\n"])
+    [index] = store.load_embedding_indices({ShardId("src")}, model="openai-emb:x")
+    assert index.embeddings == ((0.0, 0.0), (11.0, 1.0))
+
+
+def test_iter_files_parallel_reports_fetch_failures_once(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    client = MagicMock()
+    client.get_file_content.side_effect = ArgusError("Not found")
+    paths = [FilePath(f"src/{name}.py") for name in "abc"]
+
+    with caplog.at_level(logging.WARNING, logger="argus.interfaces.sync_index"):
+        assert list(_iter_files_parallel(client, paths, ref="bbb222")) == []
+
+    [record] = caplog.records
+    assert "3 of 3 files" in record.getMessage()
+
+
+def test_iter_changed_files_fetches_graphql_batches_concurrently(
+    tmp_path: Path,
+) -> None:
+    """A slow batch does not hold back batches that finish before it."""
+    second_done = threading.Event()
+
+    def blob_texts(batch: list[str]) -> dict[str, str]:
+        if batch == ["sha-a"]:
+            assert second_done.wait(timeout=5)
+        else:
+            second_done.set()
+        return {sha: f"# {sha}\n" for sha in batch}
+
+    client = MagicMock()
+    client.get_blob_texts.side_effect = blob_texts
+    paths = [FilePath("src/a.py"), FilePath("src/b.py")]
+
+    with (
+        patch("argus.interfaces.sync_index.GRAPHQL_BLOB_BATCH_SIZE", 1),
+        BlobContentCache.for_storage_dir(tmp_path) as cache,
+    ):
+        fetched = list(
+            _iter_changed_files(
+                client,
+                paths,
+                ref="bbb222",
+                blob_shas={"src/a.py": "sha-a", "src/b.py": "sha-b"},
+                blob_cache=cache,
+            )
+        )
+
+    assert fetched == [
+        (FilePath("src/b.py"), "# sha-b\n"),
+        (FilePath("src/a.py"), "# sha-a\n"),
+    ]
+    client.get_file_content.assert_not_called()
+
+
+def test_incremental_update_sharded_serves_cached_blobs(tmp_path: Path) -> None:
+    """A blob fetched on one run is read from the local cache on the next."""
+    client = MagicMock()
+    client.compare_commit_blobs.return_value = {"src/a.py": "sha-a"}
+    client.get_blob_texts.return_value = {"sha-a": "x = 1\n"}
+    store = ShardedArtifactStore(storage_dir=tmp_path)
+
+    for _ in range(2):
+        _incremental_update_sharded(
+            client,
+            TreeSitterParser(),
+            store,
+            CodebaseMap(indexed_at=CommitSHA("aaa111")),
+            "owner/repo",
+            "aaa111",
+            "bbb222",
+        )
+
+    client.get_blob_texts.assert_called_once_with(["sha-a"])
+    client.get_file_content.assert_not_called()
+
+
+def test_incremental_update_sharded_reuses_caller_comparison(tmp_path: Path) -> None:
+    client = MagicMock()
+    client.get_blob_texts.return_value = {"sha-a": "x = 1\n"}
+
+    _incremental_update_sharded(
+        client,
+        TreeSitterParser(),
+        ShardedArtifactStore(storage_dir=tmp_path),
+        CodebaseMap(indexed_at=CommitSHA("aaa111")),
+        "owner/repo",
+        "aaa111",
+        "bbb222",
+        changed_blobs={"src/a.py": "sha-a"},
+    )
+
+    client.compare_commit_blobs.assert_not_called()
+
+
+# =============================================================================
+# Outline gate for pattern analysis
+# =============================================================================
+
+
+def _outline(**files: tuple[str, ...]) -> CodebaseOutline:
+    return CodebaseOutline(
+        entries=tuple(
+            FileOutlineEntry(path=FilePath(f"src/{name}.py"), symbols=symbols)
+            for name, symbols in files.items()
+        )
+    )
+
+
+def test_outline_unchanged_body_only_edit_is_unchanged() -> None:
+    stored = _outline(a=("login",), b=("logout",))
+    scoped = _outline(a=("login",))
+
+    assert _outline_unchanged(stored, scoped, [FilePath("src/a.py")]) is True
+
+
+def test_outline_unchanged_new_symbol_or_new_file_is_changed() -> None:
+    stored = _outline(a=("login",))
+
+    assert not _outline_unchanged(
+        stored, _outline(a=("login", "refresh")), [FilePath("src/a.py")]
+    )
+    assert not _outline_unchanged(stored, _outline(c=("x",)), [FilePath("src/c.py")])
+
+
+def test_outline_unchanged_signature_change_is_changed() -> None:
+    def entry(signature: str) -> CodebaseOutline:
+        return CodebaseOutline(
+            entries=(
+                FileOutlineEntry(
+                    path=FilePath("src/a.py"),
+                    symbols=("login",),
+                    signatures=(signature,),
+                ),
+            )
+        )
+
+    stored = entry("def login(user: str) -> bool")
+    path = [FilePath("src/a.py")]
+
+    assert _outline_unchanged(stored, entry("def login(user: str) -> bool"), path)
+    assert not _outline_unchanged(
+        stored, entry("def login(user: str, otp: str) -> bool"), path
+    )
+
+
+def test_refresh_outline_replaces_only_covered_entries() -> None:
+    stored = _outline(a=("login",), b=("logout",))
+
+    refreshed = _refresh_outline(stored, _outline(a=("login", "refresh"), c=("x",)))
+
+    assert refreshed == _outline(a=("login", "refresh"), b=("logout",))
+
+
+# =============================================================================
+# Import cost
+# =============================================================================
+
+
+def test_sync_index_import_does_not_load_pydantic_ai() -> None:
+    code = (
+        "import sys, argus.interfaces.sync_index; "
+        "sys.exit('pydantic_ai' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+    assert result.returncode == 0
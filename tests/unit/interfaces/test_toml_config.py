@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import logging
 import textwrap
+import tomllib
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from argus.interfaces.toml_config import ArgusConfig, load_argus_config
+from argus.interfaces.toml_config import (
+    ArgusConfig,
+    _read_tool_section,
+    load_argus_config,
+)
 from argus.shared.exceptions import ConfigurationError
 from argus.shared.types import ReviewDepth
 
@@ -70,6 +76,8 @@ class TestDefaults:
         assert cfg.analyze_patterns is False
         assert cfg.ignored_paths == []
         assert cfg.extra_extensions == []
+        assert cfg.tarball_max_mb == 500
+        assert cfg.fetch_concurrency == 8
 
     def test_load_bootstrap_uses_index_defaults(self, tmp_path: Path) -> None:
         cfg = load_argus_config("bootstrap", project_root=tmp_path)
@@ -243,6 +251,28 @@ class TestValidation:
         with pytest.raises(ConfigurationError, match="max_tokens"):
             load_argus_config("review", project_root=tmp_path)
 
+    def test_load_tarball_max_mb_negative_raises(self, tmp_path: Path) -> None:
+        _write_toml(
+            tmp_path,
+            """\
+            [tool.argus]
+            tarball_max_mb = -1
+        """,
+        )
+        with pytest.raises(ConfigurationError, match="tarball_max_mb"):
+            load_argus_config("bootstrap", project_root=tmp_path)
+
+    def test_load_fetch_concurrency_zero_raises(self, tmp_path: Path) -> None:
+        _write_toml(
+            tmp_path,
+            """\
+            [tool.argus.index]
+            fetch_concurrency = 0
+        """,
+        )
+        with pytest.raises(ConfigurationError, match="fetch_concurrency"):
+            load_argus_config("bootstrap", project_root=tmp_path)
+
     def test_load_invalid_toml_raises(self, tmp_path: Path) -> None:
         (tmp_path / "pyproject.toml").write_text("{{invalid toml")
         with pytest.raises(ConfigurationError, match="Failed to parse"):
@@ -288,3 +318,66 @@ class TestArgusConfigFrozen:
         cfg = ArgusConfig(model="m", max_tokens=100)
         with pytest.raises(AttributeError):
             cfg.model = "other"  # type: ignore[misc]
+
+
+# =============================================================================
+# Caching
+# =============================================================================
+
+
+class TestCaching:
+    def test_load_unchanged_file_is_parsed_once(self, tmp_path: Path) -> None:
+        _write_toml(
+            tmp_path,
+            """\
+            [tool.argus]
+            ignored_paths = ["vendor/"]
+        """,
+        )
+        with patch(
+            "argus.interfaces.toml_config._read_tool_section",
+            wraps=_read_tool_section,
+        ) as read:
+            first = load_argus_config("review", project_root=tmp_path)
+            second = load_argus_config("review", project_root=tmp_path)
+
+        assert read.call_count == 1
+        assert first == second
+        assert first.ignored_paths is not second.ignored_paths
+
+    def test_load_other_mode_reuses_parsed_file(self, tmp_path: Path) -> None:
+        _write_toml(
+            tmp_path,
+            """\
+            [tool.argus]
+            max_tokens = 100
+        """,
+        )
+        with patch(
+            "argus.interfaces.toml_config.tomllib.loads",
+            wraps=tomllib.loads,
+        ) as loads:
+            review = load_argus_config("review", project_root=tmp_path)
+            bootstrap = load_argus_config("bootstrap", project_root=tmp_path)
+
+        assert loads.call_count == 1
+        assert review.max_tokens == bootstrap.max_tokens == 100
+
+    def test_load_edited_file_is_reparsed(self, tmp_path: Path) -> None:
+        _write_toml(
+            tmp_path,
+            """\
+            [tool.argus]
+            max_tokens = 100
+        """,
+        )
+        assert load_argus_config("review", project_root=tmp_path).max_tokens == 100
+
+        _write_toml(
+            tmp_path,
+            """\
+            [tool.argus]
+            max_tokens = 20000
+        """,
+        )
+        assert load_argus_config("review", project_root=tmp_path).max_tokens == 20000